@@ -1,8 +1,14 @@
 import streamlit as st
-import requests
 import json
-import time
-from datetime import datetime
+
+from sora_core.api import create_task, query_task
+from sora_core.callbacks import start_callback_receiver
+from sora_core.formatting import format_timestamp
+from sora_core.polling import poll_due_tasks
+from sora_core.scheduler import get_scheduler
+from sora_core.store import get_task_store, owner_key
+from sora_ui.components import migrate_session_tasks, render_api_budget, render_pagination
+from sora_ui.styles import inject_css
 
 # Page configuration
 st.set_page_config(
@@ -13,110 +19,30 @@ st.set_page_config(
 )
 
 # Custom CSS
-st.markdown("""
-<style>
-    .main-header {
-        font-size: 3rem;
-        font-weight: bold;
-        text-align: center;
-        background: linear-gradient(120deg, #667eea 0%, #764ba2 100%);
-        -webkit-background-clip: text;
-        -webkit-text-fill-color: transparent;
-        margin-bottom: 1rem;
-    }
-    .status-waiting {
-        color: #FFA500;
-        font-weight: bold;
-    }
-    .status-success {
-        color: #28A745;
-        font-weight: bold;
-    }
-    .status-fail {
-        color: #DC3545;
-        font-weight: bold;
-    }
-    .info-box {
-        background-color: #f0f2f6;
-        padding: 1rem;
-        border-radius: 0.5rem;
-        border-left: 4px solid #667eea;
-    }
-    .stButton>button {
-        width: 100%;
-        background: linear-gradient(120deg, #667eea 0%, #764ba2 100%);
-        color: white;
-        font-weight: bold;
-        border: none;
-        padding: 0.75rem;
-        border-radius: 0.5rem;
-    }
-</style>
-""", unsafe_allow_html=True)
+inject_css("simple")
 
 # Initialize session state
-if 'tasks' not in st.session_state:
-    st.session_state.tasks = []
 if 'api_key' not in st.session_state:
     st.session_state.api_key = ""
 
-# API Configuration
-BASE_URL = "https://api.kie.ai/api/v1/jobs"
-CREATE_TASK_URL = f"{BASE_URL}/createTask"
-QUERY_TASK_URL = f"{BASE_URL}/recordInfo"
+# Receive completion callbacks in-process when SORA_CALLBACK_PUBLIC_URL is set
+start_callback_receiver()
 
-def create_task(api_key, video_url, callback_url=None):
-    """Create a watermark removal task"""
-    headers = {
-        "Authorization": f"Bearer {api_key}",
-        "Content-Type": "application/json"
-    }
-    
-    payload = {
-        "model": "sora-watermark-remover",
-        "input": {
-            "video_url": video_url
-        }
-    }
-    
-    if callback_url:
-        payload["callBackUrl"] = callback_url
-    
-    try:
-        response = requests.post(CREATE_TASK_URL, headers=headers, json=payload)
-        return response.json()
-    except Exception as e:
-        return {"code": 500, "msg": f"Error: {str(e)}"}
+# Persistent task store shared with the other app variants
+task_store = get_task_store()
 
-def query_task(api_key, task_id):
-    """Query task status"""
-    headers = {
-        "Authorization": f"Bearer {api_key}"
-    }
-    
-    params = {"taskId": task_id}
-    
-    try:
-        response = requests.get(QUERY_TASK_URL, headers=headers, params=params)
-        return response.json()
-    except Exception as e:
-        return {"code": 500, "msg": f"Error: {str(e)}"}
+# Adaptive polling schedule shared by every session in this process
+scheduler = get_scheduler(task_store.recent_cost_times)
 
-def format_timestamp(timestamp):
-    """Format timestamp to readable date"""
-    if timestamp:
-        return datetime.fromtimestamp(timestamp / 1000).strftime('%Y-%m-%d %H:%M:%S')
-    return "N/A"
+TASKS_PER_PAGE = 20
 
 def get_status_class(state):
     """Get CSS class for status"""
-    if state == "waiting":
-        return "status-waiting"
-    elif state == "success":
+    if state == "success":
         return "status-success"
     elif state == "fail":
         return "status-fail"
-    return ""
+    return "status-waiting"
 
 # Header
 st.markdown('<h1 class="main-header">🎬 Sora Watermark Remover</h1>', unsafe_allow_html=True)
@@ -133,6 +59,7 @@ with st.sidebar:
         help="Get your API key from https://kie.ai/api-key"
     )
     st.session_state.api_key = api_key
+    render_api_budget(api_key)
     
     st.markdown("---")
     
@@ -192,15 +119,8 @@ else:
                     task_id = result["data"]["taskId"]
                     st.success(f"✅ Task created successfully! Task ID: {task_id}")
                     
-                    # Add to session state
-                    st.session_state.tasks.append({
-                        "taskId": task_id,
-                        "video_url": video_url,
-                        "created_at": datetime.now().strftime('%Y-%m-%d %H:%M:%S')
-                    })
-                    
-                    time.sleep(1)
-                    st.rerun()
+                    # Add to the task store
+                    task_store.add_task(owner_key(api_key), task_id, video_url, callback_url if callback_url else None)
                 else:
                     st.error(f"❌ Error: {result.get('msg', 'Unknown error')}")
     
@@ -209,7 +129,11 @@ else:
     # Task List Section
     st.header("📋 Task List")
     
-    if not st.session_state.tasks:
+    owner = owner_key(api_key)
+    migrate_session_tasks(owner)
+    total_tasks = task_store.count(owner)
+    
+    if not total_tasks:
         st.info("No tasks yet. Create a task above to get started!")
     else:
         # Refresh all button
@@ -218,18 +142,23 @@ else:
             if st.button("🔄 Refresh All"):
                 st.rerun()
         with col2:
-            if st.button("🗑️ Clear All"):
-                st.session_state.tasks = []
+            if st.button("🗑️ Clear All", help="Move all active tasks to history"):
+                task_store.archive_all(owner)
                 st.rerun()
         
         st.markdown("---")
         
+        # Only the current page is fetched and polled; finished tasks come from the store
+        page = render_pagination(total_tasks, TASKS_PER_PAGE, key="task_page")
+        offset = page * TASKS_PER_PAGE
+        tasks = task_store.list_tasks(owner, order="newest", limit=TASKS_PER_PAGE, offset=offset)
+        task_results = poll_due_tasks(query_task, api_key, tasks, scheduler)
+        task_store.record_states(r["data"] for r in task_results.values() if r.get("code") == 200)
+        
         # Display tasks
-        for idx, task in enumerate(reversed(st.session_state.tasks)):
-            task_id = task["taskId"]
-            
-            # Query task status
-            task_result = query_task(api_key, task_id)
+        for idx, task in enumerate(tasks, start=offset):
+            task_id = task.task_id
+            task_result = task_results[task_id]
             
             if task_result.get("code") == 200:
                 task_data = task_result["data"]
@@ -240,10 +169,10 @@ else:
                     col1, col2 = st.columns([3, 1])
                     
                     with col1:
-                        st.markdown(f"**Task #{len(st.session_state.tasks) - idx}**")
+                        st.markdown(f"**Task #{total_tasks - idx}**")
                         st.markdown(f"**ID:** `{task_id}`")
-                        st.markdown(f"**URL:** {task['video_url'][:50]}...")
-                        st.markdown(f"**Created:** {task['created_at']}")
+                        st.markdown(f"**URL:** {task.video_url[:50]}...")
+                        st.markdown(f"**Created:** {task.created_text}")
                     
                     with col2:
                         status_class = get_status_class(state)
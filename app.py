@@ -1,10 +1,19 @@
 import streamlit as st
-import requests
 import json
 import time
 from datetime import datetime
-import plotly.graph_objects as go
-from typing import Optional, Dict, List
+
+from sora_core.api import create_task, query_task
+from sora_core.bulk import BULK_MAX_WORKERS, BULK_RATE_PER_SEC, parse_url_list, split_valid_urls, submit_bulk
+from sora_core.cache import TERMINAL_STATES, get_result_cache
+from sora_core.callbacks import start_callback_receiver
+from sora_core.formatting import format_timestamp, get_status_emoji
+from sora_core.polling import poll_due_tasks
+from sora_core.scheduler import get_scheduler
+from sora_core.store import get_task_store, owner_key
+from sora_ui.components import migrate_session_tasks, render_api_budget, render_lazy_media_toggle, render_pagination, render_request_telemetry, render_result_media
+from sora_ui.profiling import profile_section, render_profiler_panel, render_profiler_toggle, start_rerun_profile
+from sora_ui.styles import inject_css
 
 # Page configuration
 st.set_page_config(
@@ -14,257 +23,14 @@ st.set_page_config(
     initial_sidebar_state="expanded"
 )
 
-# Enhanced Custom CSS
-st.markdown("""
-<style>
-    /* Hide the Streamlit Menu button (three dots) */
-    #MainMenu {visibility: hidden;}
-    /* Hide the Streamlit Footer */
-    footer {visibility: hidden;}
-    /* Optional: Hide the "Deploy this app" button in the top right corner */
-    header {visibility: hidden;}
-
-    @import url('https://fonts.googleapis.com/css2?family=Inter:wght@300;400;600;700&display=swap');
-    
-    * {
-        font-family: 'Inter', sans-serif;
-    }
-    
-    .main-header {
-        font-size: 3.5rem;
-        font-weight: 800;
-        text-align: center;
-        background: linear-gradient(135deg, #667eea 0%, #764ba2 50%, #f093fb 100%);
-        -webkit-background-clip: text;
-        -webkit-text-fill-color: transparent;
-        margin-bottom: 0.5rem;
-        padding: 1rem 0;
-        animation: gradient 3s ease infinite;
-        background-size: 200% 200%;
-    }
-    
-    @keyframes gradient {
-        0% { background-position: 0% 50%; }
-        50% { background-position: 100% 50%; }
-        100% { background-position: 0% 50%; }
-    }
-    
-    .subtitle {
-        text-align: center;
-        color: #666;
-        font-size: 1.2rem;
-        margin-bottom: 2rem;
-        font-weight: 300;
-    }
-    
-    .status-badge {
-        display: inline-block;
-        padding: 0.4rem 1rem;
-        border-radius: 20px;
-        font-weight: 600;
-        font-size: 0.9rem;
-        text-transform: uppercase;
-        letter-spacing: 0.5px;
-    }
-    
-    .status-waiting {
-        background: linear-gradient(135deg, #FFA500 0%, #FF8C00 100%);
-        color: white;
-    }
-    
-    .status-success {
-        background: linear-gradient(135deg, #28A745 0%, #20C997 100%);
-        color: white;
-    }
-    
-    .status-fail {
-        background: linear-gradient(135deg, #DC3545 0%, #C82333 100%);
-        color: white;
-    }
-    
-    .card {
-        background: linear-gradient(135deg, rgba(255,255,255,0.9) 0%, rgba(255,255,255,0.7) 100%);
-        backdrop-filter: blur(10px);
-        padding: 2rem;
-        border-radius: 20px;
-        border: 1px solid rgba(102, 126, 234, 0.1);
-        box-shadow: 0 8px 32px rgba(0, 0, 0, 0.1);
-        margin-bottom: 2rem;
-        transition: transform 0.3s ease, box-shadow 0.3s ease;
-    }
-    
-    .card:hover {
-        transform: translateY(-5px);
-        box-shadow: 0 12px 48px rgba(102, 126, 234, 0.2);
-    }
-    
-    .task-card {
-        background: white;
-        padding: 1.5rem;
-        border-radius: 15px;
-        border-left: 5px solid #667eea;
-        box-shadow: 0 4px 16px rgba(0, 0, 0, 0.08);
-        margin-bottom: 1.5rem;
-        transition: all 0.3s ease;
-    }
-    
-    .task-card:hover {
-        transform: translateX(5px);
-        box-shadow: 0 6px 24px rgba(102, 126, 234, 0.15);
-    }
-    
-    .metric-card {
-        background: linear-gradient(135deg, #667eea 0%, #764ba2 100%);
-        color: white;
-        padding: 1.5rem;
-        border-radius: 15px;
-        text-align: center;
-        box-shadow: 0 4px 16px rgba(102, 126, 234, 0.3);
-    }
-    
-    .metric-value {
-        font-size: 2.5rem;
-        font-weight: 700;
-        margin: 0.5rem 0;
-    }
-    
-    .metric-label {
-        font-size: 0.9rem;
-        opacity: 0.9;
-        text-transform: uppercase;
-        letter-spacing: 1px;
-    }
-    
-    .info-box {
-        background: linear-gradient(135deg, rgba(102, 126, 234, 0.1) 0%, rgba(118, 75, 162, 0.1) 100%);
-        padding: 1.5rem;
-        border-radius: 15px;
-        border-left: 4px solid #667eea;
-        margin: 1rem 0;
-    }
-    
-    .warning-box {
-        background: linear-gradient(135deg, rgba(255, 165, 0, 0.1) 0%, rgba(255, 140, 0, 0.1) 100%);
-        padding: 1.5rem;
-        border-radius: 15px;
-        border-left: 4px solid #FFA500;
-        margin: 1rem 0;
-    }
-    
-    .success-box {
-        background: linear-gradient(135deg, rgba(40, 167, 69, 0.1) 0%, rgba(32, 201, 151, 0.1) 100%);
-        padding: 1.5rem;
-        border-radius: 15px;
-        border-left: 4px solid #28A745;
-        margin: 1rem 0;
-    }
-    
-    .stButton>button {
-        width: 100%;
-        background: linear-gradient(135deg, #667eea 0%, #764ba2 100%);
-        color: white;
-        font-weight: 600;
-        border: none;
-        padding: 1rem;
-        border-radius: 12px;
-        font-size: 1.1rem;
-        transition: all 0.3s ease;
-        box-shadow: 0 4px 16px rgba(102, 126, 234, 0.3);
-    }
-    
-    .stButton>button:hover {
-        transform: translateY(-2px);
-        box-shadow: 0 6px 24px rgba(102, 126, 234, 0.4);
-    }
-    
-    .feature-icon {
-        font-size: 3rem;
-        margin-bottom: 1rem;
-    }
-    
-    .progress-ring {
-        width: 120px;
-        height: 120px;
-        margin: 0 auto;
-    }
-    
-    .stats-grid {
-        display: grid;
-        grid-template-columns: repeat(auto-fit, minmax(200px, 1fr));
-        gap: 1.5rem;
-        margin: 2rem 0;
-    }
-    
-    .timeline-item {
-        position: relative;
-        padding-left: 2rem;
-        margin-bottom: 1.5rem;
-    }
-    
-    .timeline-item::before {
-        content: '';
-        position: absolute;
-        left: 0;
-        top: 0;
-        width: 12px;
-        height: 12px;
-        border-radius: 50%;
-        background: #667eea;
-        border: 3px solid white;
-        box-shadow: 0 0 0 2px #667eea;
-    }
-    
-    .timeline-item::after {
-        content: '';
-        position: absolute;
-        left: 5px;
-        top: 12px;
-        width: 2px;
-        height: calc(100% + 1rem);
-        background: linear-gradient(180deg, #667eea 0%, transparent 100%);
-    }
-    
-    .timeline-item:last-child::after {
-        display: none;
-    }
-    
-    /* Animations */
-    @keyframes fadeIn {
-        from { opacity: 0; transform: translateY(20px); }
-        to { opacity: 1; transform: translateY(0); }
-    }
-    
-    .animated {
-        animation: fadeIn 0.6s ease-out;
-    }
-    
-    /* Scrollbar */
-    ::-webkit-scrollbar {
-        width: 10px;
-    }
-    
-    ::-webkit-scrollbar-track {
-        background: #f1f1f1;
-        border-radius: 10px;
-    }
-    
-    ::-webkit-scrollbar-thumb {
-        background: linear-gradient(135deg, #667eea 0%, #764ba2 100%);
-        border-radius: 10px;
-    }
-    
-    ::-webkit-scrollbar-thumb:hover {
-        background: linear-gradient(135deg, #764ba2 0%, #667eea 100%);
-    }
-</style>
-""", unsafe_allow_html=True)
+# Opt-in per-section timing of this rerun (sidebar "Profile reruns")
+profiler = start_rerun_profile()
+profiler.mark("Setup")
 
+# Hide the Streamlit menu, footer and deploy header, then apply the shared theme
+inject_css("hide_chrome", "theme")
 
 # Initialize session state
-if 'tasks' not in st.session_state:
-    st.session_state.tasks = []
-if 'task_history' not in st.session_state:
-    st.session_state.task_history = []
 if 'auto_refresh' not in st.session_state:
     st.session_state.auto_refresh = False
 if 'theme' not in st.session_state:
@@ -276,82 +42,21 @@ try:
 except:
     API_KEY = ""
 
-BASE_URL = "https://api.kie.ai/api/v1/jobs"
-CREATE_TASK_URL = f"{BASE_URL}/createTask"
-QUERY_TASK_URL = f"{BASE_URL}/recordInfo"
-
-def create_task(api_key: str, video_url: str, callback_url: Optional[str] = None) -> Dict:
-    """Create a watermark removal task"""
-    headers = {
-        "Authorization": f"Bearer {api_key}",
-        "Content-Type": "application/json"
-    }
-    
-    payload = {
-        "model": "sora-watermark-remover",
-        "input": {
-            "video_url": video_url
-        }
-    }
-    
-    if callback_url:
-        payload["callBackUrl"] = callback_url
-    
-    try:
-        response = requests.post(CREATE_TASK_URL, headers=headers, json=payload, timeout=30)
-        return response.json()
-    except Exception as e:
-        return {"code": 500, "msg": f"Error: {str(e)}"}
-
-def query_task(api_key: str, task_id: str) -> Dict:
-    """Query task status"""
-    headers = {
-        "Authorization": f"Bearer {api_key}"
-    }
-    
-    params = {"taskId": task_id}
-    
-    try:
-        response = requests.get(QUERY_TASK_URL, headers=headers, params=params, timeout=30)
-        return response.json()
-    except Exception as e:
-        return {"code": 500, "msg": f"Error: {str(e)}"}
+# Receive completion callbacks in-process when SORA_CALLBACK_PUBLIC_URL is set
+start_callback_receiver()
 
-def format_timestamp(timestamp: Optional[int]) -> str:
-    """Format timestamp to readable date"""
-    if timestamp:
-        return datetime.fromtimestamp(timestamp / 1000).strftime('%Y-%m-%d %H:%M:%S')
-    return "N/A"
+# Tasks persist in the shared SQLite store, scoped to the API key's owner
+task_store = get_task_store()
 
-def get_status_emoji(state: str) -> str:
-    """Get emoji for status"""
-    status_map = {
-        "waiting": "🟡",
-        "success": "🟢",
-        "fail": "🔴"
-    }
-    return status_map.get(state, "⚪")
-
-def calculate_stats() -> Dict:
-    """Calculate task statistics"""
-    total = len(st.session_state.task_history)
-    waiting = sum(1 for t in st.session_state.task_history if t.get('state') == 'waiting')
-    success = sum(1 for t in st.session_state.task_history if t.get('state') == 'success')
-    failed = sum(1 for t in st.session_state.task_history if t.get('state') == 'fail')
-    
-    return {
-        'total': total,
-        'waiting': waiting,
-        'success': success,
-        'failed': failed,
-        'success_rate': (success / total * 100) if total > 0 else 0
-    }
+# Per-task adaptive polling schedule, seeded with historical processing times
+scheduler = get_scheduler(task_store.recent_cost_times)
 
 # Header Section
 st.markdown('<h1 class="main-header">🎬 Sora Watermark Remover Pro</h1>', unsafe_allow_html=True)
 st.markdown('<p class="subtitle">AI-Powered Watermark Removal for Professional Video Content</p>', unsafe_allow_html=True)
 
 # Sidebar - Enhanced Configuration
+profiler.mark("Sidebar")
 with st.sidebar:
     st.image("https://img.icons8.com/fluency/96/000000/video-editing.png", width=80)
     st.title("⚙️ Control Panel")
@@ -376,6 +81,10 @@ with st.sidebar:
         if api_key:
             st.info("💡 Tip: Add API key to .streamlit/secrets.toml for permanent storage")
     
+    owner = owner_key(api_key) if api_key else ""
+    migrate_session_tasks(owner)
+    render_api_budget(api_key)
+    
     st.markdown("---")
     
     # Settings Section
@@ -396,19 +105,24 @@ with st.sidebar:
         disabled=not auto_refresh
     )
     
+    render_lazy_media_toggle()
+    render_profiler_toggle()
+    
     show_advanced = st.checkbox("Show advanced options", value=False)
+    max_tasks = 20
     
     if show_advanced:
         st.markdown("---")
         st.subheader("🔧 Advanced Options")
-        max_tasks = st.number_input("Max tasks to display", min_value=5, max_value=100, value=20)
+        max_tasks = st.number_input("Tasks per page", min_value=5, max_value=100, value=20)
         show_json = st.checkbox("Show raw JSON responses", value=False)
     
     st.markdown("---")
     
     # Statistics Section
     st.subheader("📊 Statistics")
-    stats = calculate_stats()
+    with profile_section("Stats"):
+        stats = task_store.stats(owner)
     
     col1, col2 = st.columns(2)
     with col1:
@@ -424,6 +138,12 @@ with st.sidebar:
     
     st.markdown("---")
     
+    # Request latency per endpoint, shared by every session on this server
+    st.subheader("⚡ Performance")
+    render_request_telemetry()
+    
+    st.markdown("---")
+    
     # Help Section
     st.subheader("ℹ️ Quick Guide")
     with st.expander("📖 How to Use"):
@@ -468,14 +188,15 @@ with st.sidebar:
         if st.button("🔄 Refresh", use_container_width=True):
             st.rerun()
     with col2:
-        if st.button("🗑️ Clear", use_container_width=True):
-            st.session_state.tasks = []
-            st.session_state.task_history = []
+        if st.button("🗑️ Clear", use_container_width=True, help="Move all active tasks to history"):
+            if owner:
+                task_store.archive_all(owner)
             st.rerun()
     
     if st.button("📥 Export History", use_container_width=True):
-        if st.session_state.task_history:
-            export_data = json.dumps(st.session_state.task_history, indent=2)
+        task_history = task_store.list_tasks(owner, order="oldest", include_archived=True) if owner else []
+        if task_history:
+            export_data = json.dumps([task.to_dict() for task in task_history], indent=2)
             st.download_button(
                 label="Download JSON",
                 data=export_data,
@@ -496,201 +217,13 @@ with st.sidebar:
     
     st.caption("v2.0.0 | Made with ❤️")
 
-# Main Content Area
-if not api_key:
-    # Welcome Screen
-    st.markdown('<div class="card animated">', unsafe_allow_html=True)
-    
-    col1, col2, col3 = st.columns(3)
-    
-    with col1:
-        st.markdown("""
-        <div style="text-align: center;">
-            <div class="feature-icon">🎯</div>
-            <h3>Fast Processing</h3>
-            <p>Remove watermarks in minutes with AI-powered technology</p>
-        </div>
-        """, unsafe_allow_html=True)
-    
-    with col2:
-        st.markdown("""
-        <div style="text-align: center;">
-            <div class="feature-icon">🔒</div>
-            <h3>Secure & Private</h3>
-            <p>Your videos are processed securely with encrypted connections</p>
-        </div>
-        """, unsafe_allow_html=True)
-    
-    with col3:
-        st.markdown("""
-        <div style="text-align: center;">
-            <div class="feature-icon">⚡</div>
-            <h3>High Quality</h3>
-            <p>Maintain original video quality with advanced algorithms</p>
-        </div>
-        """, unsafe_allow_html=True)
-    
-    st.markdown('</div>', unsafe_allow_html=True)
-    
-    st.markdown('<div class="warning-box animated">', unsafe_allow_html=True)
-    st.warning("⚠️ **Getting Started:** Please enter your API Key in the sidebar to begin. Don't have one? [Get your API key here](https://kie.ai/api-key)")
-    st.markdown('</div>', unsafe_allow_html=True)
-    
-    # Setup Instructions
-    st.markdown("### 🚀 Quick Setup Guide")
-    
-    tab1, tab2, tab3 = st.tabs(["💻 Method 1: Secrets File", "🔑 Method 2: Manual Entry", "📖 API Key Guide"])
-    
-    with tab1:
-        st.markdown("""
-        **Using Streamlit Secrets (Recommended)**
-        
-        1. Create a file: `.streamlit/secrets.toml`
-        2. Add your API key:
-        ```toml
-        api_key = "your_api_key_here"
-        ```
-        3. Restart the application
-        4. ✅ Your API key will be automatically loaded!
-        """)
-        
-        st.code("""
-# .streamlit/secrets.toml
-api_key = "sk_your_actual_api_key_here"
-        """, language="toml")
-    
-    with tab2:
-        st.markdown("""
-        **Manual Entry**
-        
-        1. Get your API key from [kie.ai/api-key](https://kie.ai/api-key)
-        2. Enter it in the sidebar under "🔑 API Configuration"
-        3. Start using the app immediately!
-        
-        ⚠️ Note: You'll need to re-enter the key each session.
-        """)
-    
-    with tab3:
-        st.markdown("""
-        **How to Get Your API Key**
-        
-        1. Visit [https://kie.ai/api-key](https://kie.ai/api-key)
-        2. Sign in or create an account
-        3. Navigate to API Settings
-        4. Generate a new API key
-        5. Copy and save it securely
-        
-        🔒 **Security Tips:**
-        - Never share your API key publicly
-        - Use secrets.toml for production
-        - Rotate keys regularly
-        - Monitor usage in your dashboard
-        """)
-
-else:
-    # Main Application Interface
-    
-    # Create Task Section
-    st.markdown("### 🚀 Create New Watermark Removal Task")
-    
-    with st.container():
-        st.markdown('<div class="card animated">', unsafe_allow_html=True)
-        
-        col1, col2 = st.columns([2, 1])
-        
-        with col1:
-            video_url = st.text_input(
-                "🎥 Sora Video URL",
-                placeholder="https://sora.chatgpt.com/p/s_68e83bd7eee88191be79d2ba7158516f",
-                help="Enter the complete Sora video URL from sora.chatgpt.com",
-                key="video_url_input"
-            )
-            
-            # URL Validation
-            if video_url:
-                if video_url.startswith("https://sora.chatgpt.com"):
-                    st.success("✅ Valid Sora URL")
-                else:
-                    st.error("❌ Invalid URL - Must start with https://sora.chatgpt.com")
-        
-        with col2:
-            callback_url = st.text_input(
-                "🔔 Callback URL (Optional)",
-                placeholder="https://your-domain.com/callback",
-                help="Receive webhook notifications when task completes"
-            )
-        
-        col1, col2, col3 = st.columns([2, 1, 1])
-        
-        with col1:
-            create_button = st.button("🎯 Remove Watermark Now", type="primary", use_container_width=True)
-        
-        with col2:
-            if st.button("📋 Paste Example", use_container_width=True):
-                st.session_state.example_url = "https://sora.chatgpt.com/p/s_68e83bd7eee88191be79d2ba7158516f"
-                st.rerun()
-        
-        with col3:
-            if st.button("🔄 Clear Form", use_container_width=True):
-                st.rerun()
-        
-        if create_button:
-            if not video_url:
-                st.error("❌ Please enter a video URL")
-            elif not video_url.startswith("https://sora.chatgpt.com"):
-                st.error("❌ Invalid URL format. Must start with https://sora.chatgpt.com")
-            elif len(video_url) > 500:
-                st.error("❌ URL is too long (max 500 characters)")
-            else:
-                with st.spinner("🔄 Creating task... Please wait"):
-                    progress_bar = st.progress(0)
-                    for i in range(100):
-                        time.sleep(0.01)
-                        progress_bar.progress(i + 1)
-                    
-                    result = create_task(api_key, video_url, callback_url if callback_url else None)
-                    
-                    if result.get("code") == 200:
-                        task_id = result["data"]["taskId"]
-                        
-                        task_data = {
-                            "taskId": task_id,
-                            "video_url": video_url,
-                            "created_at": datetime.now().strftime('%Y-%m-%d %H:%M:%S'),
-                            "state": "waiting",
-                            "callback_url": callback_url if callback_url else None
-                        }
-                        
-                        st.session_state.tasks.append(task_data)
-                        st.session_state.task_history.append(task_data)
-                        
-                        st.markdown('<div class="success-box">', unsafe_allow_html=True)
-                        st.success(f"✅ Task created successfully!")
-                        st.info(f"**Task ID:** `{task_id}`")
-                        st.markdown('</div>', unsafe_allow_html=True)
-                        
-                        time.sleep(1)
-                        st.rerun()
-                    else:
-                        error_msg = result.get('msg', 'Unknown error')
-                        st.error(f"❌ Failed to create task: {error_msg}")
-                        
-                        if result.get("code") == 401:
-                            st.warning("🔑 Authentication failed. Please check your API key.")
-                        elif result.get("code") == 402:
-                            st.warning("💳 Insufficient account balance. Please top up your account.")
-                        elif result.get("code") == 429:
-                            st.warning("⏱️ Rate limit exceeded. Please wait a moment and try again.")
-        
-        st.markdown('</div>', unsafe_allow_html=True)
-    
-    st.markdown("---")
-    
-    # Task Management Section
+def render_task_dashboard(api_key: str, owner: str, page_size: int):
+    """Render the task statistics and task list (run as a fragment so auto-refresh only reruns this region)"""
     st.markdown("### 📋 Task Management Dashboard")
     
     # Statistics Cards
-    stats = calculate_stats()
+    with profile_section("Stats"):
+        stats = task_store.stats(owner)
     col1, col2, col3, col4, col5 = st.columns(5)
     
     with col1:
@@ -768,58 +301,56 @@ else:
     st.markdown("---")
     
     # Task List Display
-    if not st.session_state.tasks:
+    total_active = task_store.count(owner)
+    
+    if total_active == 0:
         st.markdown('<div class="info-box animated">', unsafe_allow_html=True)
         st.info("📭 No active tasks. Create your first task above to get started!")
         st.markdown('</div>', unsafe_allow_html=True)
     else:
-        # Filter tasks
-        filtered_tasks = st.session_state.tasks.copy()
+        # Filter and sort tasks in the store
+        state_filter = {"Waiting": "waiting", "Success": "success", "Failed": "fail"}.get(filter_status)
+        order = {"Newest First": "newest", "Oldest First": "oldest", "Status": "status"}[sort_by]
+        total_filtered = task_store.count(owner, state=state_filter)
         
-        if filter_status != "All":
-            filtered_tasks = [t for t in filtered_tasks if t.get('state', '').lower() == filter_status.lower()]
+        # Only the current page is fetched, polled and rendered
+        page = render_pagination(total_filtered, page_size, key="task_page")
+        offset = page * page_size
+        filtered_tasks = task_store.list_tasks(owner, state=state_filter, order=order, limit=page_size, offset=offset)
         
-        # Sort tasks
-        if sort_by == "Newest First":
-            filtered_tasks = list(reversed(filtered_tasks))
-        elif sort_by == "Status":
-            status_order = {"success": 0, "waiting": 1, "fail": 2}
-            filtered_tasks.sort(key=lambda x: status_order.get(x.get('state', ''), 3))
+        st.markdown(f"**Showing {offset + 1 if filtered_tasks else 0}-{offset + len(filtered_tasks)} of {total_filtered} matching tasks ({total_active} total)**")
         
-        st.markdown(f"**Showing {len(filtered_tasks)} of {len(st.session_state.tasks)} tasks**")
+        # Concurrently query the visible tasks that are due on their polling schedule
+        with st.spinner(f"Loading {len(filtered_tasks)} tasks..."), profile_section("Poll"):
+            task_results = poll_due_tasks(query_task, api_key, filtered_tasks, scheduler)
+            task_store.record_states(r["data"] for r in task_results.values() if r.get("code") == 200)
         
         # Display tasks based on view mode
-        for idx, task in enumerate(filtered_tasks):
-            task_id = task["taskId"]
-            
-            # Query latest status
-            with st.spinner(f"Loading task {idx + 1}..."):
-                task_result = query_task(api_key, task_id)
+        for idx, task in enumerate(filtered_tasks, start=offset):
+            task_id = task.task_id
+            task_result = task_results[task_id]
             
             if task_result.get("code") == 200:
                 task_data = task_result["data"]
                 state = task_data.get("state", "unknown")
                 
-                # Update task state in session
-                task['state'] = state
+                result_urls = get_result_cache().result_urls(task_id)
                 
                 # Display based on view mode
                 if view_mode == "Timeline":
                     # Timeline View
                     st.markdown(f"""
                     <div class="timeline-item animated">
-                        <strong>Task #{len(filtered_tasks) - idx}</strong> • {get_status_emoji(state)} {state.upper()}<br>
-                        <small>{task['created_at']}</small><br>
+                        <strong>Task #{total_filtered - idx}</strong> • {get_status_emoji(state)} {state.upper()}<br>
+                        <small>{task.created_text}</small><br>
                         <code>{task_id[:16]}...</code>
                     </div>
                     """, unsafe_allow_html=True)
                     
-                    if state == "success" and task_data.get("resultJson"):
-                        result_data = json.loads(task_data["resultJson"])
-                        if "resultUrls" in result_data:
-                            for url in result_data["resultUrls"]:
-                                st.video(url)
-                                st.markdown(f"[📥 Download Video]({url})")
+                    if state == "success" and result_urls:
+                        for url_idx, url in enumerate(result_urls):
+                            render_result_media(url, key=f"media_{task_id}_{url_idx}")
+                            st.markdown(f"[📥 Download Video]({url})")
                     
                     st.markdown("<br>", unsafe_allow_html=True)
                 
@@ -828,14 +359,14 @@ else:
                     col1, col2, col3, col4 = st.columns([3, 2, 2, 1])
                     
                     with col1:
-                        st.markdown(f"**Task #{len(filtered_tasks) - idx}**")
+                        st.markdown(f"**Task #{total_filtered - idx}**")
                         st.caption(f"`{task_id[:20]}...`")
                     
                     with col2:
                         st.markdown(f'<span class="status-badge status-{state}">{get_status_emoji(state)} {state}</span>', unsafe_allow_html=True)
                     
                     with col3:
-                        st.caption(task['created_at'])
+                        st.caption(task.created_text)
                     
                     with col4:
                         if st.button("📊", key=f"detail_{idx}"):
@@ -846,8 +377,8 @@ else:
                             col1, col2 = st.columns(2)
                             
                             with col1:
-                                st.markdown(f"**Video URL:** {task['video_url'][:40]}...")
-                                st.markdown(f"**Created:** {task['created_at']}")
+                                st.markdown(f"**Video URL:** {task.video_url[:40]}...")
+                                st.markdown(f"**Created:** {task.created_text}")
                                 st.markdown(f"**Model:** {task_data.get('model', 'N/A')}")
                             
                             with col2:
@@ -858,13 +389,11 @@ else:
                                 else:
                                     st.markdown("**Processing Time:** N/A")
                             
-                            if state == "success" and task_data.get("resultJson"):
-                                result_data = json.loads(task_data["resultJson"])
-                                if "resultUrls" in result_data:
-                                    st.success("✅ Video processed successfully!")
-                                    for url in result_data["resultUrls"]:
-                                        st.video(url)
-                                        st.markdown(f"**📥 [Download Processed Video]({url})**")
+                            if state == "success" and result_urls:
+                                st.success("✅ Video processed successfully!")
+                                for url_idx, url in enumerate(result_urls):
+                                    render_result_media(url, key=f"media_{task_id}_{url_idx}")
+                                    st.markdown(f"**📥 [Download Processed Video]({url})**")
                             
                             elif state == "fail":
                                 st.error(f"❌ **Error:** {task_data.get('failMsg', 'Unknown error')}")
@@ -879,16 +408,16 @@ else:
                     col1, col2 = st.columns([3, 1])
                     
                     with col1:
-                        st.markdown(f"### 🎬 Task #{len(filtered_tasks) - idx}")
+                        st.markdown(f"### 🎬 Task #{total_filtered - idx}")
                         st.markdown(f"**Task ID:** `{task_id}`")
-                        st.markdown(f"**Video URL:** [{task['video_url'][:50]}...]({task['video_url']})")
-                        st.markdown(f"**Created:** {task['created_at']}")
+                        st.markdown(f"**Video URL:** [{task.video_url[:50]}...]({task.video_url})")
+                        st.markdown(f"**Created:** {task.created_text}")
                         st.markdown(f"**Model:** {task_data.get('model', 'sora-watermark-remover')}")
                     
                     with col2:
                         st.markdown(f'<div style="text-align: center;"><span class="status-badge status-{state}">{get_status_emoji(state)} {state.upper()}</span></div>', unsafe_allow_html=True)
                         
-                        if state == "waiting":
+                        if state not in TERMINAL_STATES:
                             st.markdown("""
                             <div style="text-align: center; margin-top: 1rem;">
                                 <div class="spinner"></div>
@@ -917,18 +446,16 @@ else:
                         st.markdown("---")
                         st.markdown("### 🎉 Processing Complete!")
                         
-                        result_data = json.loads(task_data["resultJson"])
-                        
-                        if "resultUrls" in result_data:
+                        if result_urls:
                             st.success(f"✅ Successfully removed watermark from your video!")
                             
-                            for url_idx, url in enumerate(result_data["resultUrls"]):
+                            for url_idx, url in enumerate(result_urls):
                                 st.markdown(f"**Result Video #{url_idx + 1}:**")
                                 
                                 col1, col2 = st.columns([3, 1])
                                 
                                 with col1:
-                                    st.video(url)
+                                    render_result_media(url, key=f"media_{task_id}_{url_idx}")
                                 
                                 with col2:
                                     st.markdown(f"**[📥 Download]({url})**")
@@ -951,17 +478,18 @@ else:
                         - Try again in a few minutes
                         """)
                     
-                    elif state == "waiting":
+                    elif state not in TERMINAL_STATES:
                         st.markdown("---")
                         st.info("⏳ Your video is being processed. This may take a few minutes...")
                         
-                        progress_text = "Processing your video..."
-                        progress_bar = st.progress(0, text=progress_text)
-                        
-                        # Simulated progress (for UX)
-                        for percent in range(0, 100, 10):
-                            time.sleep(0.1)
-                            progress_bar.progress(percent + 10, text=progress_text)
+                        # Estimated progress from historical processing times
+                        fraction, remaining = scheduler.model.estimate(time.time() - task.created_at)
+                        if fraction is None:
+                            st.progress(0, text="Processing your video... (estimating time)")
+                        elif remaining is None:
+                            st.progress(fraction, text="Processing your video... taking longer than usual")
+                        else:
+                            st.progress(fraction, text=f"Processing your video... about {remaining:.0f}s remaining")
                     
                     # Action Buttons
                     st.markdown("---")
@@ -981,7 +509,7 @@ else:
                     
                     with col4:
                         if st.button(f"🗑️ Remove", key=f"remove_{idx}", use_container_width=True):
-                            st.session_state.tasks = [t for t in st.session_state.tasks if t['taskId'] != task_id]
+                            task_store.archive(owner, task_id)
                             st.rerun()
                     
                     # Show JSON if toggled
@@ -993,27 +521,250 @@ else:
                     if st.session_state.get(f"show_share_{idx}", False):
                         with st.expander("🔗 Share Options", expanded=True):
                             st.code(f"Task ID: {task_id}")
-                            if state == "success" and task_data.get("resultJson"):
-                                result_data = json.loads(task_data["resultJson"])
-                                if "resultUrls" in result_data:
-                                    st.code(result_data["resultUrls"][0])
+                            if state == "success" and result_urls:
+                                st.code(result_urls[0])
                     
                     st.markdown('</div>', unsafe_allow_html=True)
             
             else:
                 st.error(f"❌ Failed to query task {task_id}: {task_result.get('msg', 'Unknown error')}")
         
-        # Pagination (if too many tasks)
-        if len(filtered_tasks) > 10:
+        if total_filtered > page_size:
             st.markdown("---")
-            st.info(f"📄 Showing all {len(filtered_tasks)} tasks. Consider using filters to narrow results.")
+            st.caption(f"📄 Page {page + 1} of {-(-total_filtered // page_size)} • use the controls above to browse or filters to narrow results.")
+
+
+# Main Content Area
+profiler.mark("Main")
+if not api_key:
+    # Welcome Screen
+    st.markdown('<div class="card animated">', unsafe_allow_html=True)
+    
+    col1, col2, col3 = st.columns(3)
+    
+    with col1:
+        st.markdown("""
+        <div style="text-align: center;">
+            <div class="feature-icon">🎯</div>
+            <h3>Fast Processing</h3>
+            <p>Remove watermarks in minutes with AI-powered technology</p>
+        </div>
+        """, unsafe_allow_html=True)
+    
+    with col2:
+        st.markdown("""
+        <div style="text-align: center;">
+            <div class="feature-icon">🔒</div>
+            <h3>Secure & Private</h3>
+            <p>Your videos are processed securely with encrypted connections</p>
+        </div>
+        """, unsafe_allow_html=True)
+    
+    with col3:
+        st.markdown("""
+        <div style="text-align: center;">
+            <div class="feature-icon">⚡</div>
+            <h3>High Quality</h3>
+            <p>Maintain original video quality with advanced algorithms</p>
+        </div>
+        """, unsafe_allow_html=True)
+    
+    st.markdown('</div>', unsafe_allow_html=True)
+    
+    st.markdown('<div class="warning-box animated">', unsafe_allow_html=True)
+    st.warning("⚠️ **Getting Started:** Please enter your API Key in the sidebar to begin. Don't have one? [Get your API key here](https://kie.ai/api-key)")
+    st.markdown('</div>', unsafe_allow_html=True)
+    
+    # Setup Instructions
+    st.markdown("### 🚀 Quick Setup Guide")
+    
+    tab1, tab2, tab3 = st.tabs(["💻 Method 1: Secrets File", "🔑 Method 2: Manual Entry", "📖 API Key Guide"])
+    
+    with tab1:
+        st.markdown("""
+        **Using Streamlit Secrets (Recommended)**
+        
+        1. Create a file: `.streamlit/secrets.toml`
+        2. Add your API key:
+        ```toml
+        api_key = "your_api_key_here"
+        ```
+        3. Restart the application
+        4. ✅ Your API key will be automatically loaded!
+        """)
+        
+        st.code("""
+# .streamlit/secrets.toml
+api_key = "sk_your_actual_api_key_here"
+        """, language="toml")
+    
+    with tab2:
+        st.markdown("""
+        **Manual Entry**
+        
+        1. Get your API key from [kie.ai/api-key](https://kie.ai/api-key)
+        2. Enter it in the sidebar under "🔑 API Configuration"
+        3. Start using the app immediately!
+        
+        ⚠️ Note: You'll need to re-enter the key each session.
+        """)
+    
+    with tab3:
+        st.markdown("""
+        **How to Get Your API Key**
+        
+        1. Visit [https://kie.ai/api-key](https://kie.ai/api-key)
+        2. Sign in or create an account
+        3. Navigate to API Settings
+        4. Generate a new API key
+        5. Copy and save it securely
+        
+        🔒 **Security Tips:**
+        - Never share your API key publicly
+        - Use secrets.toml for production
+        - Rotate keys regularly
+        - Monitor usage in your dashboard
+        """)
 
-# Auto-refresh functionality
-if st.session_state.auto_refresh and api_key:
-    time.sleep(10)
-    st.rerun()
+else:
+    # Main Application Interface
+    
+    # Create Task Section
+    st.markdown("### 🚀 Create New Watermark Removal Task")
+    
+    with st.container():
+        st.markdown('<div class="card animated">', unsafe_allow_html=True)
+        
+        col1, col2 = st.columns([2, 1])
+        
+        with col1:
+            video_url = st.text_input(
+                "🎥 Sora Video URL",
+                placeholder="https://sora.chatgpt.com/p/s_68e83bd7eee88191be79d2ba7158516f",
+                help="Enter the complete Sora video URL from sora.chatgpt.com",
+                key="video_url_input"
+            )
+            
+            # URL Validation
+            if video_url:
+                if video_url.startswith("https://sora.chatgpt.com"):
+                    st.success("✅ Valid Sora URL")
+                else:
+                    st.error("❌ Invalid URL - Must start with https://sora.chatgpt.com")
+        
+        with col2:
+            callback_url = st.text_input(
+                "🔔 Callback URL (Optional)",
+                placeholder="https://your-domain.com/callback",
+                help="Receive webhook notifications when task completes"
+            )
+        
+        col1, col2, col3 = st.columns([2, 1, 1])
+        
+        with col1:
+            create_button = st.button("🎯 Remove Watermark Now", type="primary", use_container_width=True)
+        
+        with col2:
+            if st.button("📋 Paste Example", use_container_width=True):
+                st.session_state.example_url = "https://sora.chatgpt.com/p/s_68e83bd7eee88191be79d2ba7158516f"
+                st.rerun()
+        
+        with col3:
+            if st.button("🔄 Clear Form", use_container_width=True):
+                st.rerun()
+        
+        if create_button:
+            if not video_url:
+                st.error("❌ Please enter a video URL")
+            elif not video_url.startswith("https://sora.chatgpt.com"):
+                st.error("❌ Invalid URL format. Must start with https://sora.chatgpt.com")
+            elif len(video_url) > 500:
+                st.error("❌ URL is too long (max 500 characters)")
+            else:
+                with st.spinner("🔄 Creating task... Please wait"):
+                    result = create_task(api_key, video_url, callback_url if callback_url else None)
+                    
+                    if result.get("code") == 200:
+                        task_id = result["data"]["taskId"]
+                        
+                        task_store.add_task(owner, task_id, video_url, callback_url if callback_url else None)
+                        
+                        st.markdown('<div class="success-box">', unsafe_allow_html=True)
+                        st.success(f"✅ Task created successfully!")
+                        st.info(f"**Task ID:** `{task_id}`")
+                        st.markdown('</div>', unsafe_allow_html=True)
+                    else:
+                        error_msg = result.get('msg', 'Unknown error')
+                        st.error(f"❌ Failed to create task: {error_msg}")
+                        
+                        if result.get("code") == 401:
+                            st.warning("🔑 Authentication failed. Please check your API key.")
+                        elif result.get("code") == 402:
+                            st.warning("💳 Insufficient account balance. Please top up your account.")
+                        elif result.get("code") == 429:
+                            st.warning(f"⏱️ Rate limit exceeded. Please try again in {result.get('retry_after', 10):.0f}s.")
+        
+        st.markdown('</div>', unsafe_allow_html=True)
+    
+    # Bulk Submission Section
+    with st.expander("📦 Bulk Submission - upload a list of Sora URLs"):
+        uploaded_file = st.file_uploader(
+            "Upload a CSV or text file",
+            type=["csv", "txt"],
+            help="Any cell or line starting with http is treated as a video URL",
+            key="bulk_file"
+        )
+        pasted_urls = st.text_area("...or paste URLs (one per line)", height=120, key="bulk_text")
+        
+        bulk_urls = []
+        if uploaded_file is not None:
+            bulk_urls.extend(parse_url_list(uploaded_file.getvalue()))
+        if pasted_urls:
+            bulk_urls.extend(parse_url_list(pasted_urls))
+        valid_urls, invalid_urls = split_valid_urls(list(dict.fromkeys(bulk_urls)))
+        
+        if bulk_urls:
+            st.caption(f"✅ {len(valid_urls)} valid URLs • ❌ {len(invalid_urls)} invalid URLs")
+        if invalid_urls:
+            st.code("\n".join(f"{url[:80]}  ->  {error}" for url, error in invalid_urls[:20]), language="text")
+        
+        col1, col2 = st.columns(2)
+        with col1:
+            bulk_workers = st.slider("Parallel submissions", min_value=1, max_value=16, value=BULK_MAX_WORKERS)
+        with col2:
+            bulk_rate = st.slider("Max submissions per second", min_value=0.5, max_value=10.0, value=BULK_RATE_PER_SEC, step=0.5)
+        
+        if st.button(f"🚀 Submit {len(valid_urls)} Videos", disabled=not valid_urls, use_container_width=True):
+            progress_bar = st.progress(0, text="Submitting tasks...")
+            created = 0
+            failures = []
+            
+            for done, (url, result) in enumerate(
+                submit_bulk(create_task, api_key, valid_urls, callback_url if callback_url else None,
+                            max_workers=bulk_workers, rate_per_sec=bulk_rate),
+                start=1
+            ):
+                if result.get("code") == 200:
+                    task_store.add_task(owner, result["data"]["taskId"], url, callback_url if callback_url else None)
+                    created += 1
+                else:
+                    failures.append((url, result.get("msg", "Unknown error")))
+                progress_bar.progress(done / len(valid_urls), text=f"Submitted {done} of {len(valid_urls)}")
+            
+            st.success(f"✅ Created {created} of {len(valid_urls)} tasks")
+            if failures:
+                st.error(f"❌ {len(failures)} submissions failed")
+                st.code("\n".join(f"{url[:80]}  ->  {msg}" for url, msg in failures[:20]), language="text")
+    
+    st.markdown("---")
+    
+    # Task Management Section (reruns on its own timer when auto-refresh is on)
+    run_every = refresh_interval if st.session_state.auto_refresh else None
+    profiler.mark("Task dashboard")
+    st.fragment(run_every=run_every)(render_task_dashboard)(api_key, owner, max_tasks)
 
 # Footer Section
+profiler.mark("Footer")
 st.markdown("---")
 st.markdown("""
 <div style="background: linear-gradient(135deg, rgba(102, 126, 234, 0.1) 0%, rgba(118, 75, 162, 0.1) 100%); 
@@ -1089,3 +840,6 @@ st.markdown("""
     }
 </style>
 """, unsafe_allow_html=True)
+
+profiler.finish()
+render_profiler_panel(profiler)
@@ -0,0 +1,163 @@
+"""Throughput and completion-latency benchmarks against the local API mock.
+
+Starts sora_core.mock_server in-process, points the shared client at it and
+measures the code paths the apps use:
+
+* submissions/s  submit_bulk() over create_task
+* polls/s        poll_tasks() over the raw client and over the cached
+                 api.query_task, and the asyncio client's query_tasks_sync()
+* time-to-detect how long after a task completes the scheduler-driven
+                 poll loop (poll_due_tasks, as in the CLI) notices it
+
+    python -m benchmarks.api
+    python -m benchmarks.api --tasks 500 --workers 16 --cost-time lognormal:5,0.3 --json
+
+The API governor is lifted for the benchmark key unless --api-rate is given,
+so the numbers show the client rather than the configured budget.
+"""
+import argparse
+import json
+import sys
+import time
+from typing import Dict, List, Optional
+
+from sora_core import api
+from sora_core.aio import query_tasks_sync
+from sora_core.bulk import submit_bulk
+from sora_core.cache import TERMINAL_STATES, get_result_cache
+from sora_core.client import configure_client, get_client
+from sora_core.mock_server import MockKieServer
+from sora_core.models import Task
+from sora_core.polling import poll_due_tasks, poll_tasks
+from sora_core.ratelimit import get_api_governor
+from sora_core.scheduler import PollScheduler
+from sora_core.telemetry import get_telemetry
+
+API_KEY = "benchmark-key"
+VIDEO_URL = "https://sora.chatgpt.com/p/s_benchmark"
+UNLIMITED_RATE = 1e9
+
+
+def percentile(values: List[float], q: float) -> Optional[float]:
+    """Nearest-rank percentile (q in 0-100)"""
+    if not values:
+        return None
+    ordered = sorted(values)
+    return ordered[min(len(ordered) - 1, max(0, int(round(q / 100 * len(ordered))) - 1))]
+
+
+def bench_submissions(count: int, workers: int) -> Dict:
+    start = time.perf_counter()
+    responses = [response for _, response in submit_bulk(
+        api.create_task, API_KEY, [f"{VIDEO_URL}{i}" for i in range(count)],
+        max_workers=workers, rate_per_sec=UNLIMITED_RATE,
+    )]
+    elapsed = time.perf_counter() - start
+    task_ids = [r["data"]["taskId"] for r in responses if r.get("code") == 200]
+    return {"submitted": len(task_ids), "errors": count - len(task_ids), "seconds": elapsed,
+            "per_second": len(task_ids) / elapsed, "task_ids": task_ids}
+
+
+def bench_polls(task_ids: List[str], workers: int, rounds: int) -> Dict:
+    results = {}
+    for name, query_fn in (("raw", get_client().query_task), ("cached", api.query_task)):
+        start = time.perf_counter()
+        for _ in range(rounds):
+            poll_tasks(query_fn, API_KEY, task_ids, max_workers=workers)
+        elapsed = time.perf_counter() - start
+        results[name] = {"polls": len(task_ids) * rounds, "seconds": elapsed,
+                         "per_second": len(task_ids) * rounds / elapsed}
+    start = time.perf_counter()
+    for _ in range(rounds):
+        # Every poll goes to the network, as with the raw client
+        get_result_cache().clear()
+        query_tasks_sync(API_KEY, task_ids, concurrency=workers)
+    elapsed = time.perf_counter() - start
+    results["async"] = {"polls": len(task_ids) * rounds, "seconds": elapsed,
+                        "per_second": len(task_ids) * rounds / elapsed}
+    return results
+
+
+def bench_detection(count: int, workers: int, timeout: float) -> Dict:
+    """Submit `count` tasks and poll them on the adaptive schedule until all are terminal"""
+    submitted = bench_submissions(count, workers)
+    now = time.time()
+    tasks = [Task(task_id, VIDEO_URL, created_at=now) for task_id in submitted["task_ids"]]
+    scheduler = PollScheduler()
+    lags: List[float] = []
+    polls = 0
+    deadline = time.time() + timeout
+    pending = {task.task_id: task for task in tasks}
+    while pending and time.time() < deadline:
+        cache = get_result_cache()
+        requests_before = cache.misses - cache.coalesced
+        results = poll_due_tasks(api.query_task, API_KEY, list(pending.values()), scheduler, max_workers=workers)
+        polls += cache.misses - cache.coalesced - requests_before
+        detected_at = time.time()
+        for task_id, response in results.items():
+            data = (response.get("data") or {}) if response.get("code") == 200 else {}
+            if data.get("state") in TERMINAL_STATES:
+                lags.append(max(0.0, detected_at - data["completeTime"] / 1000))
+                del pending[task_id]
+        wake_at = scheduler.next_poll_at(pending) or time.time() + scheduler.base_interval
+        time.sleep(max(0.0, min(wake_at, deadline) - time.time()))
+    return {
+        "tasks": len(tasks), "detected": len(lags), "timed_out": len(pending),
+        "polls_per_task": polls / len(tasks) if tasks else 0.0,
+        "lag_p50": percentile(lags, 50), "lag_p95": percentile(lags, 95), "lag_max": max(lags) if lags else None,
+    }
+
+
+def run(args) -> Dict:
+    mock = MockKieServer(port=0, queue_time=args.queue_time, cost_time=args.cost_time, seed=args.seed).start()
+    try:
+        configure_client(mock.base_url)
+        rate = args.api_rate or UNLIMITED_RATE
+        get_api_governor(API_KEY).bucket.set_rate(rate, max(1.0, rate))
+
+        submissions = bench_submissions(args.tasks, args.workers)
+        polls = bench_polls(submissions.pop("task_ids"), args.workers, args.rounds)
+        detection = bench_detection(args.detect_tasks, args.workers, args.timeout)
+        return {"submissions": submissions, "polls": polls, "detection": detection,
+                "latency": {name: stats["latency"] for name, stats in get_telemetry().snapshot().items()}}
+    finally:
+        mock.stop()
+
+
+def _format_seconds(value: Optional[float]) -> str:
+    return f"{value:.2f}s" if value is not None else "n/a"
+
+
+def main(argv=None) -> int:
+    parser = argparse.ArgumentParser(description="Benchmark the API client against the local mock.")
+    parser.add_argument("--tasks", type=int, default=200, help="Tasks for the submission and poll benchmarks")
+    parser.add_argument("--rounds", type=int, default=3, help="Polls of every task in the poll benchmark")
+    parser.add_argument("--detect-tasks", type=int, default=50, help="Tasks followed to completion")
+    parser.add_argument("--workers", type=int, default=8, help="Concurrent requests")
+    parser.add_argument("--queue-time", default="uniform:0,1", help="Mock queue time distribution")
+    parser.add_argument("--cost-time", default="lognormal:5,0.3", help="Mock processing time distribution")
+    parser.add_argument("--timeout", type=float, default=120.0, help="Give up on time-to-detect after this many seconds")
+    parser.add_argument("--api-rate", type=float, default=None, help="Apply this governor rate instead of none")
+    parser.add_argument("--seed", type=int, default=1)
+    parser.add_argument("--json", action="store_true", help="Print the results as JSON")
+    args = parser.parse_args(argv)
+
+    results = run(args)
+    if args.json:
+        print(json.dumps(results, indent=2))
+        return 0
+    submissions, polls, detection = results["submissions"], results["polls"], results["detection"]
+    print(f"submissions   {submissions['per_second']:8.1f}/s  ({submissions['submitted']} in {submissions['seconds']:.2f}s, {submissions['errors']} errors)")
+    print(f"polls (raw)   {polls['raw']['per_second']:8.1f}/s  ({polls['raw']['polls']} in {polls['raw']['seconds']:.2f}s)")
+    print(f"polls (cache) {polls['cached']['per_second']:8.1f}/s  ({polls['cached']['polls']} in {polls['cached']['seconds']:.2f}s)")
+    print(f"polls (async) {polls['async']['per_second']:8.1f}/s  ({polls['async']['polls']} in {polls['async']['seconds']:.2f}s)")
+    print(f"time-to-detect p50 {_format_seconds(detection['lag_p50'])}  p95 {_format_seconds(detection['lag_p95'])}  "
+          f"max {_format_seconds(detection['lag_max'])}  ({detection['detected']}/{detection['tasks']} tasks, "
+          f"{detection['polls_per_task']:.1f} polls/task)")
+    for name, latency in results["latency"].items():
+        print(f"latency {name:<12} p50 {latency[50] * 1000:.1f} ms  p95 {latency[95] * 1000:.1f} ms  p99 {latency[99] * 1000:.1f} ms")
+    return 1 if detection["timed_out"] else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
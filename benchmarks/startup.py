@@ -0,0 +1,97 @@
+"""Cold-start import benchmark for the Streamlit entry points.
+
+Streamlit re-executes the entry script on every interaction, and a fresh
+server process pays the full import cost before the first page renders. For
+each entry point this runs the script's top-level import statements (without
+executing any Streamlit calls) in a fresh interpreter, after `streamlit`
+itself has been imported, and reports the median time over several runs.
+
+The run fails (exit status 1) if an entry point exceeds the import-time
+budget or loads a module that must stay deferred until first use:
+
+    python -m benchmarks.startup
+    python -m benchmarks.startup --budget-ms 150 --runs 7
+"""
+import argparse
+import ast
+import json
+import os
+import statistics
+import subprocess
+import sys
+from typing import Dict, List
+
+REPO_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+ENTRY_POINTS = ("app.py", "1app.py", "5app.py", "app66.py")
+
+# Milliseconds an entry point's own imports may add on top of `import streamlit`
+DEFAULT_BUDGET_MS = 150.0
+DEFAULT_RUNS = 5
+
+# Imported on first use only (Analytics page, downloads); never at startup
+DEFERRED_MODULES = ("numpy", "pandas", "pyarrow")
+
+# Executed in the child interpreter: time the imports and list deferred modules that got loaded
+_PROBE = """
+import json, sys, time
+import streamlit
+source = sys.stdin.read()
+start = time.perf_counter()
+exec(compile(source, {name!r}, "exec"), {{"__name__": "__startup_probe__"}})
+elapsed = time.perf_counter() - start
+print(json.dumps({{"ms": elapsed * 1000, "loaded": [m for m in {deferred!r} if m in sys.modules]}}))
+"""
+
+
+def import_block(path: str) -> str:
+    """Source of the top-level import statements of a script"""
+    with open(path, encoding="utf-8") as f:
+        source = f.read()
+    tree = ast.parse(source, path)
+    imports = [node for node in tree.body if isinstance(node, (ast.Import, ast.ImportFrom))]
+    return "\n".join(ast.get_source_segment(source, node) for node in imports)
+
+
+def measure(entry_point: str, runs: int = DEFAULT_RUNS) -> Dict:
+    """Median import time (ms) of one entry point over `runs` fresh interpreters"""
+    block = import_block(os.path.join(REPO_ROOT, entry_point))
+    probe = _PROBE.format(name=entry_point, deferred=DEFERRED_MODULES)
+    env = dict(os.environ, PYTHONPATH=os.pathsep.join(filter(None, [REPO_ROOT, os.environ.get("PYTHONPATH")])))
+    timings: List[float] = []
+    loaded: List[str] = []
+    for _ in range(runs):
+        result = subprocess.run(
+            [sys.executable, "-c", probe], input=block, capture_output=True,
+            text=True, cwd=REPO_ROOT, env=env, check=True,
+        )
+        sample = json.loads(result.stdout.strip().splitlines()[-1])
+        timings.append(sample["ms"])
+        loaded = sample["loaded"]
+    return {"entry_point": entry_point, "ms": statistics.median(timings), "loaded": loaded}
+
+
+def main(argv=None) -> int:
+    parser = argparse.ArgumentParser(description="Measure entry point import time against a budget.")
+    parser.add_argument("entry_points", nargs="*", default=list(ENTRY_POINTS))
+    parser.add_argument("--budget-ms", type=float, default=DEFAULT_BUDGET_MS,
+                        help=f"Import time allowed per entry point on top of streamlit (default: {DEFAULT_BUDGET_MS:g})")
+    parser.add_argument("--runs", type=int, default=DEFAULT_RUNS, help=f"Fresh interpreters per entry point (default: {DEFAULT_RUNS})")
+    args = parser.parse_args(argv)
+
+    failed = False
+    for entry_point in args.entry_points:
+        result = measure(entry_point, max(1, args.runs))
+        problems = []
+        if result["ms"] > args.budget_ms:
+            problems.append(f"over budget ({args.budget_ms:g} ms)")
+        if result["loaded"]:
+            problems.append(f"loads deferred modules: {', '.join(result['loaded'])}")
+        failed = failed or bool(problems)
+        status = "FAIL " + "; ".join(problems) if problems else "ok"
+        print(f"{entry_point:<12} {result['ms']:8.1f} ms  {status}")
+    return 1 if failed else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1 @@
+"""Shared, UI-independent building blocks for the Sora Watermark Remover apps."""
@@ -0,0 +1,281 @@
+"""asyncio client for the jobs API: thousands of concurrent calls on one thread.
+
+AsyncKieClient mirrors sora_core.client.KieClient on aiohttp: the same
+envelope parsing, the same per-key governor (waited on with asyncio.sleep
+instead of blocking a thread), the same retries and the same telemetry.
+query_tasks() and create_tasks() fan out over many tasks with at most
+`concurrency` requests in flight, so polling a large backlog needs no
+thread pool.
+
+Threads without an event loop (the Streamlit script, the CLI) use the sync
+facade, query_tasks_sync() / create_tasks_sync(), which runs the coroutines
+on one process-wide loop thread sharing a single connection pool.
+"""
+import asyncio
+import json
+import threading
+import time
+from typing import Awaitable, Callable, Dict, Iterable, List, Mapping, Optional, Tuple, TypeVar
+
+import aiohttp
+
+from sora_core.cache import get_result_cache
+from sora_core.client import (DEFAULT_TIMEOUT, MAX_RATE_LIMIT_RETRIES, MODEL_NAME, POOL_MAXSIZE, get_client,
+                              parse_envelope)
+from sora_core.ratelimit import MAX_GOVERNOR_WAIT, ApiGovernor, current_lane, get_api_governor, rate_limited_response
+from sora_core.telemetry import NO_RESPONSE, get_telemetry
+
+# Requests in flight at once per query_tasks() / create_tasks() call
+MAX_CONCURRENCY = 32
+
+# Status queries are retried on connection errors and these statuses, as by
+# the sync client's transport policy; createTask is never retried here
+QUERY_RETRIES = 3
+QUERY_RETRY_STATUSES = frozenset({500, 502, 503, 504})
+QUERY_BACKOFF = 0.5
+
+T = TypeVar("T")
+
+
+async def _acquire(governor: ApiGovernor, lane: Optional[str], timeout: float = MAX_GOVERNOR_WAIT) -> bool:
+    """Wait for budget without blocking the loop; False if none frees up within `timeout`"""
+    deadline = time.monotonic() + timeout
+    while True:
+        wait = governor.try_acquire(lane)
+        if wait <= 0:
+            return True
+        if wait > deadline - time.monotonic():
+            return False
+        await asyncio.sleep(wait)
+
+
+class AsyncKieClient:
+    """Coroutine API client holding a keep-alive connection pool (use from one event loop)"""
+
+    def __init__(self, base_url: Optional[str] = None, timeout=DEFAULT_TIMEOUT,
+                 max_connections: int = POOL_MAXSIZE):
+        connect, read = timeout
+        self.base_url = (base_url or get_client().base_url).rstrip("/")
+        self.timeout = aiohttp.ClientTimeout(sock_connect=connect, sock_read=read)
+        self.max_connections = max_connections
+        self._http: Optional[aiohttp.ClientSession] = None
+
+    @property
+    def create_task_url(self) -> str:
+        return f"{self.base_url}/createTask"
+
+    @property
+    def query_task_url(self) -> str:
+        return f"{self.base_url}/recordInfo"
+
+    def _session(self) -> aiohttp.ClientSession:
+        # Created on first use: an aiohttp session belongs to the running loop
+        if self._http is None:
+            self._http = aiohttp.ClientSession(
+                connector=aiohttp.TCPConnector(limit=self.max_connections),
+                timeout=self.timeout,
+            )
+        return self._http
+
+    async def _request(self, method: str, url: str, retries: int, **kwargs) -> Tuple[int, bytes, Mapping[str, str], int]:
+        """One HTTP exchange: (status, body, headers, retries made), retrying connection errors and 5xx"""
+        for retry in range(retries + 1):
+            try:
+                async with self._session().request(method, url, **kwargs) as response:
+                    content = await response.read()
+                    if response.status not in QUERY_RETRY_STATUSES or retry == retries:
+                        return response.status, content, response.headers, retry
+            except (aiohttp.ClientConnectionError, asyncio.TimeoutError):
+                if retry == retries:
+                    raise
+            await asyncio.sleep(QUERY_BACKOFF * (2 ** retry))
+
+    async def _send(self, api_key: str, endpoint: str, lane: Optional[str], method: str, url: str,
+                    retries: int = 0, **kwargs) -> Dict:
+        """Governed request: wait for budget, back off and retry on 429; recorded in telemetry"""
+        governor = get_api_governor(api_key)
+        attempts = 0
+        retried = 0
+        elapsed = 0.0
+        status = NO_RESPONSE
+        received = 0
+        try:
+            for attempt in range(MAX_RATE_LIMIT_RETRIES + 1):
+                if not await _acquire(governor, lane):
+                    return rate_limited_response(governor.wait_time(lane))
+                attempts += 1
+                status, received = NO_RESPONSE, 0
+                start = time.perf_counter()
+                try:
+                    status, content, headers, transport_retries = await self._request(method, url, retries, **kwargs)
+                finally:
+                    elapsed += time.perf_counter() - start
+                received = len(content)
+                retried += (attempt > 0) + transport_retries
+                try:
+                    body = json.loads(content)
+                except ValueError:
+                    body = None
+                result = parse_envelope(status, body, headers)
+                if result.get("code") != 429:
+                    return result
+                governor.penalize(result.get("retry_after"), attempt)
+            return result
+        finally:
+            if attempts:
+                get_telemetry().record(endpoint, elapsed, status, received, len(kwargs.get("data") or b""), retried)
+
+    async def create_task(self, api_key: str, video_url: str, callback_url: Optional[str] = None,
+                          lane: Optional[str] = None) -> Dict:
+        """Create a watermark removal task"""
+        payload = {"model": MODEL_NAME, "input": {"video_url": video_url}}
+        if callback_url:
+            payload["callBackUrl"] = callback_url
+        headers = {"Authorization": f"Bearer {api_key}", "Content-Type": "application/json"}
+        try:
+            return await self._send(api_key, "createTask", lane, "POST", self.create_task_url,
+                                    headers=headers, data=json.dumps(payload).encode("utf-8"))
+        except (aiohttp.ClientError, asyncio.TimeoutError) as e:
+            return {"code": 500, "msg": f"Request failed: {e}"}
+        except Exception as e:
+            return {"code": 500, "msg": f"Error: {str(e)}"}
+
+    async def query_task(self, api_key: str, task_id: str, lane: Optional[str] = None) -> Dict:
+        """Query task status"""
+        try:
+            return await self._send(api_key, "recordInfo", lane, "GET", self.query_task_url, QUERY_RETRIES,
+                                    headers={"Authorization": f"Bearer {api_key}"}, params={"taskId": task_id})
+        except (aiohttp.ClientError, asyncio.TimeoutError) as e:
+            return {"code": 500, "msg": f"Request failed: {e}"}
+        except Exception as e:
+            return {"code": 500, "msg": f"Error: {str(e)}"}
+
+    async def aclose(self):
+        if self._http is not None:
+            await self._http.close()
+            self._http = None
+
+    async def __aenter__(self) -> "AsyncKieClient":
+        return self
+
+    async def __aexit__(self, *exc_info):
+        await self.aclose()
+
+
+async def _with_client(client: Optional[AsyncKieClient], run: Callable[[AsyncKieClient], Awaitable[T]]) -> T:
+    """Run with the given client, or with a temporary one closed afterwards"""
+    if client is not None:
+        return await run(client)
+    async with AsyncKieClient() as temporary:
+        return await run(temporary)
+
+
+async def query_tasks(api_key: str, task_ids: Iterable[str], concurrency: int = MAX_CONCURRENCY,
+                      client: Optional[AsyncKieClient] = None, lane: Optional[str] = None) -> Dict[str, Dict]:
+    """Query many tasks concurrently, keyed by taskId; finished tasks are served from the result cache"""
+    unique_ids = list(dict.fromkeys(task_ids))
+    if not unique_ids:
+        return {}
+    lane = lane if lane is not None else current_lane()
+    cache = get_result_cache()
+    semaphore = asyncio.Semaphore(max(1, concurrency))
+
+    async def _run(client: AsyncKieClient) -> Dict[str, Dict]:
+        async def _query(task_id: str) -> Dict:
+            cached = cache.get(task_id)
+            if cached is not None:
+                return cached
+            # Shares a lookup already in flight from any thread or coroutine
+            future, leader = cache.begin_fetch(task_id)
+            if not leader:
+                return await asyncio.shield(asyncio.wrap_future(future))
+            try:
+                async with semaphore:
+                    response = await client.query_task(api_key, task_id, lane)
+            except BaseException as e:
+                cache.end_fetch(task_id, future, error=e)
+                raise
+            cache.end_fetch(task_id, future, response)
+            return response
+
+        results = await asyncio.gather(*(_query(task_id) for task_id in unique_ids))
+        return dict(zip(unique_ids, results))
+
+    return await _with_client(client, _run)
+
+
+async def create_tasks(api_key: str, urls: Iterable[str], callback_url: Optional[str] = None,
+                       concurrency: int = MAX_CONCURRENCY, client: Optional[AsyncKieClient] = None,
+                       lane: Optional[str] = None) -> List[Tuple[str, Dict]]:
+    """Create a task per URL concurrently; returns (url, response) pairs in input order"""
+    urls = list(urls)
+    if not urls:
+        return []
+    lane = lane if lane is not None else current_lane()
+    semaphore = asyncio.Semaphore(max(1, concurrency))
+
+    async def _run(client: AsyncKieClient) -> List[Tuple[str, Dict]]:
+        async def _create(url: str) -> Dict:
+            async with semaphore:
+                return await client.create_task(api_key, url, callback_url, lane)
+
+        results = await asyncio.gather(*(_create(url) for url in urls))
+        return list(zip(urls, results))
+
+    return await _with_client(client, _run)
+
+
+# --- Sync facade ---
+
+class _LoopThread:
+    """Event loop on a daemon thread, owning the client shared by every sync caller"""
+
+    def __init__(self):
+        self.loop = asyncio.new_event_loop()
+        self.client: Optional[AsyncKieClient] = None
+        self.thread = threading.Thread(target=self.loop.run_forever, name="kie-aio", daemon=True)
+        self.thread.start()
+
+    async def _current_client(self) -> AsyncKieClient:
+        # Follow configure_client() so both clients talk to the same deployment
+        base_url = get_client().base_url
+        if self.client is None or self.client.base_url != base_url:
+            previous, self.client = self.client, AsyncKieClient(base_url)
+            if previous is not None:
+                await previous.aclose()
+        return self.client
+
+    def run(self, run: Callable[[AsyncKieClient], Awaitable[T]]) -> T:
+        """Run a coroutine on the loop with the shared client and wait for its result"""
+        async def _main() -> T:
+            return await run(await self._current_client())
+        return asyncio.run_coroutine_threadsafe(_main(), self.loop).result()
+
+
+_loop_thread: Optional[_LoopThread] = None
+_loop_thread_lock = threading.Lock()
+
+
+def _get_loop_thread() -> _LoopThread:
+    global _loop_thread
+    if _loop_thread is None:
+        with _loop_thread_lock:
+            if _loop_thread is None:
+                _loop_thread = _LoopThread()
+    return _loop_thread
+
+
+def query_tasks_sync(api_key: str, task_ids: Iterable[str], concurrency: int = MAX_CONCURRENCY) -> Dict[str, Dict]:
+    """Blocking query_tasks() for threads without an event loop"""
+    task_ids = list(task_ids)
+    # Resolved here: the caller's session is not visible from the loop thread
+    lane = current_lane()
+    return _get_loop_thread().run(lambda client: query_tasks(api_key, task_ids, concurrency, client, lane))
+
+
+def create_tasks_sync(api_key: str, urls: Iterable[str], callback_url: Optional[str] = None,
+                      concurrency: int = MAX_CONCURRENCY) -> List[Tuple[str, Dict]]:
+    """Blocking create_tasks() for threads without an event loop"""
+    urls = list(urls)
+    lane = current_lane()
+    return _get_loop_thread().run(lambda client: create_tasks(api_key, urls, callback_url, concurrency, client, lane))
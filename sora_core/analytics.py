@@ -0,0 +1,118 @@
+"""Columnar analytics over the task history.
+
+The task columns are read from the store in one query and analysed with
+NumPy/pandas, so percentiles, hourly throughput and failure breakdowns are
+vectorized instead of looping over task records in Python.
+
+Queue wait is estimated as the time between submission and the start of
+processing: completeTime - costTime - created_at.
+"""
+from datetime import datetime
+from typing import Dict, Optional
+
+import numpy as np
+import pandas as pd
+
+from sora_core.store import ANALYTICS_FIELDS, TaskStore
+
+PERCENTILES = (50, 90, 99)
+NUMERIC_FIELDS = ("created_at", "updated_at", "complete_time", "cost_time")
+
+# Queue wait histogram bucket edges in seconds
+QUEUE_WAIT_EDGES = (0, 5, 15, 30, 60, 120, 300, 600, np.inf)
+
+# Analytics windows offered by the UI, in seconds (None = all history)
+WINDOWS = {
+    "Last 24 hours": 24 * 3600,
+    "Last 7 days": 7 * 24 * 3600,
+    "Last 30 days": 30 * 24 * 3600,
+    "All time": None,
+}
+
+
+def load_frame(store: TaskStore, owner: str, since: Optional[float] = None) -> pd.DataFrame:
+    """One row per task with numeric epoch-second columns"""
+    frame = pd.DataFrame(store.columns(owner, list(ANALYTICS_FIELDS), since=since), columns=list(ANALYTICS_FIELDS))
+    for field in NUMERIC_FIELDS:
+        frame[field] = pd.to_numeric(frame[field], errors="coerce").astype("float64")
+    return frame
+
+
+def _percentiles(values: np.ndarray) -> Dict[int, Optional[float]]:
+    if values.size == 0:
+        return {p: None for p in PERCENTILES}
+    return {p: float(v) for p, v in zip(PERCENTILES, np.percentile(values, PERCENTILES))}
+
+
+def cost_time_percentiles(frame: pd.DataFrame) -> Dict[int, Optional[float]]:
+    """p50/p90/p99 processing time (seconds) of successful tasks"""
+    costs = frame.loc[frame["state"] == "success", "cost_time"].dropna().to_numpy()
+    return _percentiles(costs)
+
+
+def queue_waits(frame: pd.DataFrame) -> np.ndarray:
+    """Seconds each finished task waited before processing started"""
+    done = frame.dropna(subset=["complete_time", "cost_time", "created_at"])
+    waits = done["complete_time"].to_numpy() - done["cost_time"].to_numpy() - done["created_at"].to_numpy()
+    return np.clip(waits, 0, None)
+
+
+def queue_wait_histogram(waits: np.ndarray) -> pd.DataFrame:
+    """Task counts per queue wait bucket"""
+    counts, _ = np.histogram(waits, bins=QUEUE_WAIT_EDGES)
+    labels = [
+        f"{int(lo)}-{int(hi)}s" if np.isfinite(hi) else f"{int(lo)}s+"
+        for lo, hi in zip(QUEUE_WAIT_EDGES[:-1], QUEUE_WAIT_EDGES[1:])
+    ]
+    return pd.DataFrame({"bucket": labels, "tasks": counts})
+
+
+def _local_hours(epochs: pd.Series) -> pd.Series:
+    local_tz = datetime.now().astimezone().tzinfo
+    stamps = pd.to_datetime(epochs.dropna(), unit="s", utc=True)
+    return stamps.dt.tz_convert(local_tz).dt.tz_localize(None).dt.floor("h")
+
+
+def hourly_throughput(frame: pd.DataFrame) -> pd.DataFrame:
+    """Submitted, completed and failed task counts per local hour (gaps filled with 0)"""
+    series = {
+        "submitted": _local_hours(frame["created_at"]).value_counts(),
+        "completed": _local_hours(frame.loc[frame["state"] == "success", "complete_time"]).value_counts(),
+        "failed": _local_hours(frame.loc[frame["state"] == "fail", "complete_time"]).value_counts(),
+    }
+    hourly = pd.DataFrame(series).fillna(0).astype("int64").sort_index()
+    if hourly.empty:
+        return hourly
+    hourly = hourly.asfreq("h", fill_value=0)
+    hourly.index.name = "hour"
+    return hourly
+
+
+def failure_breakdown(frame: pd.DataFrame) -> pd.DataFrame:
+    """Failures per failCode and their share of all finished tasks"""
+    finished = int(frame["state"].isin(["success", "fail"]).sum())
+    counts = frame.loc[frame["state"] == "fail", "fail_code"].fillna("unknown").value_counts()
+    breakdown = pd.DataFrame({"fail_code": counts.index.astype(str), "tasks": counts.to_numpy()})
+    breakdown["rate"] = breakdown["tasks"] / finished if finished else 0.0
+    return breakdown
+
+
+def summarize(frame: pd.DataFrame) -> Dict:
+    """Every aggregate shown on the Analytics page"""
+    finished = int(frame["state"].isin(["success", "fail"]).sum())
+    failed = int((frame["state"] == "fail").sum())
+    waits = queue_waits(frame)
+    return {
+        "total": len(frame),
+        "finished": finished,
+        "failure_rate": failed / finished if finished else 0.0,
+        "cost_time": cost_time_percentiles(frame),
+        "queue_wait": _percentiles(waits),
+        "queue_wait_histogram": queue_wait_histogram(waits),
+        "throughput": hourly_throughput(frame),
+        "failures": failure_breakdown(frame),
+    }
+
+
+def format_seconds(value: Optional[float]) -> str:
+    return f"{value:.1f}s" if value is not None else "N/A"
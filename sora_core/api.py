@@ -0,0 +1,26 @@
+"""Task operations shared by every UI entry point and the CLI."""
+from typing import Callable, Dict, Optional
+
+from sora_core.cache import get_result_cache
+from sora_core.callbacks import get_callback_url
+from sora_core.client import get_client
+
+
+def create_task(api_key: str, video_url: str, callback_url: Optional[str] = None,
+                on_request: Optional[Callable[[], None]] = None) -> Dict:
+    """Create a watermark removal task (callBackUrl defaults to the in-process receiver)"""
+    if on_request is not None:
+        on_request()
+    return get_client().create_task(api_key, video_url, callback_url or get_callback_url())
+
+
+def query_task(api_key: str, task_id: str, on_request: Optional[Callable[[], None]] = None) -> Dict:
+    """Query task status; finished tasks are served from the result cache
+
+    `on_request` is called only when a network request is actually made.
+    """
+    def _load() -> Dict:
+        if on_request is not None:
+            on_request()
+        return get_client().query_task(api_key, task_id)
+    return get_result_cache().fetch(task_id, _load)
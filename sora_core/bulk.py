@@ -0,0 +1,77 @@
+"""Bulk task submission: URL list parsing and a rate-limited worker pool."""
+import csv
+import io
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from typing import Callable, Dict, Iterator, List, Optional, Tuple
+
+from sora_core.ratelimit import TokenBucket, current_lane, use_lane
+from sora_core.validation import validate_video_url
+
+BULK_MAX_WORKERS = 4
+BULK_RATE_PER_SEC = 2.0
+
+
+def parse_url_list(content) -> List[str]:
+    """Extract URLs from uploaded CSV / plain text, keeping order and dropping duplicates"""
+    if isinstance(content, bytes):
+        content = content.decode("utf-8-sig", errors="replace")
+    urls = []
+    for row in csv.reader(io.StringIO(content)):
+        for cell in row:
+            cell = cell.strip()
+            if cell.lower().startswith("http"):
+                urls.append(cell)
+    return list(dict.fromkeys(urls))
+
+
+def split_valid_urls(urls: List[str]) -> Tuple[List[str], List[Tuple[str, str]]]:
+    """Partition URLs into valid ones and (url, error) pairs"""
+    valid, invalid = [], []
+    for url in urls:
+        error = validate_video_url(url)
+        if error:
+            invalid.append((url, error))
+        else:
+            valid.append(url)
+    return valid, invalid
+
+
+def submit_bulk(
+    create_fn: Callable[[str, str, Optional[str]], Dict],
+    api_key: str,
+    urls: List[str],
+    callback_url: Optional[str] = None,
+    max_workers: int = BULK_MAX_WORKERS,
+    rate_per_sec: float = BULK_RATE_PER_SEC,
+    bucket: Optional[TokenBucket] = None,
+) -> Iterator[Tuple[str, Dict]]:
+    """Submit many URLs concurrently, yielding (url, response) as each one finishes
+
+    A shared token bucket caps the submission rate. 429s from the API are
+    handled once, by the API governor and client (sora_core.client), so a
+    response that is still a 429 is reported rather than retried here. A
+    submission the governor held back (`throttled`: never sent) is sent
+    again until budget frees up, so no URL is dropped for lack of budget.
+    """
+    if not urls:
+        return
+    bucket = bucket or TokenBucket(rate_per_sec)
+    # Workers spend the calling session's share of the API budget
+    lane = current_lane()
+
+    def _submit(url: str) -> Dict:
+        while True:
+            bucket.acquire()
+            try:
+                with use_lane(lane):
+                    result = create_fn(api_key, url, callback_url)
+            except Exception as e:
+                return {"code": 500, "msg": f"Error: {str(e)}"}
+            if not result.get("throttled"):
+                return result
+
+    workers = max(1, min(max_workers, len(urls)))
+    with ThreadPoolExecutor(max_workers=workers, thread_name_prefix="bulk-submit") as pool:
+        futures = {pool.submit(_submit, url): url for url in urls}
+        for future in as_completed(futures):
+            yield futures[future], future.result()
@@ -0,0 +1,200 @@
+"""Task result cache: terminal payloads are kept, in-flight states expire."""
+import json
+import threading
+import time
+from collections import OrderedDict
+from concurrent.futures import Future
+from typing import Callable, Dict, List, Optional, Tuple
+
+TERMINAL_STATES = frozenset({"success", "fail"})
+
+# How long a non-terminal (waiting) response may be served from cache
+DEFAULT_PENDING_TTL = 5.0
+MAX_PENDING_ENTRIES = 1024
+MAX_TERMINAL_ENTRIES = 20000
+
+
+def parse_result_urls(task_data: Dict) -> List[str]:
+    """Extract resultUrls from a recordInfo payload's resultJson"""
+    raw = task_data.get("resultJson")
+    if not raw:
+        return []
+    try:
+        result_data = json.loads(raw) if isinstance(raw, str) else raw
+    except ValueError:
+        return []
+    if not isinstance(result_data, dict):
+        return []
+    return list(result_data.get("resultUrls") or [])
+
+
+class CacheEntry:
+    __slots__ = ("response", "result_urls", "stored_at")
+
+    def __init__(self, response: Dict, result_urls: List[str], stored_at: float):
+        self.response = response
+        self.result_urls = result_urls
+        self.stored_at = stored_at
+
+
+class TaskResultCache:
+    """Thread-safe cache of recordInfo responses keyed by taskId
+
+    Responses for tasks in a terminal state never change, so they are kept
+    (LRU-bounded) and served forever. Non-terminal responses are kept for a
+    short TTL so repeated lookups within one render share a single request.
+    Concurrent misses for the same task are coalesced: the first caller
+    makes the request and the others wait for its response (singleflight).
+    """
+
+    def __init__(self, pending_ttl: float = DEFAULT_PENDING_TTL,
+                 max_pending: int = MAX_PENDING_ENTRIES,
+                 max_terminal: int = MAX_TERMINAL_ENTRIES):
+        self.pending_ttl = pending_ttl
+        self.max_pending = max_pending
+        self.max_terminal = max_terminal
+        self._terminal: "OrderedDict[str, CacheEntry]" = OrderedDict()
+        self._pending: "OrderedDict[str, CacheEntry]" = OrderedDict()
+        self._inflight: Dict[str, Future] = {}
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+        self.coalesced = 0
+
+    @staticmethod
+    def is_terminal(response: Dict) -> bool:
+        data = response.get("data") or {}
+        return response.get("code") == 200 and data.get("state") in TERMINAL_STATES
+
+    def _lookup(self, task_id: str) -> Optional[CacheEntry]:
+        entry = self._terminal.get(task_id)
+        if entry is not None:
+            self._terminal.move_to_end(task_id)
+            return entry
+        entry = self._pending.get(task_id)
+        if entry is not None and time.monotonic() - entry.stored_at <= self.pending_ttl:
+            self._pending.move_to_end(task_id)
+            return entry
+        return None
+
+    def get(self, task_id: str) -> Optional[Dict]:
+        """Return the cached response for a task, or None"""
+        with self._lock:
+            entry = self._lookup(task_id)
+            if entry is None:
+                self.misses += 1
+                return None
+            self.hits += 1
+            return entry.response
+
+    def peek(self, task_id: str) -> Optional[Dict]:
+        """Last known response for a task, ignoring the TTL (no hit/miss accounting)"""
+        with self._lock:
+            entry = self._terminal.get(task_id) or self._pending.get(task_id)
+            return entry.response if entry is not None else None
+
+    def put(self, task_id: str, response: Dict):
+        """Store a response; only successful API envelopes are cached"""
+        if response.get("code") != 200:
+            return
+        data = response.get("data") or {}
+        entry = CacheEntry(response, parse_result_urls(data), time.monotonic())
+        with self._lock:
+            if self.is_terminal(response):
+                self._pending.pop(task_id, None)
+                self._terminal[task_id] = entry
+                self._terminal.move_to_end(task_id)
+                while len(self._terminal) > self.max_terminal:
+                    self._terminal.popitem(last=False)
+            else:
+                self._pending[task_id] = entry
+                self._pending.move_to_end(task_id)
+                while len(self._pending) > self.max_pending:
+                    self._pending.popitem(last=False)
+
+    def begin_fetch(self, task_id: str) -> Tuple[Future, bool]:
+        """Join the in-flight lookup of a task, or start one
+
+        Returns the lookup's future and whether the caller leads it; a leader
+        must make the request and pass its outcome to end_fetch(), everyone
+        else waits on the future (with .result() or asyncio.wrap_future).
+        """
+        with self._lock:
+            future = self._inflight.get(task_id)
+            if future is not None:
+                self.coalesced += 1
+                return future, False
+            future = Future()
+            entry = self._lookup(task_id)
+            if entry is not None:
+                # Stored by a lookup that finished since the caller's miss
+                future.set_result(entry.response)
+                return future, False
+            self._inflight[task_id] = future
+            return future, True
+
+    def end_fetch(self, task_id: str, future: Future, response: Optional[Dict] = None,
+                  error: Optional[BaseException] = None):
+        """Cache a led lookup's response (or error) and hand it to the waiting callers"""
+        if error is None:
+            self.put(task_id, response)
+        with self._lock:
+            if self._inflight.get(task_id) is future:
+                del self._inflight[task_id]
+        if error is None:
+            future.set_result(response)
+        else:
+            future.set_exception(error)
+
+    def fetch(self, task_id: str, loader: Callable[[], Dict]) -> Dict:
+        """Return the cached response or call loader() and cache its result
+
+        Concurrent calls for the same task share a single loader() call.
+        """
+        cached = self.get(task_id)
+        if cached is not None:
+            return cached
+        future, leader = self.begin_fetch(task_id)
+        if not leader:
+            return future.result()
+        try:
+            response = loader()
+        except BaseException as e:
+            self.end_fetch(task_id, future, error=e)
+            raise
+        self.end_fetch(task_id, future, response)
+        return response
+
+    def result_urls(self, task_id: str) -> List[str]:
+        """Parsed resultUrls of a cached task (empty if unknown)"""
+        with self._lock:
+            entry = self._terminal.get(task_id) or self._pending.get(task_id)
+            return list(entry.result_urls) if entry is not None else []
+
+    def invalidate(self, task_id: str):
+        with self._lock:
+            self._terminal.pop(task_id, None)
+            self._pending.pop(task_id, None)
+
+    def clear(self):
+        with self._lock:
+            self._terminal.clear()
+            self._pending.clear()
+
+    def __len__(self) -> int:
+        with self._lock:
+            return len(self._terminal) + len(self._pending)
+
+
+_cache: Optional[TaskResultCache] = None
+_cache_lock = threading.Lock()
+
+
+def get_result_cache() -> TaskResultCache:
+    """Return the process-wide task result cache"""
+    global _cache
+    if _cache is None:
+        with _cache_lock:
+            if _cache is None:
+                _cache = TaskResultCache()
+    return _cache
@@ -0,0 +1,192 @@
+"""Embedded receiver for kie.ai callBackUrl completion notifications.
+
+The receiver runs as a daemon thread inside the Streamlit process and feeds
+every payload it gets into the shared task result cache and task store, so
+finished tasks are known without polling recordInfo.
+
+Configuration (environment variables):
+    SORA_CALLBACK_PUBLIC_URL  externally reachable base URL that routes to
+                              the receiver, e.g. https://hooks.example.com
+                              (the receiver stays off when this is unset)
+    SORA_CALLBACK_HOST        bind address (default 0.0.0.0)
+    SORA_CALLBACK_PORT        bind port (default 8765)
+    SORA_CALLBACK_TOKEN       shared secret appended to the callback URL
+                              (random per process when unset)
+"""
+import json
+import os
+import secrets
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Callable, Dict, List, Optional
+from urllib.parse import parse_qs, urlsplit
+
+from sora_core.cache import TaskResultCache, get_result_cache
+from sora_core.store import get_task_store
+
+CALLBACK_PATH = "/kie/callback"
+HEALTH_PATH = "/healthz"
+DEFAULT_HOST = "0.0.0.0"
+DEFAULT_PORT = 8765
+MAX_BODY_BYTES = 1024 * 1024
+
+# With push notifications active, waiting tasks are only re-polled this often as a safety net
+CALLBACK_FALLBACK_TTL = 120.0
+
+
+def normalize_payload(payload: Dict) -> Optional[Dict]:
+    """Wrap a callback body into the recordInfo {code, msg, data} envelope"""
+    if not isinstance(payload, dict):
+        return None
+    if isinstance(payload.get("data"), dict):
+        envelope = dict(payload)
+        envelope.setdefault("code", 200)
+    else:
+        envelope = {"code": 200, "msg": "callback", "data": payload}
+    if not envelope["data"].get("taskId"):
+        return None
+    return envelope
+
+
+class CallbackReceiver:
+    """Small HTTP server that ingests completion callbacks"""
+
+    def __init__(self, public_url: str, host: str = DEFAULT_HOST, port: int = DEFAULT_PORT,
+                 token: Optional[str] = None, cache: Optional[TaskResultCache] = None):
+        self.public_url = public_url.rstrip("/")
+        self.host = host
+        self.port = port
+        self.token = token or secrets.token_urlsafe(16)
+        self.cache = cache if cache is not None else get_result_cache()
+        self.listeners: List[Callable[[Dict], None]] = []
+        self.received = 0
+        self.last_received_at: Optional[float] = None
+        self._server: Optional[ThreadingHTTPServer] = None
+        self._thread: Optional[threading.Thread] = None
+
+    @property
+    def callback_url(self) -> str:
+        return f"{self.public_url}{CALLBACK_PATH}?token={self.token}"
+
+    @property
+    def running(self) -> bool:
+        return self._thread is not None and self._thread.is_alive()
+
+    def ingest(self, payload: Dict) -> bool:
+        """Store one callback payload; returns False if it is not usable"""
+        envelope = normalize_payload(payload)
+        if envelope is None:
+            return False
+        self.cache.put(envelope["data"]["taskId"], envelope)
+        self.received += 1
+        self.last_received_at = time.time()
+        for listener in list(self.listeners):
+            try:
+                listener(envelope)
+            except Exception:
+                pass
+        return True
+
+    def _make_handler(self):
+        receiver = self
+
+        class Handler(BaseHTTPRequestHandler):
+            def _reply(self, status: int, body: Dict):
+                data = json.dumps(body).encode()
+                self.send_response(status)
+                self.send_header("Content-Type", "application/json")
+                self.send_header("Content-Length", str(len(data)))
+                self.end_headers()
+                self.wfile.write(data)
+
+            def do_GET(self):
+                if urlsplit(self.path).path == HEALTH_PATH:
+                    self._reply(200, {"code": 200, "msg": "ok", "received": receiver.received})
+                else:
+                    self._reply(404, {"code": 404, "msg": "Not found"})
+
+            def do_POST(self):
+                url = urlsplit(self.path)
+                if url.path != CALLBACK_PATH:
+                    self._reply(404, {"code": 404, "msg": "Not found"})
+                    return
+                token = parse_qs(url.query).get("token", [""])[0]
+                if not secrets.compare_digest(token, receiver.token):
+                    self._reply(403, {"code": 403, "msg": "Invalid token"})
+                    return
+                length = int(self.headers.get("Content-Length") or 0)
+                if length <= 0 or length > MAX_BODY_BYTES:
+                    status = 413 if length > 0 else 400
+                    self._reply(status, {"code": status, "msg": "Invalid body size"})
+                    return
+                try:
+                    payload = json.loads(self.rfile.read(length))
+                except ValueError:
+                    self._reply(400, {"code": 400, "msg": "Invalid JSON"})
+                    return
+                if receiver.ingest(payload):
+                    self._reply(200, {"code": 200, "msg": "ok"})
+                else:
+                    self._reply(422, {"code": 422, "msg": "Missing taskId"})
+
+            def log_message(self, format, *args):
+                pass
+
+        return Handler
+
+    def start(self):
+        if self.running:
+            return
+        self._server = ThreadingHTTPServer((self.host, self.port), self._make_handler())
+        self._server.daemon_threads = True
+        self.port = self._server.server_address[1]
+        self._thread = threading.Thread(target=self._server.serve_forever, name="kie-callbacks", daemon=True)
+        self._thread.start()
+
+    def stop(self):
+        if self._server is not None:
+            self._server.shutdown()
+            self._server.server_close()
+        self._server = None
+        self._thread = None
+
+
+_receiver: Optional[CallbackReceiver] = None
+_receiver_failed = False
+_receiver_lock = threading.Lock()
+
+
+def start_callback_receiver() -> Optional[CallbackReceiver]:
+    """Start the process-wide receiver if SORA_CALLBACK_PUBLIC_URL is configured"""
+    global _receiver, _receiver_failed
+    if _receiver is not None or _receiver_failed:
+        return _receiver
+    public_url = os.environ.get("SORA_CALLBACK_PUBLIC_URL", "").strip()
+    if not public_url:
+        return None
+    with _receiver_lock:
+        if _receiver is None and not _receiver_failed:
+            receiver = CallbackReceiver(
+                public_url,
+                host=os.environ.get("SORA_CALLBACK_HOST", DEFAULT_HOST),
+                port=int(os.environ.get("SORA_CALLBACK_PORT", DEFAULT_PORT)),
+                token=os.environ.get("SORA_CALLBACK_TOKEN") or None,
+            )
+            try:
+                receiver.start()
+            except OSError:
+                # Port already taken (e.g. by another app variant); stay on polling
+                # for the life of the process instead of retrying on every rerun
+                _receiver_failed = True
+                return None
+            receiver.listeners.append(get_task_store().record_response)
+            receiver.cache.pending_ttl = max(receiver.cache.pending_ttl, CALLBACK_FALLBACK_TTL)
+            _receiver = receiver
+    return _receiver
+
+
+def get_callback_url() -> Optional[str]:
+    """callBackUrl to attach to new tasks, or None when the receiver is off"""
+    receiver = start_callback_receiver()
+    return receiver.callback_url if receiver is not None else None
@@ -0,0 +1,206 @@
+"""Headless command-line runner sharing the apps' API client.
+
+Examples:
+    python -m sora_core submit urls.txt -o results.jsonl
+    python -m sora_core status TASK_ID [TASK_ID ...]
+    python -m sora_core download --results results.jsonl
+
+The API key is read from --api-key or the KIE_API_KEY environment variable.
+--base-url (or SORA_API_BASE_URL) points the runner at another deployment of
+the jobs API, such as the local mock in sora_core.mock_server.
+Nothing here imports streamlit or plotly, so startup stays cheap for cron jobs.
+Status polling runs on the asyncio client (sora_core.aio), so --workers
+requests are in flight at once without a thread per request.
+"""
+import argparse
+import json
+import os
+import sys
+import time
+from functools import partial
+from typing import Callable, Dict, List, Optional, TextIO
+
+from sora_core.api import query_task
+from sora_core.bulk import BULK_MAX_WORKERS, BULK_RATE_PER_SEC, parse_url_list, split_valid_urls, submit_bulk
+from sora_core.cache import TERMINAL_STATES, get_result_cache
+from sora_core.client import BASE_URL, configure_client, get_client
+from sora_core.downloads import DOWNLOAD_MAX_WORKERS, get_artifact_cache
+from sora_core.models import Task
+from sora_core.polling import poll_due_tasks
+from sora_core.scheduler import BASE_INTERVAL, MAX_INTERVAL, PollScheduler
+
+
+def result_record(video_url: Optional[str], task_id: Optional[str], response: Optional[Dict],
+                  error: Optional[str] = None) -> Dict:
+    """One JSON Lines output record"""
+    data = (response or {}).get("data") or {}
+    record = {
+        "video_url": video_url,
+        "taskId": task_id,
+        "state": data.get("state"),
+        "resultUrls": get_result_cache().result_urls(task_id) if task_id else [],
+        "costTime": data.get("costTime"),
+        "failCode": data.get("failCode"),
+        "failMsg": data.get("failMsg"),
+    }
+    if error:
+        record["error"] = error
+    return record
+
+
+def task_poller(max_workers: int) -> Callable[[str, List[str]], Dict[str, Dict]]:
+    """poll_many(api_key, task_ids) over the asyncio client, `max_workers` requests in flight"""
+    # Imported here: aiohttp is only needed once tasks are polled
+    from sora_core.aio import query_tasks_sync
+    return partial(query_tasks_sync, concurrency=max_workers)
+
+
+def write_record(out: TextIO, record: Dict):
+    out.write(json.dumps(record) + "\n")
+    out.flush()
+
+
+def wait_for_tasks(api_key: str, pending: Dict[str, str], submitted_at: Dict[str, float], out: TextIO,
+                   scheduler: PollScheduler, timeout: Optional[float], max_workers: int) -> int:
+    """Poll until every task is terminal, writing each as it finishes; returns the failure count"""
+    failures = 0
+    deadline = None if timeout is None else time.time() + timeout
+    while pending:
+        tasks = [Task(task_id, video_url, created_at=submitted_at[task_id]) for task_id, video_url in pending.items()]
+        results = poll_due_tasks(query_task, api_key, tasks, scheduler, poll_many=task_poller(max_workers))
+        for task_id, response in results.items():
+            state = ((response.get("data") or {}).get("state")) if response.get("code") == 200 else None
+            if state in TERMINAL_STATES:
+                write_record(out, result_record(pending.pop(task_id), task_id, response))
+                failures += state != "success"
+        if not pending:
+            break
+        # Sleep until the next task is due on its adaptive schedule
+        wake_at = scheduler.next_poll_at(pending) or time.time() + scheduler.base_interval
+        if deadline is not None and wake_at > deadline:
+            for task_id, video_url in pending.items():
+                write_record(out, result_record(video_url, task_id, results.get(task_id), error="Timed out"))
+            return failures + len(pending)
+        time.sleep(max(0.0, wake_at - time.time()))
+    return failures
+
+
+def cmd_submit(args, api_key: str, out: TextIO) -> int:
+    with open(args.file, "rb") as f:
+        urls = parse_url_list(f.read())
+    valid_urls, invalid_urls = split_valid_urls(urls)
+    failures = len(invalid_urls)
+    for url, error in invalid_urls:
+        write_record(out, result_record(url, None, None, error=error))
+
+    store = None
+    if args.store:
+        from sora_core.store import get_task_store, owner_key
+        store, owner = get_task_store(), owner_key(api_key)
+
+    pending: Dict[str, str] = {}
+    submitted_at: Dict[str, float] = {}
+    for url, response in submit_bulk(get_client().create_task, api_key, valid_urls, args.callback_url,
+                                     max_workers=args.workers, rate_per_sec=args.rate):
+        if response.get("code") == 200:
+            task_id = response["data"]["taskId"]
+            pending[task_id] = url
+            submitted_at[task_id] = time.time()
+            if store is not None:
+                store.add_task(owner, task_id, url, args.callback_url)
+            if not args.wait:
+                write_record(out, result_record(url, task_id, None))
+        else:
+            failures += 1
+            write_record(out, result_record(url, None, response, error=response.get("msg", "Unknown error")))
+
+    created = len(pending)
+    if args.wait:
+        scheduler = PollScheduler(base_interval=args.poll_interval, max_interval=max(args.poll_interval, MAX_INTERVAL))
+        if store is not None:
+            for seconds in store.recent_cost_times():
+                scheduler.model.add(seconds)
+        failures += wait_for_tasks(api_key, pending, submitted_at, out, scheduler, args.timeout, args.workers)
+    print(f"{len(urls)} URLs, {created} tasks created, {failures} failed", file=sys.stderr)
+    return 1 if failures else 0
+
+
+def cmd_status(args, api_key: str, out: TextIO) -> int:
+    results = task_poller(args.workers)(api_key, args.task_ids)
+    failures = 0
+    for task_id, response in results.items():
+        if response.get("code") != 200:
+            failures += 1
+            write_record(out, result_record(None, task_id, None, error=response.get("msg", "Unknown error")))
+        else:
+            write_record(out, result_record(None, task_id, response))
+    return 1 if failures else 0
+
+
+def cmd_download(args, api_key: str, out: TextIO) -> int:
+    urls: List[str] = list(args.urls)
+    if args.task_ids:
+        results = task_poller(args.workers)(api_key, args.task_ids)
+        for task_id, response in results.items():
+            state = (response.get("data") or {}).get("state") if response.get("code") == 200 else None
+            if state == "success":
+                urls.extend(get_result_cache().result_urls(task_id))
+            else:
+                write_record(out, result_record(None, task_id, response, error=f"No result to download ({state or response.get('msg')})"))
+    if args.results:
+        with open(args.results, encoding="utf-8") as f:
+            for line in f:
+                line = line.strip()
+                if line:
+                    urls.extend(json.loads(line).get("resultUrls") or [])
+
+    failures = 0
+    for artifact in get_artifact_cache().download_many(urls, max_workers=args.parallel):
+        failures += artifact.error is not None
+        write_record(out, artifact.to_dict())
+    return 1 if failures else 0
+
+
+def build_parser() -> argparse.ArgumentParser:
+    parser = argparse.ArgumentParser(prog="python -m sora_core", description="Headless Sora watermark removal runner")
+    parser.add_argument("--api-key", default=os.environ.get("KIE_API_KEY", ""), help="API key (default: $KIE_API_KEY)")
+    parser.add_argument("--base-url", default=os.environ.get("SORA_API_BASE_URL") or BASE_URL,
+                        help="Jobs API base URL, e.g. a local mock (default: $SORA_API_BASE_URL or the kie.ai API)")
+    parser.add_argument("-o", "--output", default="-", help="JSON Lines output file (default: stdout)")
+    parser.add_argument("--workers", type=int, default=BULK_MAX_WORKERS, help="Concurrent API requests")
+    sub = parser.add_subparsers(dest="command", required=True)
+
+    submit = sub.add_parser("submit", help="Submit every URL in a CSV/text file")
+    submit.add_argument("file", help="CSV or text file containing Sora URLs")
+    submit.add_argument("--callback-url", default=None, help="callBackUrl sent with every task")
+    submit.add_argument("--rate", type=float, default=BULK_RATE_PER_SEC, help="Max submissions per second")
+    submit.add_argument("--no-wait", dest="wait", action="store_false", help="Do not wait for completion")
+    submit.add_argument("--poll-interval", type=float, default=BASE_INTERVAL,
+                        help="Seconds between polls until enough completions are seen to adapt")
+    submit.add_argument("--timeout", type=float, default=None, help="Give up waiting after this many seconds")
+    submit.add_argument("--store", action="store_true", help="Record tasks in the shared task store")
+    submit.set_defaults(func=cmd_submit)
+
+    status = sub.add_parser("status", help="Query the status of existing tasks")
+    status.add_argument("task_ids", nargs="+", metavar="TASK_ID")
+    status.set_defaults(func=cmd_status)
+
+    download = sub.add_parser("download", help="Download result videos into the local artifact cache")
+    download.add_argument("task_ids", nargs="*", metavar="TASK_ID", help="Download the results of these tasks")
+    download.add_argument("--results", default=None, help="JSON Lines output of a previous run to take resultUrls from")
+    download.add_argument("--url", dest="urls", action="append", default=[], help="Result URL to download (repeatable)")
+    download.add_argument("--parallel", type=int, default=DOWNLOAD_MAX_WORKERS, help="Concurrent downloads")
+    download.set_defaults(func=cmd_download)
+    return parser
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    parser = build_parser()
+    args = parser.parse_args(argv)
+    if not args.api_key:
+        parser.error("an API key is required (--api-key or KIE_API_KEY)")
+    configure_client(args.base_url)
+    if args.output == "-":
+        return args.func(args, args.api_key, sys.stdout)
+    with open(args.output, "a", encoding="utf-8") as out:
+        return args.func(args, args.api_key, out)
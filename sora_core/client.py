@@ -0,0 +1,232 @@
+"""Pooled HTTP client for the kie.ai jobs API.
+
+Every request first takes a token from the API key's governor (see
+sora_core.ratelimit), and a 429 pauses that key for its Retry-After before
+the request is retried, so all sessions in the process share one budget.
+Each call's latency, status, size and retries go to sora_core.telemetry.
+
+Set SORA_API_BASE_URL to point every app variant and the CLI at another
+deployment of the jobs API, e.g. the local mock in sora_core.mock_server.
+"""
+import os
+import threading
+import time
+from datetime import datetime, timezone
+from email.utils import parsedate_to_datetime
+from typing import Dict, Mapping, Optional
+
+import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+
+from sora_core.ratelimit import current_lane, get_api_governor, rate_limited_response
+from sora_core.telemetry import NO_RESPONSE, get_telemetry
+
+BASE_URL = "https://api.kie.ai/api/v1/jobs"
+MODEL_NAME = "sora-watermark-remover"
+
+# Connection pool sizing: one pool per host, enough sockets for concurrent polling
+POOL_CONNECTIONS = 4
+POOL_MAXSIZE = 32
+
+# (connect, read) timeouts in seconds
+DEFAULT_TIMEOUT = (5, 30)
+
+HTTP_ERROR_MESSAGES = {
+    401: "Invalid API Key",
+    402: "Insufficient Balance",
+    429: "Rate Limit Exceeded",
+}
+
+# 429 responses retried (after the governor's pause) before giving up
+MAX_RATE_LIMIT_RETRIES = 2
+
+
+def _retry_after(headers: Mapping[str, str]) -> Optional[float]:
+    """Seconds from a Retry-After header (delta-seconds or HTTP-date)"""
+    value = headers.get("Retry-After", "").strip()
+    if not value:
+        return None
+    if value.isdigit():
+        return float(value)
+    try:
+        return max(0.0, (parsedate_to_datetime(value) - datetime.now(timezone.utc)).total_seconds())
+    except (TypeError, ValueError):
+        return None
+
+
+def _transport_retries(response: requests.Response) -> int:
+    """Retries urllib3 made (connection errors, 5xx) before returning this response"""
+    retries = getattr(response.raw, "retries", None)
+    return len(retries.history) if retries is not None else 0
+
+
+def parse_envelope(status_code: int, body, headers: Mapping[str, str]) -> Dict:
+    """The API's {code, msg, data} envelope from a status code and decoded JSON body (None if invalid)"""
+    if status_code >= 400:
+        if isinstance(body, dict) and "code" in body:
+            return body
+        msg = HTTP_ERROR_MESSAGES.get(status_code, f"HTTP Error: {status_code}")
+        error = {"code": status_code, "msg": msg}
+        retry_after = _retry_after(headers)
+        if retry_after is not None:
+            error["retry_after"] = retry_after
+        return error
+    if body is None:
+        return {"code": 500, "msg": "Invalid JSON response"}
+    return body
+
+
+class _QueryRetry(Retry):
+    # 429 is left to the governor, which pauses every caller using the key
+    RETRY_AFTER_STATUS_CODES = frozenset({413, 503})
+
+
+def _query_retry_policy() -> Retry:
+    """Transport retry policy for idempotent status queries only (createTask is never retried here)"""
+    return _QueryRetry(
+        total=3,
+        connect=3,
+        read=2,
+        backoff_factor=0.5,
+        status_forcelist=(500, 502, 503, 504),
+        allowed_methods=frozenset({"GET"}),
+        respect_retry_after_header=True,
+        raise_on_status=False,
+    )
+
+
+class KieClient:
+    """Thread-safe API client holding a keep-alive connection pool"""
+
+    def __init__(self, base_url: str = BASE_URL, timeout=DEFAULT_TIMEOUT):
+        self.base_url = base_url.rstrip("/")
+        self.timeout = timeout
+        self.session = requests.Session()
+        adapter = HTTPAdapter(
+            pool_connections=POOL_CONNECTIONS,
+            pool_maxsize=POOL_MAXSIZE,
+            max_retries=_query_retry_policy(),
+        )
+        self.session.mount("https://", adapter)
+        self.session.mount("http://", adapter)
+        self.session.headers.update({"Connection": "keep-alive"})
+
+    @property
+    def create_task_url(self) -> str:
+        return f"{self.base_url}/createTask"
+
+    @property
+    def query_task_url(self) -> str:
+        return f"{self.base_url}/recordInfo"
+
+    @staticmethod
+    def _parse(response: requests.Response) -> Dict:
+        """Turn an HTTP response into the API's {code, msg, data} envelope"""
+        try:
+            body = response.json()
+        except ValueError:
+            body = None
+        return parse_envelope(response.status_code, body, response.headers)
+
+    def _send(self, api_key: str, endpoint: str, method: str, url: str, **kwargs) -> Dict:
+        """Governed request: wait for budget, back off and retry on 429; recorded in telemetry"""
+        governor = get_api_governor(api_key)
+        lane = current_lane()
+        attempts = 0
+        retries = 0
+        elapsed = 0.0
+        response = None
+        try:
+            for attempt in range(MAX_RATE_LIMIT_RETRIES + 1):
+                if not governor.acquire(lane):
+                    return rate_limited_response(governor.wait_time(lane))
+                attempts += 1
+                response = None
+                start = time.perf_counter()
+                try:
+                    response = self.session.request(method, url, timeout=self.timeout, **kwargs)
+                finally:
+                    elapsed += time.perf_counter() - start
+                retries += attempt > 0
+                retries += _transport_retries(response)
+                result = self._parse(response)
+                if result.get("code") != 429:
+                    return result
+                governor.penalize(result.get("retry_after"), attempt)
+            return result
+        finally:
+            if attempts:
+                get_telemetry().record(
+                    endpoint, elapsed,
+                    response.status_code if response is not None else NO_RESPONSE,
+                    len(response.content) if response is not None else 0,
+                    len(response.request.body or b"") if response is not None else 0,
+                    retries,
+                )
+
+    def create_task(self, api_key: str, video_url: str, callback_url: Optional[str] = None) -> Dict:
+        """Create a watermark removal task"""
+        headers = {
+            "Authorization": f"Bearer {api_key}",
+            "Content-Type": "application/json"
+        }
+
+        payload = {
+            "model": MODEL_NAME,
+            "input": {
+                "video_url": video_url
+            }
+        }
+
+        if callback_url:
+            payload["callBackUrl"] = callback_url
+
+        try:
+            return self._send(api_key, "createTask", "POST", self.create_task_url, headers=headers, json=payload)
+        except requests.exceptions.RequestException as e:
+            return {"code": 500, "msg": f"Request failed: {e}"}
+        except Exception as e:
+            return {"code": 500, "msg": f"Error: {str(e)}"}
+
+    def query_task(self, api_key: str, task_id: str) -> Dict:
+        """Query task status"""
+        headers = {
+            "Authorization": f"Bearer {api_key}"
+        }
+
+        params = {"taskId": task_id}
+
+        try:
+            return self._send(api_key, "recordInfo", "GET", self.query_task_url, headers=headers, params=params)
+        except requests.exceptions.RequestException as e:
+            return {"code": 500, "msg": f"Request failed: {e}"}
+        except Exception as e:
+            return {"code": 500, "msg": f"Error: {str(e)}"}
+
+    def close(self):
+        self.session.close()
+
+
+_client: Optional[KieClient] = None
+_client_lock = threading.Lock()
+
+
+def get_client() -> KieClient:
+    """Return the process-wide client, creating it on first use"""
+    global _client
+    if _client is None:
+        with _client_lock:
+            if _client is None:
+                _client = KieClient(os.environ.get("SORA_API_BASE_URL") or BASE_URL)
+    return _client
+
+
+def configure_client(base_url: str) -> KieClient:
+    """Replace the process-wide client with one talking to `base_url`"""
+    global _client
+    with _client_lock:
+        previous, _client = _client, KieClient(base_url)
+    if previous is not None:
+        previous.close()
+    return _client
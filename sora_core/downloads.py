@@ -0,0 +1,241 @@
+"""Streaming downloader for result videos with a local artifact cache.
+
+Results are streamed to disk in fixed-size chunks (memory use does not grow
+with file size), resumed with HTTP Range requests after an interruption and
+verified before they are published into the cache. The cache is content
+addressed: every file is stored once under its SHA-256, and a small per-URL
+index entry maps each result URL to the content it produced, so the same URL
+is never fetched twice and identical videos behind different URLs share one
+file.
+
+Layout under the artifact directory (SORA_ARTIFACT_DIR, default
+.sora/artifacts):
+
+    objects/ab/abcdef....mp4   verified content, named by SHA-256
+    urls/<sha256(url)>.json    {"url", "sha256", "size", "path"}
+    partial/<sha256(url)>.part in-progress downloads, resumed on retry
+"""
+import base64
+import hashlib
+import json
+import os
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from typing import Dict, Iterable, Iterator, Optional
+
+import requests
+from requests.adapters import HTTPAdapter
+
+from sora_core.telemetry import NO_RESPONSE, get_telemetry
+
+DEFAULT_ARTIFACT_DIR = os.path.join(".sora", "artifacts")
+CHUNK_SIZE = 1024 * 1024
+DOWNLOAD_MAX_WORKERS = 4
+MAX_DOWNLOAD_ATTEMPTS = 4
+RETRY_BACKOFF = 1.0
+
+# (connect, read) timeouts in seconds; the read timeout applies per chunk
+DOWNLOAD_TIMEOUT = (5, 60)
+
+
+class DownloadError(Exception):
+    pass
+
+
+class Artifact:
+    __slots__ = ("url", "path", "sha256", "size", "cached", "error")
+
+    def __init__(self, url: str, path: Optional[str] = None, sha256: Optional[str] = None,
+                 size: Optional[int] = None, cached: bool = False, error: Optional[str] = None):
+        self.url = url
+        self.path = path
+        self.sha256 = sha256
+        self.size = size
+        self.cached = cached
+        self.error = error
+
+    def to_dict(self) -> Dict:
+        return {name: getattr(self, name) for name in self.__slots__}
+
+
+def _url_key(url: str) -> str:
+    return hashlib.sha256(url.encode("utf-8")).hexdigest()
+
+
+def _content_md5(response: requests.Response) -> Optional[bytes]:
+    """Decoded Content-MD5 header, if the server sent one"""
+    value = response.headers.get("Content-MD5")
+    if not value:
+        return None
+    try:
+        return base64.b64decode(value)
+    except ValueError:
+        return None
+
+
+def _expected_size(response: requests.Response, offset: int) -> Optional[int]:
+    """Total file size from Content-Range (206) or Content-Length (200)"""
+    if response.status_code == 206:
+        total = response.headers.get("Content-Range", "").rpartition("/")[2]
+        return int(total) if total.isdigit() else None
+    length = response.headers.get("Content-Length", "")
+    return int(length) if length.isdigit() else None
+
+
+class ArtifactCache:
+    """Content-addressed store of downloaded result files; safe to share between threads"""
+
+    def __init__(self, directory: str = DEFAULT_ARTIFACT_DIR, chunk_size: int = CHUNK_SIZE,
+                 timeout=DOWNLOAD_TIMEOUT, pool_size: int = DOWNLOAD_MAX_WORKERS * 2):
+        self.directory = directory
+        self.chunk_size = chunk_size
+        self.timeout = timeout
+        for sub in ("objects", "urls", "partial"):
+            os.makedirs(os.path.join(directory, sub), exist_ok=True)
+        self.session = requests.Session()
+        adapter = HTTPAdapter(pool_connections=4, pool_maxsize=pool_size)
+        self.session.mount("https://", adapter)
+        self.session.mount("http://", adapter)
+        # One in-flight download per URL; concurrent callers wait for it
+        self._url_locks: Dict[str, threading.Lock] = {}
+        self._locks_lock = threading.Lock()
+
+    def object_path(self, sha256: str) -> str:
+        return os.path.join(self.directory, "objects", sha256[:2], f"{sha256}.mp4")
+
+    def _index_path(self, url: str) -> str:
+        return os.path.join(self.directory, "urls", f"{_url_key(url)}.json")
+
+    def _partial_path(self, url: str) -> str:
+        return os.path.join(self.directory, "partial", f"{_url_key(url)}.part")
+
+    def _lock_for(self, url: str) -> threading.Lock:
+        with self._locks_lock:
+            return self._url_locks.setdefault(url, threading.Lock())
+
+    def lookup(self, url: str) -> Optional[Artifact]:
+        """Cached artifact for a URL, if its content is present and intact in size"""
+        try:
+            with open(self._index_path(url), encoding="utf-8") as f:
+                entry = json.load(f)
+        except (OSError, ValueError):
+            return None
+        path = self.object_path(entry["sha256"])
+        if not os.path.exists(path) or os.path.getsize(path) != entry["size"]:
+            return None
+        return Artifact(url, path, entry["sha256"], entry["size"], cached=True)
+
+    def download(self, url: str, expected_sha256: Optional[str] = None) -> Artifact:
+        """Fetch a URL into the cache (or return the cached copy); never raises"""
+        with self._lock_for(url):
+            artifact = self.lookup(url)
+            if artifact is not None:
+                return artifact
+            error = None
+            for attempt in range(MAX_DOWNLOAD_ATTEMPTS):
+                try:
+                    return self._fetch(url, expected_sha256, attempt)
+                except DownloadError as e:
+                    # Verification failures restart from scratch, so retrying is still useful
+                    error = str(e)
+                except (requests.exceptions.RequestException, OSError) as e:
+                    # The partial file is kept and the next attempt resumes from it
+                    error = f"Download failed: {e}"
+                if attempt + 1 < MAX_DOWNLOAD_ATTEMPTS:
+                    time.sleep(RETRY_BACKOFF * (2 ** attempt))
+            return Artifact(url, error=error)
+
+    def _fetch(self, url: str, expected_sha256: Optional[str], attempt: int = 0) -> Artifact:
+        partial = self._partial_path(url)
+        offset = os.path.getsize(partial) if os.path.exists(partial) else 0
+        headers = {"Range": f"bytes={offset}-"} if offset else {}
+
+        status = NO_RESPONSE
+        received = 0
+        start = time.perf_counter()
+        try:
+            with self.session.get(url, headers=headers, stream=True, timeout=self.timeout) as response:
+                status = response.status_code
+                if response.status_code == 416:
+                    # Our partial file is not a prefix of the current content
+                    os.remove(partial)
+                    raise DownloadError("Stale partial download discarded")
+                if response.status_code not in (200, 206):
+                    raise DownloadError(f"HTTP Error: {response.status_code}")
+                if response.status_code == 200:
+                    # Server ignored the Range header: start over
+                    offset = 0
+                expected_size = _expected_size(response, offset)
+                expected_md5 = _content_md5(response) if offset == 0 else None
+
+                sha256 = hashlib.sha256()
+                md5 = hashlib.md5() if expected_md5 is not None else None
+                if offset:
+                    # Re-hash the bytes we already have; reads are chunked too
+                    with open(partial, "rb") as f:
+                        for chunk in iter(lambda: f.read(self.chunk_size), b""):
+                            sha256.update(chunk)
+
+                with open(partial, "ab" if offset else "wb") as f:
+                    for chunk in response.iter_content(chunk_size=self.chunk_size):
+                        if chunk:
+                            f.write(chunk)
+                            received += len(chunk)
+                            sha256.update(chunk)
+                            if md5 is not None:
+                                md5.update(chunk)
+        finally:
+            get_telemetry().record("download", time.perf_counter() - start, status, received, retries=attempt)
+
+        size = os.path.getsize(partial)
+        digest = sha256.hexdigest()
+        if expected_size is not None and size != expected_size:
+            if size > expected_size:
+                os.remove(partial)
+                raise DownloadError(f"Size mismatch: got {size} bytes, expected {expected_size}")
+            raise requests.exceptions.ConnectionError(f"Incomplete download: {size} of {expected_size} bytes")
+        if (md5 is not None and md5.digest() != expected_md5) or (expected_sha256 and digest != expected_sha256):
+            os.remove(partial)
+            raise DownloadError("Checksum mismatch")
+
+        path = self.object_path(digest)
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        if os.path.exists(path) and os.path.getsize(path) == size:
+            # Same content already cached under another URL
+            os.remove(partial)
+        else:
+            os.replace(partial, path)
+        self._write_index(url, digest, size, path)
+        return Artifact(url, path, digest, size)
+
+    def _write_index(self, url: str, sha256: str, size: int, path: str):
+        index_path = self._index_path(url)
+        tmp_path = f"{index_path}.tmp"
+        with open(tmp_path, "w", encoding="utf-8") as f:
+            json.dump({"url": url, "sha256": sha256, "size": size, "path": path}, f)
+        os.replace(tmp_path, index_path)
+
+    def download_many(self, urls: Iterable[str], max_workers: int = DOWNLOAD_MAX_WORKERS) -> Iterator[Artifact]:
+        """Download URLs with at most `max_workers` transfers in flight, yielding as each finishes"""
+        unique_urls = list(dict.fromkeys(urls))
+        if not unique_urls:
+            return
+        with ThreadPoolExecutor(max_workers=max(1, min(max_workers, len(unique_urls)))) as executor:
+            futures = [executor.submit(self.download, url) for url in unique_urls]
+            for future in as_completed(futures):
+                yield future.result()
+
+
+_artifacts: Optional[ArtifactCache] = None
+_artifacts_lock = threading.Lock()
+
+
+def get_artifact_cache() -> ArtifactCache:
+    """Return the process-wide artifact cache"""
+    global _artifacts
+    if _artifacts is None:
+        with _artifacts_lock:
+            if _artifacts is None:
+                _artifacts = ArtifactCache(os.environ.get("SORA_ARTIFACT_DIR", DEFAULT_ARTIFACT_DIR))
+    return _artifacts
@@ -0,0 +1,23 @@
+"""Display helpers shared by the apps."""
+from datetime import datetime
+from typing import Optional
+
+STATUS_EMOJI = {
+    "waiting": "🟡",
+    "queuing": "🟡",
+    "generating": "🟡",
+    "success": "🟢",
+    "fail": "🔴",
+}
+
+
+def get_status_emoji(state: str) -> str:
+    """Get emoji for status"""
+    return STATUS_EMOJI.get((state or "").lower(), "⚪")
+
+
+def format_timestamp(timestamp: Optional[int]) -> str:
+    """Format an API timestamp (milliseconds) to a readable date"""
+    if timestamp:
+        return datetime.fromtimestamp(timestamp / 1000).strftime('%Y-%m-%d %H:%M:%S')
+    return "N/A"
@@ -0,0 +1,330 @@
+"""Local stand-in for the kie.ai jobs API (createTask and recordInfo).
+
+Responses use the same {code, msg, data} envelope as the real service.
+Tasks move through waiting -> generating -> success/fail, with the queue
+and processing times sampled from configurable distributions, so the apps,
+the CLI and the benchmarks can run without a real key or network access.
+
+    python -m sora_core.mock_server --port 8900 --cost-time lognormal:20,0.4
+    SORA_API_BASE_URL=http://127.0.0.1:8900/api/v1/jobs streamlit run app.py
+
+Distributions are written as `name:params` in seconds:
+
+    fixed:S  uniform:LO,HI  normal:MEAN,SD  lognormal:MEDIAN,SIGMA  exponential:MEAN
+
+Result URLs point back at the mock (/results/<taskId>.mp4), and tasks
+created with a callBackUrl get the completion payload POSTed to it.
+"""
+import argparse
+import heapq
+import json
+import math
+import random
+import secrets
+import sys
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Callable, Dict, List, Optional, Tuple
+from urllib.parse import parse_qs, urlsplit
+
+import requests
+
+from sora_core.client import MODEL_NAME
+from sora_core.ratelimit import TokenBucket
+
+API_PATH = "/api/v1/jobs"
+RESULTS_PATH = "/results/"
+DEFAULT_HOST = "127.0.0.1"
+DEFAULT_PORT = 8900
+DEFAULT_QUEUE_TIME = "uniform:0,2"
+DEFAULT_COST_TIME = "lognormal:20,0.4"
+MAX_BODY_BYTES = 1024 * 1024
+CALLBACK_TIMEOUT = 5
+
+# Served for every result URL: enough bytes to exercise the downloader
+RESULT_PAYLOAD = b"\x00\x00\x00\x18ftypmp42" + bytes(64 * 1024)
+
+Distribution = Callable[[random.Random], float]
+
+
+def parse_distribution(spec: str) -> Distribution:
+    """Sampler (seconds, never negative) for a `name:params` spec"""
+    name, _, params = spec.partition(":")
+    try:
+        args = [float(p) for p in params.split(",")] if params else []
+    except ValueError:
+        raise ValueError(f"Invalid distribution parameters: {spec!r}") from None
+    samplers = {
+        "fixed": (1, lambda rng, s: s),
+        "uniform": (2, lambda rng, lo, hi: rng.uniform(lo, hi)),
+        "normal": (2, lambda rng, mean, sd: rng.gauss(mean, sd)),
+        "lognormal": (2, lambda rng, median, sigma: rng.lognormvariate(math.log(median), sigma)),
+        "exponential": (1, lambda rng, mean: rng.expovariate(1.0 / mean)),
+    }
+    if name not in samplers:
+        raise ValueError(f"Unknown distribution {name!r} (expected one of: {', '.join(samplers)})")
+    arity, sample = samplers[name]
+    if len(args) != arity:
+        raise ValueError(f"{name} takes {arity} parameter(s), got {spec!r}")
+    return lambda rng: max(0.0, sample(rng, *args))
+
+
+class MockTask:
+    __slots__ = ("task_id", "video_url", "callback_url", "created_at", "started_at", "completed_at", "failed")
+
+    def __init__(self, task_id: str, video_url: str, callback_url: Optional[str],
+                 created_at: float, queue_time: float, cost_time: float, failed: bool):
+        self.task_id = task_id
+        self.video_url = video_url
+        self.callback_url = callback_url
+        self.created_at = created_at
+        self.started_at = created_at + queue_time
+        self.completed_at = self.started_at + cost_time
+        self.failed = failed
+
+    def state_at(self, now: float) -> str:
+        if now < self.started_at:
+            return "waiting"
+        if now < self.completed_at:
+            return "generating"
+        return "fail" if self.failed else "success"
+
+    def record(self, now: float, base_url: str) -> Dict:
+        """recordInfo `data` as of `now`"""
+        state = self.state_at(now)
+        done = state in ("success", "fail")
+        return {
+            "taskId": self.task_id,
+            "model": MODEL_NAME,
+            "state": state,
+            "param": json.dumps({"model": MODEL_NAME, "input": {"video_url": self.video_url}}),
+            "resultJson": json.dumps({"resultUrls": [f"{base_url}{RESULTS_PATH}{self.task_id}.mp4"]}) if state == "success" else "",
+            "failCode": "500" if state == "fail" else None,
+            "failMsg": "Simulated failure" if state == "fail" else None,
+            "costTime": int((self.completed_at - self.started_at) * 1000) if done else None,
+            "completeTime": int(self.completed_at * 1000) if done else None,
+            "createTime": int(self.created_at * 1000),
+        }
+
+
+class _MockHTTPServer(ThreadingHTTPServer):
+    daemon_threads = True
+    # The default backlog of 5 drops connections under concurrent load
+    request_queue_size = 128
+
+
+class MockKieServer:
+    """In-process HTTP server emulating the jobs API"""
+
+    def __init__(self, host: str = DEFAULT_HOST, port: int = DEFAULT_PORT,
+                 queue_time: str = DEFAULT_QUEUE_TIME, cost_time: str = DEFAULT_COST_TIME,
+                 fail_rate: float = 0.0, rate_limit: Optional[float] = None, seed: Optional[int] = None):
+        self.host = host
+        self.port = port
+        self.queue_time = parse_distribution(queue_time)
+        self.cost_time = parse_distribution(cost_time)
+        self.fail_rate = fail_rate
+        self.rate_limit = rate_limit
+        self.created = 0
+        self.queries = 0
+        self.rate_limited = 0
+        self._rng = random.Random(seed)
+        self._tasks: Dict[str, MockTask] = {}
+        self._buckets: Dict[str, TokenBucket] = {}
+        self._callbacks: List[Tuple[float, str]] = []
+        self._lock = threading.Lock()
+        self._wakeup = threading.Condition(self._lock)
+        self._server: Optional[ThreadingHTTPServer] = None
+        self._threads: List[threading.Thread] = []
+
+    @property
+    def url(self) -> str:
+        return f"http://{self.host}:{self.port}"
+
+    @property
+    def base_url(self) -> str:
+        """Value for SORA_API_BASE_URL / KieClient(base_url)"""
+        return f"{self.url}{API_PATH}"
+
+    @property
+    def running(self) -> bool:
+        return self._server is not None
+
+    def create(self, video_url: str, callback_url: Optional[str] = None) -> MockTask:
+        now = time.time()
+        with self._lock:
+            task = MockTask(
+                secrets.token_hex(16), video_url, callback_url, now,
+                self.queue_time(self._rng), self.cost_time(self._rng), self._rng.random() < self.fail_rate,
+            )
+            self._tasks[task.task_id] = task
+            self.created += 1
+            if callback_url:
+                heapq.heappush(self._callbacks, (task.completed_at, task.task_id))
+                self._wakeup.notify()
+        return task
+
+    def get(self, task_id: str) -> Optional[MockTask]:
+        with self._lock:
+            self.queries += 1
+            return self._tasks.get(task_id)
+
+    def _allow(self, api_key: str) -> float:
+        """0.0 if the key may make a request now, else seconds until it may"""
+        if not self.rate_limit:
+            return 0.0
+        with self._lock:
+            bucket = self._buckets.setdefault(api_key, TokenBucket(self.rate_limit))
+        wait = bucket.try_acquire()
+        if wait:
+            with self._lock:
+                self.rate_limited += 1
+        return wait
+
+    def _deliver_callbacks(self):
+        session = requests.Session()
+        while self._server is not None:
+            with self._lock:
+                while self._server is not None and (not self._callbacks or self._callbacks[0][0] > time.time()):
+                    timeout = self._callbacks[0][0] - time.time() if self._callbacks else None
+                    self._wakeup.wait(timeout)
+                if self._server is None:
+                    return
+                _, task_id = heapq.heappop(self._callbacks)
+                task = self._tasks[task_id]
+            payload = {"code": 200, "msg": "success", "data": task.record(time.time(), self.url)}
+            try:
+                session.post(task.callback_url, json=payload, timeout=CALLBACK_TIMEOUT)
+            except requests.exceptions.RequestException:
+                pass
+
+    def _make_handler(self):
+        mock = self
+
+        class Handler(BaseHTTPRequestHandler):
+            # Keep-alive like the real API, so pooled clients reuse connections;
+            # headers and body are separate writes, so Nagle would add ~40 ms
+            protocol_version = "HTTP/1.1"
+            disable_nagle_algorithm = True
+
+            def _reply(self, status: int, body: Dict, headers: Optional[Dict[str, str]] = None):
+                data = json.dumps(body).encode()
+                self.send_response(status)
+                self.send_header("Content-Type", "application/json")
+                self.send_header("Content-Length", str(len(data)))
+                for name, value in (headers or {}).items():
+                    self.send_header(name, value)
+                self.end_headers()
+                self.wfile.write(data)
+
+            def _api_key(self) -> Optional[str]:
+                """Bearer token of an authorized, not rate limited request (replies otherwise)"""
+                scheme, _, api_key = self.headers.get("Authorization", "").partition(" ")
+                if scheme != "Bearer" or not api_key.strip():
+                    self._reply(401, {"code": 401, "msg": "You do not have access permissions"})
+                    return None
+                wait = mock._allow(api_key)
+                if wait:
+                    self._reply(429, {"code": 429, "msg": "Rate Limit Exceeded"}, {"Retry-After": str(math.ceil(wait))})
+                    return None
+                return api_key
+
+            def do_GET(self):
+                url = urlsplit(self.path)
+                if url.path.startswith(RESULTS_PATH):
+                    self.send_response(200)
+                    self.send_header("Content-Type", "video/mp4")
+                    self.send_header("Content-Length", str(len(RESULT_PAYLOAD)))
+                    self.end_headers()
+                    self.wfile.write(RESULT_PAYLOAD)
+                    return
+                if url.path != f"{API_PATH}/recordInfo":
+                    self._reply(404, {"code": 404, "msg": "Not found"})
+                    return
+                if self._api_key() is None:
+                    return
+                task = mock.get(parse_qs(url.query).get("taskId", [""])[0])
+                if task is None:
+                    self._reply(200, {"code": 422, "msg": "recordInfo is null", "data": None})
+                    return
+                self._reply(200, {"code": 200, "msg": "success", "data": task.record(time.time(), mock.url)})
+
+            def do_POST(self):
+                if urlsplit(self.path).path != f"{API_PATH}/createTask":
+                    self._reply(404, {"code": 404, "msg": "Not found"})
+                    return
+                if self._api_key() is None:
+                    return
+                length = int(self.headers.get("Content-Length") or 0)
+                try:
+                    payload = json.loads(self.rfile.read(length)) if 0 < length <= MAX_BODY_BYTES else None
+                except ValueError:
+                    payload = None
+                if not isinstance(payload, dict):
+                    self._reply(400, {"code": 400, "msg": "Invalid JSON body"})
+                    return
+                video_url = (payload.get("input") or {}).get("video_url")
+                if payload.get("model") != MODEL_NAME or not video_url:
+                    self._reply(200, {"code": 422, "msg": "model and input.video_url are required", "data": None})
+                    return
+                task = mock.create(video_url, payload.get("callBackUrl"))
+                self._reply(200, {"code": 200, "msg": "success", "data": {"taskId": task.task_id}})
+
+            def log_message(self, format, *args):
+                pass
+
+        return Handler
+
+    def start(self) -> "MockKieServer":
+        if self.running:
+            return self
+        self._server = _MockHTTPServer((self.host, self.port), self._make_handler())
+        self.port = self._server.server_address[1]
+        self._threads = [
+            threading.Thread(target=self._server.serve_forever, name="kie-mock", daemon=True),
+            threading.Thread(target=self._deliver_callbacks, name="kie-mock-callbacks", daemon=True),
+        ]
+        for thread in self._threads:
+            thread.start()
+        return self
+
+    def stop(self):
+        server = self._server
+        if server is None:
+            return
+        with self._lock:
+            self._server = None
+            self._wakeup.notify_all()
+        server.shutdown()
+        server.server_close()
+        self._threads = []
+
+
+def main(argv=None) -> int:
+    parser = argparse.ArgumentParser(prog="python -m sora_core.mock_server", description="Local mock of the kie.ai jobs API")
+    parser.add_argument("--host", default=DEFAULT_HOST)
+    parser.add_argument("--port", type=int, default=DEFAULT_PORT)
+    parser.add_argument("--queue-time", default=DEFAULT_QUEUE_TIME, help=f"Seconds before processing starts (default: {DEFAULT_QUEUE_TIME})")
+    parser.add_argument("--cost-time", default=DEFAULT_COST_TIME, help=f"Processing seconds (default: {DEFAULT_COST_TIME})")
+    parser.add_argument("--fail-rate", type=float, default=0.0, help="Fraction of tasks that fail (default: 0)")
+    parser.add_argument("--rate-limit", type=float, default=None, help="Requests per second per key before answering 429")
+    parser.add_argument("--seed", type=int, default=None, help="Seed for reproducible timings")
+    args = parser.parse_args(argv)
+    try:
+        mock = MockKieServer(args.host, args.port, args.queue_time, args.cost_time,
+                             args.fail_rate, args.rate_limit, args.seed)
+    except ValueError as e:
+        parser.error(str(e))
+    mock.start()
+    print(f"Mock kie.ai API listening; set SORA_API_BASE_URL={mock.base_url}", flush=True)
+    try:
+        while True:
+            time.sleep(3600)
+    except KeyboardInterrupt:
+        mock.stop()
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
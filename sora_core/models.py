@@ -0,0 +1,163 @@
+"""Typed task record shared by the store, the pollers and the apps."""
+from datetime import datetime
+from enum import Enum
+from typing import Dict, Optional
+
+DATE_FORMAT = '%Y-%m-%d %H:%M:%S'
+
+
+class TaskState(str, Enum):
+    """recordInfo task states"""
+    WAITING = "waiting"
+    QUEUING = "queuing"
+    GENERATING = "generating"
+    SUCCESS = "success"
+    FAIL = "fail"
+
+    @property
+    def is_terminal(self) -> bool:
+        return self in (TaskState.SUCCESS, TaskState.FAIL)
+
+    @classmethod
+    def parse(cls, value) -> "TaskState":
+        """State from an API/database string; unknown values count as waiting"""
+        if isinstance(value, cls):
+            return value
+        try:
+            return cls(str(value).lower())
+        except ValueError:
+            return cls.WAITING
+
+
+def format_created_at(epoch: float) -> str:
+    return datetime.fromtimestamp(epoch).strftime(DATE_FORMAT)
+
+
+def _parse_created_at(value) -> Optional[float]:
+    """Epoch seconds from an epoch number or a DATE_FORMAT string"""
+    if value is None or value == "":
+        return None
+    if isinstance(value, (int, float)):
+        return float(value)
+    try:
+        return datetime.strptime(value, DATE_FORMAT).timestamp()
+    except (TypeError, ValueError):
+        return None
+
+
+class Task:
+    """One watermark removal task
+
+    Timestamps are epoch seconds and the state is a TaskState, so sorting and
+    filtering never parse strings; `created_text` formats for display.
+    """
+    __slots__ = ("task_id", "video_url", "state", "created_at", "cost_time", "priority",
+                 "callback_url", "fail_code", "fail_msg", "complete_time", "result_json")
+
+    def __init__(self, task_id: str, video_url: str = "", state=TaskState.WAITING,
+                 created_at: Optional[float] = None, cost_time: Optional[float] = None,
+                 priority: str = "Normal", callback_url: Optional[str] = None,
+                 fail_code: Optional[str] = None, fail_msg: Optional[str] = None,
+                 complete_time: Optional[float] = None, result_json: Optional[str] = None):
+        self.task_id = task_id
+        self.video_url = video_url
+        self.state = TaskState.parse(state)
+        self.created_at = created_at if created_at is not None else datetime.now().timestamp()
+        self.cost_time = cost_time
+        self.priority = priority
+        self.callback_url = callback_url
+        self.fail_code = fail_code
+        self.fail_msg = fail_msg
+        self.complete_time = complete_time
+        self.result_json = result_json
+
+    def __repr__(self) -> str:
+        return f"Task({self.task_id!r}, state={self.state.value!r})"
+
+    @property
+    def created_text(self) -> str:
+        return format_created_at(self.created_at)
+
+    @property
+    def is_terminal(self) -> bool:
+        return self.state.is_terminal
+
+    def apply(self, data: Dict) -> bool:
+        """Update from a recordInfo `data` payload; returns True if the state changed"""
+        if not data or not data.get("state"):
+            return False
+        state = TaskState.parse(data["state"])
+        changed = state is not self.state
+        self.state = state
+        if data.get("costTime"):
+            self.cost_time = data["costTime"] / 1000
+        if data.get("completeTime"):
+            self.complete_time = data["completeTime"] / 1000
+        if data.get("failCode"):
+            self.fail_code = str(data["failCode"])
+        self.fail_msg = data.get("failMsg") or self.fail_msg
+        self.result_json = data.get("resultJson") or self.result_json
+        return changed
+
+    def to_response(self) -> Dict:
+        """recordInfo-style envelope of the stored state (for tasks not polled this render)"""
+        return {
+            "code": 200,
+            "msg": "stored",
+            "data": {
+                "taskId": self.task_id,
+                "state": self.state.value,
+                "costTime": round(self.cost_time * 1000) if self.cost_time is not None else None,
+                "completeTime": round(self.complete_time * 1000) if self.complete_time is not None else None,
+                "failCode": self.fail_code,
+                "failMsg": self.fail_msg,
+                "resultJson": self.result_json,
+            },
+        }
+
+    @classmethod
+    def from_row(cls, row) -> "Task":
+        """Build from a tasks table row"""
+        return cls(
+            row["task_id"],
+            row["video_url"],
+            row["state"],
+            row["created_at"],
+            row["cost_time"],
+            row["priority"],
+            row["callback_url"],
+            row["fail_code"],
+            row["fail_msg"],
+            row["complete_time"],
+            row["result_json"],
+        )
+
+    @classmethod
+    def from_dict(cls, task: Dict) -> "Task":
+        """Migrate a task dict as kept in session state by earlier app versions"""
+        created_at = _parse_created_at(task.get("created_ts")) or _parse_created_at(task.get("created_at"))
+        return cls(
+            task["taskId"],
+            task.get("video_url", ""),
+            task.get("state") or TaskState.WAITING,
+            created_at,
+            task.get("cost_time"),
+            task.get("priority") or "Normal",
+            task.get("callback_url") or None,
+            task.get("fail_code"),
+            task.get("error_msg"),
+        )
+
+    def to_dict(self) -> Dict:
+        """Plain JSON-serializable dict (used for exports)"""
+        return {
+            "taskId": self.task_id,
+            "video_url": self.video_url,
+            "created_at": self.created_text,
+            "state": self.state.value,
+            "cost_time": self.cost_time,
+            "priority": self.priority,
+            "callback_url": self.callback_url,
+            "error_msg": self.fail_msg,
+            "fail_code": self.fail_code,
+        }
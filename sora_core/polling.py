@@ -0,0 +1,97 @@
+"""Concurrent status polling for task lists."""
+from concurrent.futures import ThreadPoolExecutor
+from typing import Callable, Dict, Iterable, List, Optional
+
+from sora_core.cache import get_result_cache
+from sora_core.models import Task
+from sora_core.ratelimit import current_lane, get_api_governor, use_lane
+from sora_core.scheduler import PollScheduler
+
+# Upper bound on simultaneous recordInfo requests issued by one render
+MAX_POLL_WORKERS = 8
+
+
+def poll_tasks(
+    query_fn: Callable[[str, str], Dict],
+    api_key: str,
+    task_ids: Iterable[str],
+    max_workers: int = MAX_POLL_WORKERS,
+) -> Dict[str, Dict]:
+    """Query many tasks concurrently and return their responses keyed by taskId"""
+    unique_ids = list(dict.fromkeys(task_ids))
+    if not unique_ids:
+        return {}
+    # Workers spend the calling session's share of the API budget
+    lane = current_lane()
+
+    def _query(task_id: str) -> Dict:
+        try:
+            with use_lane(lane):
+                return query_fn(api_key, task_id)
+        except Exception as e:
+            return {"code": 500, "msg": f"Error: {str(e)}"}
+
+    workers = max(1, min(max_workers, len(unique_ids)))
+    with ThreadPoolExecutor(max_workers=workers, thread_name_prefix="task-poll") as pool:
+        results = pool.map(_query, unique_ids)
+        return dict(zip(unique_ids, results))
+
+
+def poll_due_tasks(
+    query_fn: Callable[[str, str], Dict],
+    api_key: str,
+    tasks: List[Task],
+    scheduler: PollScheduler,
+    max_workers: int = MAX_POLL_WORKERS,
+    poll_many: Optional[Callable[[str, List[str]], Dict[str, Dict]]] = None,
+) -> Dict[str, Dict]:
+    """Poll only the tasks the scheduler marks due; the rest keep their last known response
+
+    Finished tasks are never polled: they are answered from the result cache,
+    or from their stored state (which then seeds the cache), and leave the
+    scheduler. Of the rest, at
+    most as many are polled as the API budget allows right now (tasks with no
+    known response first); the others keep their last known or stored state
+    and stay due for the next refresh instead of queueing behind the rate
+    limit. `poll_many(api_key, task_ids)` replaces the worker threads, e.g.
+    sora_core.aio.query_tasks_sync.
+    """
+    cache = get_result_cache()
+    task_ids = [t.task_id for t in tasks]
+    finished = set()
+    for task in tasks:
+        cached = cache.peek(task.task_id)
+        if cached is None or not cache.is_terminal(cached):
+            if not task.is_terminal:
+                continue
+            cached = task.to_response()
+            cache.put(task.task_id, cached)
+        # Finished without a poll (callback, another session): take it off the
+        # schedule and sample its costTime once
+        scheduler.record_poll(task.task_id, task.created_at, cached)
+        finished.add(task.task_id)
+    pending_ids = [task_id for task_id in task_ids if task_id not in finished]
+    due = set(scheduler.due(pending_ids))
+    unknown = [task_id for task_id in pending_ids if cache.peek(task_id) is None]
+    due.update(unknown)
+
+    governor = get_api_governor(api_key)
+    lane = current_lane()
+    ordered = list(dict.fromkeys(unknown + [task_id for task_id in pending_ids if task_id in due]))
+    budget = int(governor.available(lane))
+    if poll_many is not None:
+        fresh = poll_many(api_key, ordered[:budget]) if budget > 0 else {}
+    else:
+        fresh = poll_tasks(query_fn, api_key, ordered[:budget], max_workers)
+    for task in tasks:
+        response = fresh.get(task.task_id)
+        if response is not None and not response.get("throttled"):
+            scheduler.record_poll(task.task_id, task.created_at, response)
+
+    results = {}
+    for task in tasks:
+        response = fresh.get(task.task_id)
+        if response is None or response.get("throttled"):
+            response = cache.peek(task.task_id) or task.to_response()
+        results[task.task_id] = response
+    return results
@@ -0,0 +1,97 @@
+"""Poster frames for result videos, extracted once and cached on disk.
+
+The task lists show a still image per result instead of mounting a video
+player for every row. Frames are pulled from the remote MP4 with ffmpeg
+(which only reads the start of the file) on a small background pool, so a
+page render never waits on extraction; rows without a poster yet show a
+placeholder until a later rerun picks the file up.
+
+ffmpeg is optional: without it no posters are produced and the apps fall
+back to the placeholder. Set SORA_POSTER_DIR to choose the cache directory
+(default .sora/posters).
+"""
+import hashlib
+import os
+import shutil
+import subprocess
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from typing import Optional, Set
+
+DEFAULT_POSTER_DIR = os.path.join(".sora", "posters")
+POSTER_WIDTH = 480
+EXTRACT_TIMEOUT = 30
+EXTRACT_WORKERS = 2
+
+
+class PosterCache:
+    """Disk cache of first-frame JPEGs keyed by result URL"""
+
+    def __init__(self, directory: str = DEFAULT_POSTER_DIR, max_workers: int = EXTRACT_WORKERS,
+                 ffmpeg: Optional[str] = None):
+        self.directory = directory
+        self.ffmpeg = ffmpeg or shutil.which("ffmpeg")
+        os.makedirs(directory, exist_ok=True)
+        self._executor = ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix="sora-poster")
+        self._inflight: Set[str] = set()
+        self._failed: Set[str] = set()
+        self._lock = threading.Lock()
+
+    @property
+    def available(self) -> bool:
+        return self.ffmpeg is not None
+
+    def path_for(self, url: str) -> str:
+        name = hashlib.sha256(url.encode("utf-8")).hexdigest()[:32]
+        return os.path.join(self.directory, f"{name}.jpg")
+
+    def get(self, url: str) -> Optional[str]:
+        """Path of the cached poster, scheduling extraction in the background if missing"""
+        path = self.path_for(url)
+        if os.path.exists(path):
+            return path
+        if not self.available:
+            return None
+        with self._lock:
+            if url in self._inflight or url in self._failed:
+                return None
+            self._inflight.add(url)
+        self._executor.submit(self._extract, url, path)
+        return None
+
+    def _extract(self, url: str, path: str):
+        # Write to a temporary name so readers never see a partial file
+        tmp_path = f"{path}.part.jpg"
+        try:
+            result = subprocess.run(
+                [self.ffmpeg, "-v", "error", "-y", "-i", url, "-frames:v", "1",
+                 "-vf", f"scale={POSTER_WIDTH}:-2", "-q:v", "4", tmp_path],
+                stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL, timeout=EXTRACT_TIMEOUT,
+            )
+            if result.returncode == 0 and os.path.exists(tmp_path):
+                os.replace(tmp_path, path)
+            else:
+                with self._lock:
+                    self._failed.add(url)
+        except (OSError, subprocess.SubprocessError):
+            with self._lock:
+                self._failed.add(url)
+        finally:
+            if os.path.exists(tmp_path):
+                os.remove(tmp_path)
+            with self._lock:
+                self._inflight.discard(url)
+
+
+_posters: Optional[PosterCache] = None
+_posters_lock = threading.Lock()
+
+
+def get_poster_cache() -> PosterCache:
+    """Return the process-wide poster cache"""
+    global _posters
+    if _posters is None:
+        with _posters_lock:
+            if _posters is None:
+                _posters = PosterCache(os.environ.get("SORA_POSTER_DIR", DEFAULT_POSTER_DIR))
+    return _posters
@@ -0,0 +1,242 @@
+"""Client-side rate limiting: token buckets and the shared API governor."""
+import hashlib
+import math
+import os
+import threading
+import time
+from contextlib import contextmanager
+from contextvars import ContextVar
+from typing import Callable, Dict, Optional
+
+# Request budget per API key, shared by every session and thread in the process
+# (kie.ai allows about 20 requests per 10 seconds per key)
+API_RATE_PER_SEC = float(os.environ.get("SORA_API_RATE", "2"))
+API_BURST = float(os.environ.get("SORA_API_BURST", "20"))
+
+# A lane (one browser session) counts as active until it has been idle this long
+LANE_IDLE_SECONDS = 60.0
+
+# Longest a request waits for budget before it is reported as rate limited
+MAX_GOVERNOR_WAIT = 10.0
+
+RATE_LIMIT_BACKOFF = 2.0
+
+
+class TokenBucket:
+    """Thread-safe token bucket: `rate` tokens per second, bursts up to `capacity`"""
+
+    def __init__(self, rate: float, capacity: Optional[float] = None):
+        if rate <= 0:
+            raise ValueError("rate must be positive")
+        self.rate = float(rate)
+        self.capacity = float(capacity if capacity is not None else max(1.0, rate))
+        self._tokens = self.capacity
+        self._updated = time.monotonic()
+        self._paused_until = 0.0
+        self._lock = threading.Lock()
+
+    def _refill(self, now: float):
+        self._tokens = min(self.capacity, self._tokens + (now - self._updated) * self.rate)
+        self._updated = now
+
+    def try_acquire(self, tokens: float = 1.0) -> float:
+        """Take tokens if available; otherwise return the seconds to wait (0.0 on success)"""
+        with self._lock:
+            now = time.monotonic()
+            if now < self._paused_until:
+                return self._paused_until - now
+            self._refill(now)
+            if self._tokens >= tokens:
+                self._tokens -= tokens
+                return 0.0
+            return (tokens - self._tokens) / self.rate
+
+    def acquire(self, tokens: float = 1.0, timeout: Optional[float] = None) -> bool:
+        """Block until tokens are available; False if `timeout` expires first"""
+        deadline = None if timeout is None else time.monotonic() + timeout
+        while True:
+            wait = self.try_acquire(tokens)
+            if wait <= 0:
+                return True
+            if deadline is not None and wait > deadline - time.monotonic():
+                return False
+            time.sleep(wait)
+
+    def refund(self, tokens: float = 1.0):
+        """Give back tokens taken for a request that was not sent"""
+        with self._lock:
+            self._tokens = min(self.capacity, self._tokens + tokens)
+
+    def pause(self, seconds: float):
+        """Stop handing out tokens for `seconds` (e.g. after a 429) and drain the bucket"""
+        with self._lock:
+            self._paused_until = max(self._paused_until, time.monotonic() + seconds)
+            self._tokens = 0.0
+            self._updated = max(self._updated, self._paused_until)
+
+    def set_rate(self, rate: float, capacity: float):
+        """Change the refill rate and burst size, keeping the tokens earned so far"""
+        with self._lock:
+            now = time.monotonic()
+            if now >= self._paused_until:
+                self._refill(now)
+            self.rate = float(rate)
+            self.capacity = float(capacity)
+            self._tokens = min(self._tokens, self.capacity)
+
+    @property
+    def paused_for(self) -> float:
+        """Seconds left of a pause() (0.0 when not paused)"""
+        with self._lock:
+            return max(0.0, self._paused_until - time.monotonic())
+
+    @property
+    def available(self) -> float:
+        with self._lock:
+            now = time.monotonic()
+            if now < self._paused_until:
+                return 0.0
+            self._refill(now)
+            return self._tokens
+
+
+# --- API governor ---
+
+_lane: ContextVar[Optional[str]] = ContextVar("sora_api_lane", default=None)
+_lane_resolver: Optional[Callable[[], Optional[str]]] = None
+
+
+def set_lane_resolver(resolver: Optional[Callable[[], Optional[str]]]):
+    """Install the function naming the calling session's lane (the UI registers one)"""
+    global _lane_resolver
+    _lane_resolver = resolver
+
+
+def current_lane() -> Optional[str]:
+    """Lane of the current request: an explicit use_lane() or else the resolver's answer"""
+    lane = _lane.get()
+    if lane is None and _lane_resolver is not None:
+        lane = _lane_resolver()
+    return lane
+
+
+@contextmanager
+def use_lane(lane: Optional[str]):
+    """Attribute requests made inside the block (e.g. on worker threads) to `lane`"""
+    token = _lane.set(lane)
+    try:
+        yield
+    finally:
+        _lane.reset(token)
+
+
+def rate_limited_response(retry_after: float) -> Dict:
+    """API-style envelope for a request the governor did not let through"""
+    return {"code": 429, "msg": "Rate Limit Exceeded", "retry_after": max(1, math.ceil(retry_after)), "throttled": True}
+
+
+class ApiGovernor:
+    """Request budget for one API key, shared fairly between sessions
+
+    Every request takes a token from the key's bucket. Requests made on
+    behalf of a lane (one browser session) also take one from that lane's
+    share, which is the key's rate divided by the number of active lanes, so
+    one busy dashboard cannot starve the others. A 429 from the API pauses
+    the whole key for its Retry-After.
+    """
+
+    def __init__(self, rate: float = API_RATE_PER_SEC, capacity: float = API_BURST):
+        self.bucket = TokenBucket(rate, capacity)
+        self.throttled = 0
+        self._lanes: Dict[str, TokenBucket] = {}
+        self._seen: Dict[str, float] = {}
+        self._share = 0.0
+        self._lock = threading.Lock()
+
+    def _lane_bucket(self, lane: str) -> TokenBucket:
+        with self._lock:
+            now = time.monotonic()
+            for name in [name for name, seen in self._seen.items() if now - seen > LANE_IDLE_SECONDS]:
+                del self._seen[name]
+                del self._lanes[name]
+            self._seen[lane] = now
+            share = self.bucket.rate / len(self._seen)
+            burst = max(1.0, self.bucket.capacity / len(self._seen))
+            if share != self._share:
+                # Lanes joined or left: re-split the key's rate between them
+                self._share = share
+                for bucket in self._lanes.values():
+                    bucket.set_rate(share, burst)
+            bucket = self._lanes.get(lane)
+            if bucket is None:
+                bucket = self._lanes[lane] = TokenBucket(share, burst)
+            return bucket
+
+    def acquire(self, lane: Optional[str] = None, timeout: Optional[float] = MAX_GOVERNOR_WAIT) -> bool:
+        """Wait for budget; False if none frees up within `timeout`"""
+        deadline = None if timeout is None else time.monotonic() + timeout
+        if lane is not None and not self._lane_bucket(lane).acquire(timeout=timeout):
+            return False
+        remaining = None if deadline is None else max(0.0, deadline - time.monotonic())
+        return self.bucket.acquire(timeout=remaining)
+
+    def try_acquire(self, lane: Optional[str] = None) -> float:
+        """Take budget without blocking; otherwise return the seconds to wait (0.0 on success)"""
+        lane_bucket = self._lane_bucket(lane) if lane is not None else None
+        if lane_bucket is not None:
+            wait = lane_bucket.try_acquire()
+            if wait > 0:
+                return wait
+        wait = self.bucket.try_acquire()
+        if wait > 0 and lane_bucket is not None:
+            lane_bucket.refund()
+        return wait
+
+    def wait_time(self, lane: Optional[str] = None) -> float:
+        """Seconds until the next request could go out"""
+        wait = self.bucket.paused_for or max(0.0, (1.0 - self.bucket.available) / self.bucket.rate)
+        if lane is not None:
+            lane_bucket = self._lane_bucket(lane)
+            wait = max(wait, (1.0 - lane_bucket.available) / lane_bucket.rate)
+        return max(0.0, wait)
+
+    def available(self, lane: Optional[str] = None) -> float:
+        """Requests that can go out right now without waiting"""
+        tokens = self.bucket.available
+        if lane is not None:
+            tokens = min(tokens, self._lane_bucket(lane).available)
+        return tokens
+
+    def penalize(self, retry_after: Optional[float] = None, attempt: int = 0):
+        """Back off after a 429: pause the key for Retry-After (or exponential backoff)"""
+        with self._lock:
+            self.throttled += 1
+        self.bucket.pause(retry_after or RATE_LIMIT_BACKOFF * (2 ** attempt))
+
+    def snapshot(self) -> Dict:
+        """Current budget, for display"""
+        with self._lock:
+            lanes = len(self._seen)
+            throttled = self.throttled
+        return {
+            "available": self.bucket.available,
+            "capacity": self.bucket.capacity,
+            "rate": self.bucket.rate,
+            "paused_for": self.bucket.paused_for,
+            "lanes": lanes,
+            "throttled": throttled,
+        }
+
+
+_governors: Dict[str, ApiGovernor] = {}
+_governors_lock = threading.Lock()
+
+
+def get_api_governor(api_key: str) -> ApiGovernor:
+    """Return the process-wide governor for an API key"""
+    key = hashlib.sha256(api_key.encode("utf-8")).hexdigest()
+    with _governors_lock:
+        governor = _governors.get(key)
+        if governor is None:
+            governor = _governors[key] = ApiGovernor()
+        return governor
@@ -0,0 +1,177 @@
+"""Adaptive per-task polling schedule driven by observed costTime.
+
+Each waiting task is polled on its own timeline instead of on every rerun:
+
+* before the early edge of the completion-time distribution (p10) polls are
+  sparse, since the task is very unlikely to be done yet;
+* between p10 and p90 polls are dense, so completion is noticed quickly;
+* past p90 the interval backs off exponentially up to MAX_INTERVAL.
+
+Without enough history the schedule falls back to a fixed base interval
+with the same exponential backoff.
+"""
+import threading
+import time
+from bisect import bisect_right
+from collections import deque
+from typing import Callable, Dict, Iterable, List, Optional, Tuple
+
+from sora_core.cache import TERMINAL_STATES
+
+MIN_INTERVAL = 3.0
+BASE_INTERVAL = 10.0
+MAX_INTERVAL = 120.0
+BACKOFF = 1.5
+MIN_SAMPLES = 5
+MAX_SAMPLES = 500
+
+# Schedule entries overdue this long belong to tasks nobody is viewing any
+# more (archived, cleared, other pages) and are dropped
+STALE_AFTER = 3600.0
+PRUNE_EVERY = 60.0
+
+
+class CostTimeModel:
+    """Rolling sample of completed tasks' processing times (seconds)"""
+
+    def __init__(self, max_samples: int = MAX_SAMPLES):
+        self._samples = deque(maxlen=max_samples)
+        self._sorted: Optional[List[float]] = None
+        self._lock = threading.Lock()
+
+    def add(self, seconds: float):
+        if seconds and seconds > 0:
+            with self._lock:
+                self._samples.append(float(seconds))
+                self._sorted = None
+
+    def __len__(self) -> int:
+        return len(self._samples)
+
+    def quantile(self, q: float) -> Optional[float]:
+        with self._lock:
+            if len(self._samples) < MIN_SAMPLES:
+                return None
+            if self._sorted is None:
+                self._sorted = sorted(self._samples)
+            values = self._sorted
+        pos = q * (len(values) - 1)
+        lower = int(pos)
+        upper = min(lower + 1, len(values) - 1)
+        return values[lower] + (values[upper] - values[lower]) * (pos - lower)
+
+    def estimate(self, age: float) -> Tuple[Optional[float], Optional[float]]:
+        """(progress fraction, seconds remaining) for a task running `age` seconds
+
+        The expected total is the median of historical times longer than `age`,
+        so the estimate keeps moving for slow tasks. Returns (None, None) without
+        enough history and (fraction, None) once the task is slower than all samples.
+        """
+        with self._lock:
+            if len(self._samples) < MIN_SAMPLES:
+                return None, None
+            if self._sorted is None:
+                self._sorted = sorted(self._samples)
+            values = self._sorted
+        longer = values[bisect_right(values, age):]
+        if not longer:
+            return 0.99, None
+        expected = longer[len(longer) // 2]
+        return min(0.99, age / expected), expected - age
+
+
+class PollScheduler:
+    """Decides which waiting tasks are due for a status query"""
+
+    def __init__(self, model: Optional[CostTimeModel] = None, min_interval: float = MIN_INTERVAL,
+                 base_interval: float = BASE_INTERVAL, max_interval: float = MAX_INTERVAL):
+        self.model = model if model is not None else CostTimeModel()
+        self.min_interval = min_interval
+        self.base_interval = base_interval
+        self.max_interval = max_interval
+        # taskId -> (next_poll_at, polls_after_expected_completion)
+        self._next: Dict[str, Tuple[float, int]] = {}
+        self._pruned_at = 0.0
+        self._lock = threading.Lock()
+
+    def interval_for(self, age: float, late_polls: int = 0) -> float:
+        """Seconds until the next poll of a task that has been running for `age` seconds"""
+        early = self.model.quantile(0.1)
+        late = self.model.quantile(0.9)
+        if early is None or late is None:
+            return min(self.max_interval, self.base_interval * (BACKOFF ** min(late_polls, 12)))
+        if age < early:
+            # Sparse: wake at the early edge of the distribution
+            return min(self.max_interval, max(self.min_interval, early - age))
+        if age <= late:
+            # Dense: a fraction of the spread, so detection lag stays small
+            return max(self.min_interval, min(self.base_interval, (late - early) / 10))
+        return min(self.max_interval, self.min_interval * (BACKOFF ** min(late_polls + 1, 12)))
+
+    def due(self, task_ids: Iterable[str], now: Optional[float] = None) -> List[str]:
+        """Task ids whose next poll time has passed (unscheduled tasks are always due)"""
+        now = time.time() if now is None else now
+        with self._lock:
+            return [task_id for task_id in task_ids if self._next.get(task_id, (0.0, 0))[0] <= now]
+
+    def record_poll(self, task_id: str, created_ts: float, response: Dict, now: Optional[float] = None):
+        """Update a task's schedule from a fresh recordInfo response
+
+        A task's costTime is sampled once, when it is seen reaching success
+        while still scheduled; finished tasks passed in again add nothing.
+        """
+        now = time.time() if now is None else now
+        data = (response.get("data") or {}) if response.get("code") == 200 else {}
+        state = data.get("state")
+        completed = False
+        with self._lock:
+            if now - self._pruned_at > PRUNE_EVERY:
+                self._prune(now)
+            if state in TERMINAL_STATES:
+                completed = self._next.pop(task_id, None) is not None
+            else:
+                age = max(0.0, now - created_ts)
+                late = self.model.quantile(0.9)
+                late_polls = self._next.get(task_id, (0.0, -1))[1] + 1 if late is None or age > late else 0
+                self._next[task_id] = (now + self.interval_for(age, late_polls), late_polls)
+        if completed and state == "success" and data.get("costTime"):
+            self.model.add(data["costTime"] / 1000)
+
+    def _prune(self, now: float):
+        for task_id in [task_id for task_id, (at, _) in self._next.items() if now - at > STALE_AFTER]:
+            del self._next[task_id]
+        self._pruned_at = now
+
+    def __len__(self) -> int:
+        with self._lock:
+            return len(self._next)
+
+    def next_poll_at(self, task_ids: Optional[Iterable[str]] = None) -> Optional[float]:
+        """Earliest scheduled poll among the given (or all) tracked tasks"""
+        with self._lock:
+            if task_ids is None:
+                times = [t for t, _ in self._next.values()]
+            else:
+                times = [self._next[t][0] for t in task_ids if t in self._next]
+        return min(times) if times else None
+
+    def forget(self, task_id: str):
+        with self._lock:
+            self._next.pop(task_id, None)
+
+
+_scheduler: Optional[PollScheduler] = None
+_scheduler_lock = threading.Lock()
+
+
+def get_scheduler(seed: Optional[Callable[[], Iterable[float]]] = None) -> PollScheduler:
+    """Return the process-wide scheduler; `seed` supplies historical costTimes on first use"""
+    global _scheduler
+    if _scheduler is None:
+        with _scheduler_lock:
+            if _scheduler is None:
+                scheduler = PollScheduler()
+                for seconds in (seed() if seed is not None else ()):
+                    scheduler.model.add(seconds)
+                _scheduler = scheduler
+    return _scheduler
@@ -0,0 +1,366 @@
+"""Persistent SQLite task store shared by every app variant.
+
+Tasks are kept per API key owner (a hash of the key, never the key itself)
+so several operators can share one server without seeing each other's
+tasks. The database runs in WAL mode and is indexed on taskId, state and
+created_at so filters and sorting are answered by SQLite.
+
+Statistics come from small summary tables (per-state counters and an hour
+of day histogram) that triggers keep up to date on every insert, state
+transition, archive and delete, so reading them costs the same no matter
+how long the history is.
+
+Set SORA_TASK_DB to choose the database file (default .sora/tasks.db).
+"""
+import hashlib
+import os
+import sqlite3
+import threading
+import time
+from typing import Dict, Iterable, List, Optional, Union
+
+from sora_core.models import Task
+
+DEFAULT_DB_PATH = os.path.join(".sora", "tasks.db")
+
+# SQL tuple of the terminal states
+FINISHED_STATES = "('success', 'fail')"
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS tasks (
+    task_id      TEXT PRIMARY KEY,
+    owner        TEXT NOT NULL,
+    video_url    TEXT NOT NULL,
+    callback_url TEXT,
+    priority     TEXT NOT NULL DEFAULT 'Normal',
+    state        TEXT NOT NULL DEFAULT 'waiting',
+    created_at   REAL NOT NULL,
+    updated_at   REAL NOT NULL,
+    complete_time REAL,
+    cost_time    REAL,
+    fail_code    TEXT,
+    fail_msg     TEXT,
+    result_json  TEXT,
+    archived     INTEGER NOT NULL DEFAULT 0
+);
+CREATE INDEX IF NOT EXISTS idx_tasks_owner_created ON tasks (owner, created_at);
+CREATE INDEX IF NOT EXISTS idx_tasks_owner_state ON tasks (owner, state);
+CREATE INDEX IF NOT EXISTS idx_tasks_state ON tasks (state);
+
+CREATE TABLE IF NOT EXISTS task_counts (
+    owner    TEXT NOT NULL,
+    state    TEXT NOT NULL,
+    archived INTEGER NOT NULL,
+    n        INTEGER NOT NULL DEFAULT 0,
+    cost_sum REAL NOT NULL DEFAULT 0,
+    cost_n   INTEGER NOT NULL DEFAULT 0,
+    PRIMARY KEY (owner, state, archived)
+) WITHOUT ROWID;
+CREATE TABLE IF NOT EXISTS task_hours (
+    owner    TEXT NOT NULL,
+    hour     INTEGER NOT NULL,
+    archived INTEGER NOT NULL,
+    n        INTEGER NOT NULL DEFAULT 0,
+    PRIMARY KEY (owner, hour, archived)
+) WITHOUT ROWID;
+"""
+
+LOCAL_HOUR = "CAST(strftime('%H', {}.created_at, 'unixepoch', 'localtime') AS INTEGER)"
+
+# Each trigger adds the new row's contribution and/or removes the old row's
+_ADD_ROW = f"""
+    INSERT INTO task_counts (owner, state, archived, n, cost_sum, cost_n)
+    VALUES (NEW.owner, NEW.state, NEW.archived, 1, COALESCE(NEW.cost_time, 0), NEW.cost_time IS NOT NULL)
+    ON CONFLICT (owner, state, archived) DO UPDATE SET
+        n = n + 1, cost_sum = cost_sum + excluded.cost_sum, cost_n = cost_n + excluded.cost_n;
+    INSERT INTO task_hours (owner, hour, archived, n)
+    VALUES (NEW.owner, {LOCAL_HOUR.format('NEW')}, NEW.archived, 1)
+    ON CONFLICT (owner, hour, archived) DO UPDATE SET n = n + 1;
+"""
+_REMOVE_ROW = f"""
+    UPDATE task_counts SET
+        n = n - 1, cost_sum = cost_sum - COALESCE(OLD.cost_time, 0), cost_n = cost_n - (OLD.cost_time IS NOT NULL)
+    WHERE owner = OLD.owner AND state = OLD.state AND archived = OLD.archived;
+    UPDATE task_hours SET n = n - 1
+    WHERE owner = OLD.owner AND hour = {LOCAL_HOUR.format('OLD')} AND archived = OLD.archived;
+"""
+STATS_TRIGGERS = f"""
+CREATE TRIGGER IF NOT EXISTS tasks_stats_insert AFTER INSERT ON tasks BEGIN {_ADD_ROW} END;
+CREATE TRIGGER IF NOT EXISTS tasks_stats_delete AFTER DELETE ON tasks BEGIN {_REMOVE_ROW} END;
+CREATE TRIGGER IF NOT EXISTS tasks_stats_update
+AFTER UPDATE OF owner, state, archived, cost_time, created_at ON tasks BEGIN {_REMOVE_ROW} {_ADD_ROW} END;
+"""
+
+# Columns that may be read in bulk through TaskStore.columns()
+ANALYTICS_FIELDS = ("state", "created_at", "updated_at", "complete_time", "cost_time", "fail_code", "priority")
+
+# Bumped whenever the summary tables need rebuilding from the tasks table
+STATS_VERSION = 1
+
+ORDER_BY = {
+    "newest": "created_at DESC",
+    "oldest": "created_at ASC",
+    "status": "CASE state WHEN 'success' THEN 0 WHEN 'fail' THEN 2 ELSE 1 END, created_at DESC",
+}
+
+
+def owner_key(api_key: str) -> str:
+    """Stable, non-reversible identifier for the owner of an API key"""
+    return hashlib.sha256(api_key.encode("utf-8")).hexdigest()[:24]
+
+
+class TaskStore:
+    """Repository API over the tasks table; safe to share between threads"""
+
+    def __init__(self, path: str = DEFAULT_DB_PATH):
+        self.path = path
+        directory = os.path.dirname(os.path.abspath(path))
+        os.makedirs(directory, exist_ok=True)
+        self._local = threading.local()
+        conn = self._connect()
+        conn.executescript(SCHEMA)
+        conn.executescript(STATS_TRIGGERS)
+        if conn.execute("PRAGMA user_version").fetchone()[0] < STATS_VERSION:
+            self.rebuild_stats()
+
+    def _connect(self) -> sqlite3.Connection:
+        conn = getattr(self._local, "conn", None)
+        if conn is None:
+            conn = sqlite3.connect(self.path, timeout=10, isolation_level=None)
+            conn.row_factory = sqlite3.Row
+            conn.execute("PRAGMA journal_mode=WAL")
+            conn.execute("PRAGMA synchronous=NORMAL")
+            conn.execute("PRAGMA busy_timeout=5000")
+            self._local.conn = conn
+        return conn
+
+    # --- Writes ---
+
+    def add_task(self, owner: str, task_id: str, video_url: str, callback_url: Optional[str] = None,
+                 priority: str = "Normal", created_at: Optional[float] = None) -> Task:
+        """Insert a newly created task and return it"""
+        now = time.time()
+        created = created_at if created_at is not None else now
+        # An upsert (not INSERT OR REPLACE) so the statistics triggers see the change
+        self._connect().execute(
+            "INSERT INTO tasks (task_id, owner, video_url, callback_url, priority, state, created_at, updated_at) "
+            "VALUES (?, ?, ?, ?, ?, 'waiting', ?, ?) "
+            "ON CONFLICT (task_id) DO UPDATE SET owner = excluded.owner, video_url = excluded.video_url, "
+            "callback_url = excluded.callback_url, priority = excluded.priority, state = 'waiting', "
+            "created_at = excluded.created_at, updated_at = excluded.updated_at, complete_time = NULL, "
+            "cost_time = NULL, fail_code = NULL, fail_msg = NULL, result_json = NULL, archived = 0",
+            (task_id, owner, video_url, callback_url or None, priority, created, now),
+        )
+        return Task(task_id, video_url, created_at=created, priority=priority, callback_url=callback_url or None)
+
+    def import_tasks(self, owner: str, tasks: Iterable[Union[Task, Dict]]) -> int:
+        """Insert tasks not yet in the store (e.g. task dicts from an old session); returns the count added"""
+        now = time.time()
+        rows = []
+        for task in tasks:
+            if isinstance(task, dict):
+                if not task.get("taskId"):
+                    continue
+                task = Task.from_dict(task)
+            rows.append((task.task_id, owner, task.video_url, task.callback_url, task.priority, task.state.value,
+                         task.created_at, now, task.cost_time, task.fail_code, task.fail_msg))
+        conn = self._connect()
+        with conn:
+            conn.execute("BEGIN")
+            before = conn.total_changes
+            conn.executemany(
+                "INSERT OR IGNORE INTO tasks (task_id, owner, video_url, callback_url, priority, state, created_at, "
+                "updated_at, cost_time, fail_code, fail_msg) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)",
+                rows,
+            )
+            return conn.total_changes - before
+
+    def record_response(self, response: Dict):
+        """Apply a recordInfo/callback envelope to the stored task"""
+        if response.get("code") != 200:
+            return
+        self.record_states([response["data"]])
+
+    def record_states(self, task_datas: Iterable[Dict]):
+        """Apply many recordInfo `data` payloads in one transaction"""
+        now = time.time()
+        rows = []
+        for data in task_datas:
+            if not data or not data.get("taskId") or not data.get("state"):
+                continue
+            cost_time = data.get("costTime")
+            complete_time = data.get("completeTime")
+            values = (
+                data["state"],
+                cost_time / 1000 if cost_time else None,
+                complete_time / 1000 if complete_time else None,
+                str(data["failCode"]) if data.get("failCode") else None,
+                data.get("failMsg") or None,
+                data.get("resultJson") or None,
+            )
+            rows.append(values + (now, data["taskId"], data["state"]) + values)
+        if not rows:
+            return
+        conn = self._connect()
+        with conn:
+            conn.execute("BEGIN")
+            # Only touch rows where something changed (each write fires the stats
+            # triggers), and never move a finished task back to an earlier state
+            conn.executemany(
+                "UPDATE tasks SET state = ?, cost_time = ?, complete_time = ?, fail_code = ?, fail_msg = ?, "
+                "result_json = ?, updated_at = ? WHERE task_id = ? "
+                f"AND (state NOT IN {FINISHED_STATES} OR ? IN {FINISHED_STATES}) "
+                "AND (state IS NOT ? OR cost_time IS NOT ? OR complete_time IS NOT ? OR fail_code IS NOT ? "
+                "OR fail_msg IS NOT ? OR result_json IS NOT ?)",
+                rows,
+            )
+
+    def archive(self, owner: str, task_id: str):
+        """Remove a task from the active list but keep it in history"""
+        self._connect().execute(
+            "UPDATE tasks SET archived = 1 WHERE owner = ? AND task_id = ?", (owner, task_id)
+        )
+
+    def archive_all(self, owner: str) -> int:
+        """Move every active task of an owner to history; returns the count archived"""
+        return self._connect().execute(
+            "UPDATE tasks SET archived = 1 WHERE owner = ? AND archived = 0", (owner,)
+        ).rowcount
+
+    def clear(self, owner: str):
+        """Delete every task (active and history) of an owner"""
+        self._connect().execute("DELETE FROM tasks WHERE owner = ?", (owner,))
+
+    def rebuild_stats(self):
+        """Recompute the statistics tables from the tasks table (one full scan)"""
+        conn = self._connect()
+        with conn:
+            conn.execute("BEGIN IMMEDIATE")
+            conn.execute("DELETE FROM task_counts")
+            conn.execute("DELETE FROM task_hours")
+            conn.execute(
+                "INSERT INTO task_counts (owner, state, archived, n, cost_sum, cost_n) "
+                "SELECT owner, state, archived, COUNT(*), COALESCE(SUM(cost_time), 0), COUNT(cost_time) "
+                "FROM tasks GROUP BY owner, state, archived"
+            )
+            conn.execute(
+                f"INSERT INTO task_hours (owner, hour, archived, n) "
+                f"SELECT owner, {LOCAL_HOUR.format('tasks')} AS hour, archived, COUNT(*) "
+                f"FROM tasks GROUP BY owner, hour, archived"
+            )
+            conn.execute(f"PRAGMA user_version = {STATS_VERSION}")
+
+    # --- Reads ---
+
+    def _where(self, owner: str, state: Optional[str], include_archived: bool,
+               task_ids: Optional[List[str]]):
+        clauses = ["owner = ?"]
+        params: List = [owner]
+        if not include_archived:
+            clauses.append("archived = 0")
+        if state == "waiting":
+            # Every unfinished state (queuing, generating, ...) counts as waiting
+            clauses.append(f"state NOT IN {FINISHED_STATES}")
+        elif state:
+            clauses.append("state = ?")
+            params.append(state)
+        if task_ids is not None:
+            clauses.append(f"task_id IN ({','.join('?' * len(task_ids))})" if task_ids else "0")
+            params.extend(task_ids)
+        return " AND ".join(clauses), params
+
+    def list_tasks(self, owner: str, state: Optional[str] = None, order: str = "newest",
+                   include_archived: bool = False, task_ids: Optional[List[str]] = None,
+                   limit: Optional[int] = None, offset: int = 0) -> List[Task]:
+        """Filtered, sorted tasks of an owner"""
+        where, params = self._where(owner, state, include_archived, task_ids)
+        sql = f"SELECT * FROM tasks WHERE {where} ORDER BY {ORDER_BY.get(order, ORDER_BY['newest'])}"
+        if limit is not None:
+            sql += " LIMIT ? OFFSET ?"
+            params.extend([limit, offset])
+        return [Task.from_row(row) for row in self._connect().execute(sql, params)]
+
+    def columns(self, owner: str, fields: List[str], since: Optional[float] = None,
+                include_archived: bool = True) -> Dict[str, List]:
+        """Raw column values (one list per field) of an owner's tasks, for analytics"""
+        unknown = set(fields) - set(ANALYTICS_FIELDS)
+        if unknown:
+            raise ValueError(f"Unknown task fields: {sorted(unknown)}")
+        where, params = self._where(owner, None, include_archived, None)
+        if since is not None:
+            where += " AND created_at >= ?"
+            params.append(since)
+        rows = self._connect().execute(f"SELECT {', '.join(fields)} FROM tasks WHERE {where}", params).fetchall()
+        values = list(zip(*rows)) if rows else [()] * len(fields)
+        return {field: list(column) for field, column in zip(fields, values)}
+
+    def count(self, owner: str, state: Optional[str] = None, include_archived: bool = False,
+              task_ids: Optional[List[str]] = None) -> int:
+        if task_ids is None:
+            counts = self._state_counts(owner, include_archived)
+            return counts.get(state, 0) if state else sum(counts.values())
+        where, params = self._where(owner, state, include_archived, task_ids)
+        return self._connect().execute(f"SELECT COUNT(*) FROM tasks WHERE {where}", params).fetchone()[0]
+
+    def _summary_where(self, owner: str, include_archived: bool):
+        return ("owner = ?", [owner]) if include_archived else ("owner = ? AND archived = 0", [owner])
+
+    def _state_counts(self, owner: str, include_archived: bool) -> Dict[str, int]:
+        """Task counts per state, with every unfinished state folded into waiting"""
+        where, params = self._summary_where(owner, include_archived)
+        return {row["state"]: row["n"] for row in self._connect().execute(
+            f"SELECT CASE WHEN state IN {FINISHED_STATES} THEN state ELSE 'waiting' END AS state, SUM(n) AS n "
+            f"FROM task_counts WHERE {where} GROUP BY 1 HAVING SUM(n) > 0", params
+        )}
+
+    def stats(self, owner: str, include_archived: bool = True) -> Dict:
+        """Task counts per state plus success rate, read from the maintained counters"""
+        counts = self._state_counts(owner, include_archived)
+        total = sum(counts.values())
+        success = counts.get("success", 0)
+        return {
+            "total": total,
+            "waiting": counts.get("waiting", 0),
+            "success": success,
+            "failed": counts.get("fail", 0),
+            "success_rate": (success / total * 100) if total > 0 else 0,
+        }
+
+    def avg_cost_time(self, owner: str, include_archived: bool = False) -> float:
+        """Average processing time in seconds of successful tasks"""
+        where, params = self._summary_where(owner, include_archived)
+        cost_sum, cost_n = self._connect().execute(
+            f"SELECT SUM(cost_sum), SUM(cost_n) FROM task_counts WHERE {where} AND state = 'success'", params
+        ).fetchone()
+        return cost_sum / cost_n if cost_n else 0
+
+    def recent_cost_times(self, limit: int = 500) -> List[float]:
+        """Processing times (seconds) of the most recently completed tasks, all owners"""
+        rows = self._connect().execute(
+            "SELECT cost_time FROM tasks WHERE state = 'success' AND cost_time IS NOT NULL "
+            "ORDER BY updated_at DESC LIMIT ?", (limit,)
+        )
+        return [row[0] for row in rows]
+
+    def peak_hour(self, owner: str, include_archived: bool = False) -> Optional[int]:
+        """Local hour of day in which most tasks were created"""
+        where, params = self._summary_where(owner, include_archived)
+        row = self._connect().execute(
+            f"SELECT hour, SUM(n) AS n FROM task_hours WHERE {where} GROUP BY hour "
+            f"HAVING SUM(n) > 0 ORDER BY n DESC LIMIT 1", params
+        ).fetchone()
+        return row["hour"] if row else None
+
+
+_store: Optional[TaskStore] = None
+_store_lock = threading.Lock()
+
+
+def get_task_store() -> TaskStore:
+    """Return the process-wide task store"""
+    global _store
+    if _store is None:
+        with _store_lock:
+            if _store is None:
+                _store = TaskStore(os.environ.get("SORA_TASK_DB", DEFAULT_DB_PATH))
+    return _store
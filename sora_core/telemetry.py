@@ -0,0 +1,155 @@
+"""Process-wide request telemetry: per-endpoint latency and size histograms.
+
+Every outbound request (the jobs API endpoints and result downloads) records
+its latency, status code, bytes and retry count here, shared across all
+sessions in the process. Values go into HDR-style log-bucketed histograms:
+each bucket spans a fixed ratio, so memory stays bounded whatever the range
+and any percentile is accurate to within that ratio (about 2%).
+"""
+import math
+import threading
+from collections import Counter
+from typing import Dict, List, Optional
+
+# Relative width of a histogram bucket (bounds the percentile error)
+BUCKET_RATIO = 1.02
+PERCENTILES = (50, 95, 99)
+
+# Status recorded for requests that never got an HTTP response
+NO_RESPONSE = 0
+
+
+class Histogram:
+    """Log-bucketed histogram of positive values (HDR-style, thread-safe)"""
+
+    def __init__(self, lowest: float = 1e-4, ratio: float = BUCKET_RATIO):
+        self.lowest = lowest
+        self._log_ratio = math.log(ratio)
+        self._counts: Counter = Counter()
+        self.count = 0
+        self.total = 0.0
+        self.max = 0.0
+        self._lock = threading.Lock()
+
+    def _index(self, value: float) -> int:
+        return max(0, int(math.log(max(value, self.lowest) / self.lowest) / self._log_ratio))
+
+    def _upper_bound(self, index: int) -> float:
+        return self.lowest * math.exp((index + 1) * self._log_ratio)
+
+    def record(self, value: float):
+        with self._lock:
+            self._counts[self._index(value)] += 1
+            self.count += 1
+            self.total += value
+            self.max = max(self.max, value)
+
+    def percentiles(self, qs=PERCENTILES) -> Dict[int, Optional[float]]:
+        """Upper bucket bound at each percentile (None while empty)"""
+        with self._lock:
+            if not self.count:
+                return {q: None for q in qs}
+            ordered = sorted(self._counts.items())
+            results = {}
+            for q in qs:
+                rank = max(1, math.ceil(q / 100 * self.count))
+                seen = 0
+                for index, n in ordered:
+                    seen += n
+                    if seen >= rank:
+                        results[q] = min(self._upper_bound(index), self.max)
+                        break
+            return results
+
+    @property
+    def mean(self) -> Optional[float]:
+        return self.total / self.count if self.count else None
+
+
+class EndpointStats:
+    """Latency, response size, status codes and retries of one endpoint"""
+
+    def __init__(self):
+        self.latency = Histogram()
+        self.response_bytes = Histogram(lowest=1.0)
+        self.statuses: Counter = Counter()
+        self.retries = 0
+        self.retried_requests = 0
+        self.bytes_sent = 0
+        self.bytes_received = 0
+        self._lock = threading.Lock()
+
+    def record(self, latency: float, status: int, bytes_received: int = 0, bytes_sent: int = 0, retries: int = 0):
+        self.latency.record(latency)
+        self.response_bytes.record(bytes_received)
+        with self._lock:
+            self.statuses[status] += 1
+            self.retries += retries
+            self.retried_requests += retries > 0
+            self.bytes_sent += bytes_sent
+            self.bytes_received += bytes_received
+
+    def snapshot(self) -> Dict:
+        with self._lock:
+            statuses = dict(self.statuses)
+            retries, retried = self.retries, self.retried_requests
+            sent, received = self.bytes_sent, self.bytes_received
+        requests = sum(statuses.values())
+        errors = sum(n for status, n in statuses.items() if status == NO_RESPONSE or status >= 400)
+        return {
+            "requests": requests,
+            "latency": self.latency.percentiles(),
+            "latency_max": self.latency.max,
+            "response_bytes": self.response_bytes.percentiles(),
+            "statuses": statuses,
+            "errors": errors,
+            "retries": retries,
+            "retried_requests": retried,
+            "bytes_sent": sent,
+            "bytes_received": received,
+        }
+
+
+class RequestTelemetry:
+    """Per-endpoint stats for the whole process"""
+
+    def __init__(self):
+        self._endpoints: Dict[str, EndpointStats] = {}
+        self._lock = threading.Lock()
+
+    def endpoint(self, name: str) -> EndpointStats:
+        with self._lock:
+            stats = self._endpoints.get(name)
+            if stats is None:
+                stats = self._endpoints[name] = EndpointStats()
+            return stats
+
+    def record(self, endpoint: str, latency: float, status: int, bytes_received: int = 0,
+               bytes_sent: int = 0, retries: int = 0):
+        """Record one finished request (latency in seconds, status 0 when no response)"""
+        self.endpoint(endpoint).record(latency, status, bytes_received, bytes_sent, retries)
+
+    def endpoints(self) -> List[str]:
+        with self._lock:
+            return sorted(self._endpoints)
+
+    def snapshot(self) -> Dict[str, Dict]:
+        return {name: self.endpoint(name).snapshot() for name in self.endpoints()}
+
+    def reset(self):
+        with self._lock:
+            self._endpoints.clear()
+
+
+_telemetry: Optional[RequestTelemetry] = None
+_telemetry_lock = threading.Lock()
+
+
+def get_telemetry() -> RequestTelemetry:
+    """Return the process-wide request telemetry"""
+    global _telemetry
+    if _telemetry is None:
+        with _telemetry_lock:
+            if _telemetry is None:
+                _telemetry = RequestTelemetry()
+    return _telemetry
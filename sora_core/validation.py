@@ -0,0 +1,16 @@
+"""Input validation shared by the UI and headless entry points."""
+from typing import Optional
+
+SORA_URL_PREFIX = "https://sora.chatgpt.com"
+MAX_URL_LENGTH = 500
+
+
+def validate_video_url(video_url: str) -> Optional[str]:
+    """Return an error message for an unusable video URL, or None if it is valid"""
+    if not video_url:
+        return "Please enter a video URL"
+    if not video_url.startswith(SORA_URL_PREFIX):
+        return f"Invalid URL format. Must start with {SORA_URL_PREFIX}"
+    if len(video_url) > MAX_URL_LENGTH:
+        return f"URL is too long (max {MAX_URL_LENGTH} characters)"
+    return None
@@ -0,0 +1 @@
+"""Streamlit building blocks shared by the app entry points (1app, app, 5app, app66)."""
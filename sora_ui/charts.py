@@ -0,0 +1,81 @@
+"""Plotly figures for the Analytics page, built once per distinct aggregate.
+
+Figures are cached process-wide under a hash of the data they plot, so a
+rerun with unchanged aggregates reuses the finished figure instead of
+rebuilding and re-validating it. plotly itself is imported on first use,
+so pages without charts never pay for the import.
+"""
+import hashlib
+import threading
+from collections import OrderedDict
+from typing import Callable, Tuple
+
+MAX_CACHED_FIGURES = 64
+
+STATUS_COLORS = ('#20C997', '#FF8C00', '#C82333')
+THROUGHPUT_COLORS = (("submitted", "#667eea"), ("completed", "#20C997"), ("failed", "#C82333"))
+
+_figures: "OrderedDict[str, object]" = OrderedDict()
+_figures_lock = threading.Lock()
+
+
+def _frame_digest(frame) -> bytes:
+    """Stable digest of a DataFrame's index and values"""
+    import pandas as pd
+    hashed = pd.util.hash_pandas_object(frame, index=True).to_numpy().tobytes()
+    return hashlib.sha1(hashed + repr(list(frame.columns)).encode("utf-8")).digest()
+
+
+def cached_figure(kind: str, key: bytes, build: Callable[[], object]):
+    """Return the cached figure for (kind, key), building it on a miss"""
+    digest = hashlib.sha1(kind.encode("utf-8") + b"\0" + key).hexdigest()
+    with _figures_lock:
+        figure = _figures.get(digest)
+        if figure is not None:
+            _figures.move_to_end(digest)
+            return figure
+    figure = build()
+    with _figures_lock:
+        _figures[digest] = figure
+        while len(_figures) > MAX_CACHED_FIGURES:
+            _figures.popitem(last=False)
+    return figure
+
+
+def status_pie(success: int, waiting: int, failed: int):
+    """Donut chart of task states"""
+    values: Tuple[int, int, int] = (success, waiting, failed)
+
+    def build():
+        import plotly.graph_objects as go
+        fig = go.Figure(data=[go.Pie(labels=['Success', 'Waiting', 'Failed'], values=list(values),
+                                     marker_colors=list(STATUS_COLORS), hole=.3)])
+        fig.update_layout(
+            margin=dict(t=0, b=0, l=0, r=0),
+            legend=dict(orientation="h", yanchor="bottom", y=-0.2, xanchor="center", x=0.5)
+        )
+        return fig
+    return cached_figure("status_pie", repr(values).encode("utf-8"), build)
+
+
+def throughput_bars(throughput):
+    """Grouped bars of submitted/completed/failed tasks per hour"""
+    def build():
+        import plotly.graph_objects as go
+        fig = go.Figure()
+        for column, color in THROUGHPUT_COLORS:
+            fig.add_trace(go.Bar(x=throughput.index, y=throughput[column], name=column.title(), marker_color=color))
+        fig.update_layout(barmode="group", margin=dict(t=10, b=0, l=0, r=0),
+                          legend=dict(orientation="h", yanchor="bottom", y=1.02, xanchor="right", x=1))
+        return fig
+    return cached_figure("throughput_bars", _frame_digest(throughput), build)
+
+
+def queue_wait_bars(histogram):
+    """Bar chart of tasks per queue wait bucket"""
+    def build():
+        import plotly.graph_objects as go
+        fig = go.Figure(data=[go.Bar(x=histogram["bucket"], y=histogram["tasks"], marker_color="#FF8C00")])
+        fig.update_layout(margin=dict(t=10, b=0, l=0, r=0), height=260)
+        return fig
+    return cached_figure("queue_wait_bars", _frame_digest(histogram), build)
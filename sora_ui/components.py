@@ -0,0 +1,115 @@
+"""Widgets used by more than one app."""
+import streamlit as st
+from streamlit.runtime.scriptrunner import get_script_run_ctx
+
+from sora_core.cache import get_result_cache
+from sora_core.posters import get_poster_cache
+from sora_core.ratelimit import get_api_governor, set_lane_resolver
+from sora_core.store import get_task_store
+from sora_core.telemetry import get_telemetry
+
+# Session state keys under which earlier app versions kept task dicts
+LEGACY_TASK_KEYS = ("tasks", "task_history")
+
+
+def _session_lane():
+    """Each browser session gets its own share of the API budget"""
+    ctx = get_script_run_ctx()
+    return ctx.session_id if ctx is not None else None
+
+
+set_lane_resolver(_session_lane)
+
+
+def render_pagination(total: int, page_size: int, key: str) -> int:
+    """Render previous/next page controls and return the current zero-based page"""
+    page_count = max(1, -(-total // page_size))
+    page = min(st.session_state.get(key, 0), page_count - 1)
+    
+    col_prev, col_page, col_next = st.columns([1, 2, 1])
+    with col_prev:
+        if st.button("⬅️ Previous", key=f"{key}_prev", disabled=page == 0, use_container_width=True):
+            page -= 1
+    with col_next:
+        if st.button("Next ➡️", key=f"{key}_next", disabled=page >= page_count - 1, use_container_width=True):
+            page += 1
+    with col_page:
+        st.markdown(f'<p style="text-align: center;">📄 Page {page + 1} of {page_count}</p>', unsafe_allow_html=True)
+    
+    st.session_state[key] = page
+    return page
+
+
+def render_lazy_media_toggle():
+    """Sidebar checkbox controlling render_result_media"""
+    st.checkbox(
+        "Lazy video previews",
+        value=True,
+        key="lazy_media",
+        help="Show a poster frame for each result and only load the video player when you press play"
+    )
+
+
+def render_result_media(url: str, key: str):
+    """Show a result video, as a poster with a play button when lazy previews are on"""
+    if not st.session_state.get("lazy_media", True) or st.session_state.get(key, False):
+        st.video(url)
+        return
+    
+    slot = st.empty()
+    with slot.container():
+        poster = get_poster_cache().get(url)
+        if poster:
+            st.image(poster, use_container_width=True)
+        else:
+            st.markdown('<div class="video-poster">🎬 Preview loading...</div>', unsafe_allow_html=True)
+        play = st.button("▶️ Play video", key=f"{key}_play")
+    if play:
+        st.session_state[key] = True
+        slot.video(url)
+
+
+def render_api_budget(api_key: str):
+    """Sidebar gauge of the API request budget shared by all sessions using this key"""
+    if not api_key:
+        return
+    budget = get_api_governor(api_key).snapshot()
+    st.progress(min(1.0, budget["available"] / budget["capacity"]),
+                text=f"API budget: {int(budget['available'])}/{int(budget['capacity'])} requests")
+    if budget["paused_for"] > 0:
+        st.caption(f"⏱️ Rate limited by the API, resuming in {budget['paused_for']:.0f}s")
+    else:
+        st.caption(f"Refills {budget['rate']:g}/s • {budget['lanes']} active session(s) • {budget['throttled']} rate limit(s) hit")
+
+
+def _format_ms(seconds) -> str:
+    return f"{seconds * 1000:.0f}" if seconds is not None else "–"
+
+
+def render_request_telemetry():
+    """Per-endpoint latency percentiles of every request made by this server process"""
+    endpoints = get_telemetry().snapshot()
+    if not endpoints:
+        st.caption("No API requests yet.")
+        return
+    rows = ["| Endpoint | Calls | p50 | p95 | p99 | Errors | Retries |", "|---|--:|--:|--:|--:|--:|--:|"]
+    for name, stats in endpoints.items():
+        latency = stats["latency"]
+        rows.append(f"| {name} | {stats['requests']} | {_format_ms(latency[50])} | {_format_ms(latency[95])} | "
+                    f"{_format_ms(latency[99])} | {stats['errors']} | {stats['retries']} |")
+    st.markdown("\n".join(rows))
+    received = sum(stats["bytes_received"] for stats in endpoints.values())
+    coalesced = get_result_cache().coalesced
+    st.caption(f"Latency in ms, all sessions • {received / 1024:.0f} KB received • "
+               f"{coalesced} duplicate lookups coalesced")
+
+
+def migrate_session_tasks(owner: str):
+    """Move task dicts kept in session state by earlier app versions into the task store"""
+    if not owner:
+        return
+    for key in LEGACY_TASK_KEYS:
+        legacy_tasks = st.session_state.get(key)
+        if isinstance(legacy_tasks, list):
+            get_task_store().import_tasks(owner, legacy_tasks)
+            del st.session_state[key]
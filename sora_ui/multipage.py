@@ -0,0 +1,712 @@
+"""Multi-page EntreMotivator dashboard (Home, Task List, Analytics, Pricing).
+
+5app.py and app66.py are thin entry points that call main() with their theme.
+"""
+import streamlit as st
+import time
+from datetime import datetime
+from typing import Optional, Dict, List
+
+from sora_core import api
+from sora_core.cache import get_result_cache, parse_result_urls
+from sora_core.callbacks import start_callback_receiver
+from sora_core.formatting import get_status_emoji
+from sora_core.polling import poll_due_tasks
+from sora_core.scheduler import get_scheduler
+from sora_core.models import Task, TaskState
+from sora_core.store import get_task_store, owner_key
+from sora_ui import charts
+from sora_ui.components import migrate_session_tasks, render_api_budget, render_lazy_media_toggle, render_pagination, render_request_telemetry, render_result_media
+from sora_ui.profiling import profile_section, render_profiler_panel, render_profiler_toggle, start_rerun_profile
+from sora_ui.styles import inject_css
+
+# --- Helper Functions ---
+
+def add_notification(message: str, type: str = "info"):
+    """Adds a notification to the session state."""
+    timestamp = datetime.now().strftime('%H:%M:%S')
+    st.session_state.notifications.insert(0, {"timestamp": timestamp, "message": message, "type": type})
+    # Keep only the last 10 notifications
+    st.session_state.notifications = st.session_state.notifications[:10]
+
+def calculate_stats(owner: str) -> Dict[str, float]:
+    """Calculates task statistics for the active task list."""
+    return get_task_store().stats(owner, include_archived=False)
+
+def get_performance_insights(owner: str) -> Dict[str, any]:
+    """Calculates performance-related insights."""
+    avg_processing_time = get_task_store().avg_cost_time(owner)
+    
+    # Hour of day with the most submissions
+    hour = get_task_store().peak_hour(owner)
+    peak_hour = f"{hour}:00" if hour is not None else "N/A"
+        
+    return {
+        "avg_processing_time": avg_processing_time,
+        "total_videos": get_task_store().count(owner, include_archived=True),
+        "favorite_count": len(st.session_state.favorites),
+        "peak_hour": peak_hour
+    }
+
+def count_api_call():
+    st.session_state.api_calls_count += 1
+
+def create_task(api_key: str, video_url: str, callback_url: Optional[str] = None) -> Dict:
+    """Calls the external API to create a new task."""
+    return api.create_task(api_key, video_url, callback_url, on_request=count_api_call)
+
+def query_task(api_key: str, task_id: str) -> Dict:
+    """Calls the external API to query the task status, unless the result is already cached."""
+    return api.query_task(api_key, task_id, on_request=count_api_call)
+
+def refresh_task_states(api_key: str, tasks: List[Task]):
+    """Concurrently polls the tasks that are due and updates them in place and in the store."""
+    network_calls = []
+    
+    def _query(api_key: str, task_id: str) -> Dict:
+        # Runs on worker threads, so it must not touch st.session_state
+        return api.query_task(api_key, task_id, on_request=lambda: network_calls.append(task_id))
+    
+    with profile_section("Poll"):
+        results = poll_due_tasks(_query, api_key, tasks, get_scheduler())
+    st.session_state.api_calls_count += len(network_calls)
+    
+    task_datas = [r["data"] for r in results.values() if r.get("code") == 200]
+    get_task_store().record_states(task_datas)
+    for task in tasks:
+        result = results[task.task_id]
+        if result.get("code") == 200:
+            task.apply(result.get("data"))
+
+def display_task_details(task: Task, idx: int, api_key: str):
+    """Displays the detailed view of a task."""
+    task_id = task.task_id
+    is_favorite = task_id in st.session_state.favorites
+    
+    with st.expander(f"🎬 Task Details: {task_id[:16]}... - {task.state.value.upper()}", expanded=False):
+        
+        col1, col2, col3 = st.columns(3)
+        
+        with col1:
+            st.metric("Task ID", f"`{task_id}`")
+            st.metric("Created At", task.created_text)
+            st.metric("Priority", task.priority)
+            
+        with col2:
+            st.metric("Status", task.state.value.upper())
+            st.metric("Processing Time", f"{task.cost_time:.1f}s" if task.cost_time is not None else "N/A")
+            st.metric("Callback URL", task.callback_url or 'None')
+            
+        with col3:
+            if st.button("🔄 Refresh Status", key=f"refresh_detail_{idx}", use_container_width=True):
+                st.rerun()
+            
+            if st.button("⭐ Toggle Favorite", key=f"fav_detail_{idx}", use_container_width=True):
+                if is_favorite:
+                    st.session_state.favorites.remove(task_id)
+                else:
+                    st.session_state.favorites.append(task_id)
+                st.rerun()
+            
+            if st.button("🗑️ Remove from List", key=f"remove_detail_{idx}", use_container_width=True):
+                get_task_store().archive(owner_key(api_key), task_id)
+                if is_favorite:
+                    st.session_state.favorites.remove(task_id)
+                add_notification(f"Removed task {task_id[:16]}...", "info")
+                st.rerun()
+        
+        st.markdown("---")
+        
+        st.markdown("#### Input Details")
+        st.code(task.video_url or 'N/A', language="text")
+        
+        # Rendered from the result cache or the stored result, never a blocking request
+        task_result = get_result_cache().peek(task_id) or task.to_response()
+        
+        if task.state is TaskState.SUCCESS:
+            st.markdown("#### Output Result")
+            
+            if task_result.get("code") == 200 and task_result["data"].get("resultJson"):
+                result_urls = parse_result_urls(task_result["data"])
+                
+                if result_urls:
+                    st.success("✅ Video Processed Successfully!")
+                    for url_idx, url in enumerate(result_urls):
+                        render_result_media(url, key=f"media_{task_id}_{url_idx}")
+                        st.markdown(f"[📥 Download Processed Video]({url})")
+                
+                if st.session_state.get('show_json', False):
+                    st.markdown("---")
+                    st.markdown("#### Raw JSON Response")
+                    st.json(task_result)
+            else:
+                st.warning("Result data not yet available or failed to retrieve.")
+        
+        elif task.state is TaskState.FAIL:
+            st.error("❌ Task Failed")
+            st.info(f"Error Message: {task.fail_msg or 'No error message provided.'}")
+            
+            if st.session_state.get('show_json', False):
+                st.markdown("---")
+                st.markdown("#### Raw JSON Response")
+                st.json(task_result)
+        
+        else:
+            st.info("Task is still processing or waiting.")
+
+# --- New: Multi-Page Navigation Functions ---
+
+def render_home_page(api_key):
+    st.markdown('<h1 class="main-header animated">Sora Watermark Remover Pro</h1>', unsafe_allow_html=True)
+    st.markdown('<p class="subtitle animated">Remove watermarks from your Sora videos with a single API call. Fast, reliable, and high-quality.</p>', unsafe_allow_html=True)
+
+    # Main Input Card
+    with st.container():
+        st.markdown('<div class="card animated">', unsafe_allow_html=True)
+        st.subheader("🚀 Submit New Video Task")
+        
+        video_url = st.text_input(
+            "Video URL",
+            placeholder="Paste your Sora video URL here (e.g., https://example.com/video.mp4)",
+            key="video_url_input"
+        )
+        
+        callback_url = st.text_input(
+            "Optional: Callback URL",
+            placeholder="Enter a URL to be notified when the task is complete",
+            key="callback_url_input"
+        )
+        
+        col_submit, col_example = st.columns([3, 1])
+        
+        with col_submit:
+            if st.button("✨ Start Watermark Removal", use_container_width=True):
+                if not api_key:
+                    st.error("🔑 Please enter your API Key in the sidebar first.")
+                elif not video_url:
+                    st.error("🔗 Please enter a valid Video URL.")
+                else:
+                    # Call API to create task
+                    with st.spinner("Submitting task to API..."):
+                        response = create_task(api_key, video_url, callback_url)
+                        
+                        if response.get("code") == 200:
+                            task_id = response["data"]["taskId"]
+                            get_task_store().add_task(owner_key(api_key), task_id, video_url, callback_url)
+                            add_notification(f"Task submitted successfully! ID: {task_id[:16]}...", "success")
+                            st.success(f"Task submitted! ID: `{task_id}`. Check the 'Task List' tab.")
+                            # Clear input fields
+                            st.session_state.video_url_input = ""
+                            st.session_state.callback_url_input = ""
+                            st.rerun()
+                        else:
+                            error_msg = response.get("msg", "Unknown API Error")
+                            st.error(f"Task submission failed: {error_msg}")
+                            add_notification(f"Task submission failed: {error_msg}", "fail")
+        
+        with col_example:
+            if st.button("Use Example URL", use_container_width=True):
+                st.session_state.video_url_input = "https://example.com/sora_sample_video.mp4"
+                st.rerun()
+        
+        st.markdown('</div>', unsafe_allow_html=True)
+
+    # --- New: Feature Showcase Section ---
+    st.markdown("---")
+    st.subheader("Key Features & Benefits")
+    
+    st.markdown('<div class="feature-grid">', unsafe_allow_html=True)
+    
+    # Feature 1
+    st.markdown("""
+    <div class="feature-card animated" style="animation-delay: 0.1s;">
+        <div class="feature-icon">⚡</div>
+        <h4>Ultra-Fast Processing</h4>
+        <p>Leverage our optimized infrastructure for minimal wait times. Get your clean video back in minutes, not hours.</p>
+    </div>
+    """, unsafe_allow_html=True)
+    
+    # Feature 2
+    st.markdown("""
+    <div class="feature-card animated" style="animation-delay: 0.2s;">
+        <div class="feature-icon">💎</div>
+        <h4>High-Fidelity Output</h4>
+        <p>Advanced AI models ensure the watermark removal is seamless, preserving the original video quality and detail.</p>
+    </div>
+    """, unsafe_allow_html=True)
+    
+    # Feature 3
+    st.markdown("""
+    <div class="feature-card animated" style="animation-delay: 0.3s;">
+        <div class="feature-icon">🔒</div>
+        <h4>Secure & Private</h4>
+        <p>Your videos are processed securely and deleted after a short period. Your privacy is our top priority.</p>
+    </div>
+    """, unsafe_allow_html=True)
+    
+    st.markdown('</div>', unsafe_allow_html=True)
+    
+    # --- New: Call to Action ---
+    st.markdown("---")
+    st.subheader("Ready to Get Started?")
+    st.info("Sign up on EntreMotivator.com to get your API key and start processing videos today!")
+    
+def render_task_list_page(api_key, page_size=20):
+    st.markdown('<h1 class="main-header" style="font-size: 2.5rem;">Task Management Dashboard</h1>', unsafe_allow_html=True)
+    st.markdown('<p class="subtitle">Monitor the status and retrieve the results of your video processing tasks.</p>', unsafe_allow_html=True)
+
+    if not api_key:
+        st.warning("🔑 Please configure your API Key in the sidebar to view and manage tasks.")
+        return
+
+    # --- Task List Filtering and Sorting ---
+    col_filter, col_sort, col_fav, col_refresh = st.columns([2, 2, 1, 1])
+    
+    status_filter = col_filter.selectbox(
+        "Filter by Status",
+        options=["All", "Waiting", "Success", "Fail"],
+        index=0
+    )
+    
+    sort_by = col_sort.selectbox(
+        "Sort by",
+        options=["Newest First", "Oldest First", "Status"],
+        index=0
+    )
+    
+    if col_fav.button("⭐ Favorites", use_container_width=True):
+        st.session_state.show_favorites = not st.session_state.show_favorites
+        st.rerun()
+        
+    if col_refresh.button("🔄 Manual Refresh", use_container_width=True):
+        st.rerun()
+
+    # Apply filters and sorting in the task store
+    owner = owner_key(api_key)
+    favorite_ids = st.session_state.favorites if st.session_state.show_favorites else None
+    state = None if status_filter == "All" else status_filter.lower()
+    order = {"Newest First": "newest", "Oldest First": "oldest", "Status": "status"}[sort_by]
+    total_matching = get_task_store().count(owner, state=state, task_ids=favorite_ids)
+    
+    if st.session_state.show_favorites:
+        st.info(f"Showing {total_matching} favorite tasks.")
+    
+    # Only the current page is fetched, polled and rendered
+    page = render_pagination(total_matching, page_size, key="task_list_page")
+    offset = page * page_size
+    tasks_to_display = get_task_store().list_tasks(owner, state=state, order=order, task_ids=favorite_ids,
+                                             limit=page_size, offset=offset)
+    
+    # Poll the tasks that are due on their adaptive schedule
+    refresh_task_states(api_key, tasks_to_display)
+
+    st.markdown("---")
+
+    if not tasks_to_display:
+        st.info("No tasks to display based on current filters.")
+    else:
+        for idx, task in enumerate(tasks_to_display, start=offset):
+            # Task Card Summary
+            task_id = task.task_id
+            status = task.state.value.upper()
+            is_favorite = task_id in st.session_state.favorites
+            
+            # Use the custom CSS class for a nicer look
+            st.markdown(f'<div class="task-card slide-in">', unsafe_allow_html=True)
+            
+            col_sum_1, col_sum_2, col_sum_3, col_sum_4 = st.columns([3, 2, 2, 1])
+            
+            with col_sum_1:
+                st.markdown(f"**Task ID:** `{task_id[:16]}...`")
+                st.caption(f"Created: {task.created_text}")
+            
+            with col_sum_2:
+                st.markdown(f"**Status:** <span class='status-badge status-{status.lower()}'>{get_status_emoji(status)} {status}</span>", unsafe_allow_html=True)
+            
+            with col_sum_3:
+                st.markdown(f"**Time:** {task.cost_time:.1f}s" if task.cost_time is not None else "**Time:** N/A")
+            
+            with col_sum_4:
+                if st.button("Details", key=f"show_details_{idx}", use_container_width=True):
+                    # Toggle the expander state in session state if needed, but for now, rely on the expander below
+                    pass 
+            
+            st.markdown('</div>', unsafe_allow_html=True)
+            
+            # Detailed View (Expander)
+            display_task_details(task, idx, api_key)
+            
+def render_history_analytics(owner: str):
+    """Throughput, latency percentiles, failure codes and queue waits over a time window."""
+    # pandas/NumPy are only needed here, so other pages never pay for importing them
+    from sora_core import analytics
+    
+    st.subheader("Throughput & Latency")
+    
+    window = st.selectbox("Time window", options=list(analytics.WINDOWS), index=1, key="analytics_window")
+    seconds = analytics.WINDOWS[window]
+    since = time.time() - seconds if seconds else None
+    with profile_section("Aggregates"):
+        summary = analytics.summarize(analytics.load_frame(get_task_store(), owner, since=since))
+    
+    if summary["total"] == 0:
+        st.info("No tasks in this time window yet.")
+        return
+    
+    col1, col2, col3, col4 = st.columns(4)
+    col1.metric("p50 Processing", analytics.format_seconds(summary["cost_time"][50]))
+    col2.metric("p90 Processing", analytics.format_seconds(summary["cost_time"][90]))
+    col3.metric("p99 Processing", analytics.format_seconds(summary["cost_time"][99]))
+    col4.metric("Failure Rate", f"{summary['failure_rate'] * 100:.1f}%")
+    
+    throughput = summary["throughput"]
+    if not throughput.empty:
+        st.markdown("#### Tasks per Hour")
+        st.plotly_chart(charts.throughput_bars(throughput), use_container_width=True)
+    
+    col_fail, col_wait = st.columns(2)
+    
+    with col_fail:
+        st.markdown("#### Failures by Code")
+        failures = summary["failures"]
+        if failures.empty:
+            st.caption("No failed tasks in this window.")
+        else:
+            st.dataframe(
+                failures.assign(rate=(failures["rate"] * 100).round(1)).rename(
+                    columns={"fail_code": "Fail Code", "tasks": "Tasks", "rate": "% of Finished"}
+                ),
+                hide_index=True,
+                use_container_width=True
+            )
+    
+    with col_wait:
+        st.markdown("#### Queue Wait")
+        waits = summary["queue_wait"]
+        st.caption(f"p50 {analytics.format_seconds(waits[50])} • p90 {analytics.format_seconds(waits[90])} • p99 {analytics.format_seconds(waits[99])}")
+        st.plotly_chart(charts.queue_wait_bars(summary["queue_wait_histogram"]), use_container_width=True)
+
+def render_analytics_page(api_key):
+    st.markdown('<h1 class="main-header" style="font-size: 2.5rem;">Performance Analytics</h1>', unsafe_allow_html=True)
+    st.markdown('<p class="subtitle">Deep dive into your video processing usage and performance metrics.</p>', unsafe_allow_html=True)
+
+    owner = owner_key(api_key) if api_key else ""
+    stats = calculate_stats(owner)
+    insights = get_performance_insights(owner)
+    
+    # --- Metrics Grid ---
+    st.subheader("Overall Performance")
+    
+    col1, col2, col3, col4 = st.columns(4)
+    
+    with col1:
+        st.markdown('<div class="metric-card">', unsafe_allow_html=True)
+        st.markdown('<div class="metric-label">Total Tasks</div>', unsafe_allow_html=True)
+        st.markdown(f'<div class="metric-value">{stats["total"]}</div>', unsafe_allow_html=True)
+        st.markdown('</div>', unsafe_allow_html=True)
+        
+    with col2:
+        st.markdown('<div class="metric-card" style="background: linear-gradient(135deg, #28A745 0%, #20C997 100%);">', unsafe_allow_html=True)
+        st.markdown('<div class="metric-label">Success Rate</div>', unsafe_allow_html=True)
+        st.markdown(f'<div class="metric-value">{stats["success_rate"]:.1f}%</div>', unsafe_allow_html=True)
+        st.markdown('</div>', unsafe_allow_html=True)
+        
+    with col3:
+        st.markdown('<div class="metric-card" style="background: linear-gradient(135deg, #FFA500 0%, #FF8C00 100%);">', unsafe_allow_html=True)
+        st.markdown('<div class="metric-label">Avg. Time</div>', unsafe_allow_html=True)
+        st.markdown(f'<div class="metric-value">{insights["avg_processing_time"]:.1f}s</div>', unsafe_allow_html=True)
+        st.markdown('</div>', unsafe_allow_html=True)
+        
+    with col4:
+        st.markdown('<div class="metric-card" style="background: linear-gradient(135deg, #DC3545 0%, #C82333 100%);">', unsafe_allow_html=True)
+        st.markdown('<div class="metric-label">Failed Tasks</div>', unsafe_allow_html=True)
+        st.markdown(f'<div class="metric-value">{stats["failed"]}</div>', unsafe_allow_html=True)
+        st.markdown('</div>', unsafe_allow_html=True)
+
+    st.markdown("---")
+    
+    # --- Task Status Distribution Chart (New Feature) ---
+    st.subheader("Task Status Distribution")
+    
+    st.plotly_chart(charts.status_pie(stats['success'], stats['waiting'], stats['failed']), use_container_width=True)
+    
+    st.markdown("---")
+    
+    render_history_analytics(owner)
+    
+    st.markdown("---")
+    
+    # --- Timeline of Recent Tasks (New Feature) ---
+    st.subheader("Recent Task Timeline")
+    
+    recent_tasks = get_task_store().list_tasks(owner, order="newest", limit=5) if owner else [] # Show last 5 tasks
+    
+    if recent_tasks:
+        for task in recent_tasks:
+            status = task.state.value.upper()
+            st.markdown(f"""
+            <div class="timeline-item">
+                <p style="margin-bottom: 0.2rem;">
+                    <strong>{status}</strong> for Task `{task.task_id[:10]}...`
+                    <span class='status-badge status-{status.lower()}' style="margin-left: 10px;">{get_status_emoji(status)} {status}</span>
+                </p>
+                <small style="color: #999;">{task.created_text}</small>
+            </div>
+            """, unsafe_allow_html=True)
+    else:
+        st.info("No recent tasks to show in the timeline.")
+
+def render_pricing_page():
+    st.markdown('<h1 class="main-header" style="font-size: 2.5rem;">Pricing & Plans</h1>', unsafe_allow_html=True)
+    st.markdown('<p class="subtitle">Choose the plan that best fits your video processing needs.</p>', unsafe_allow_html=True)
+
+    col1, col2, col3 = st.columns(3)
+    
+    # Plan 1: Basic
+    with col1:
+        st.markdown('<div class="pricing-card animated" style="animation-delay: 0.1s;">', unsafe_allow_html=True)
+        st.subheader("Basic")
+        st.markdown("## $9/mo")
+        st.caption("Billed Annually")
+        st.markdown("---")
+        st.markdown("""
+        - ✅ 50 Video Tasks/mo
+        - ✅ Standard Processing Speed
+        - ✅ Email Support
+        - ❌ Priority Queue
+        - ❌ Advanced Analytics
+        """)
+        st.button("Select Basic", key="basic_plan", use_container_width=True)
+        st.markdown('</div>', unsafe_allow_html=True)
+
+    # Plan 2: Pro (Popular)
+    with col2:
+        st.markdown('<div class="pricing-card pricing-popular animated" style="animation-delay: 0.2s;">', unsafe_allow_html=True)
+        st.markdown('<div class="popular-tag">Most Popular</div>', unsafe_allow_html=True)
+        st.subheader("Pro")
+        st.markdown("## $29/mo")
+        st.caption("Billed Annually")
+        st.markdown("---")
+        st.markdown("""
+        - ✅ 250 Video Tasks/mo
+        - ✅ **High-Speed Processing**
+        - ✅ Priority Support
+        - ✅ Priority Queue
+        - ✅ Advanced Analytics
+        """)
+        st.button("Select Pro", key="pro_plan", use_container_width=True)
+        st.markdown('</div>', unsafe_allow_html=True)
+
+    # Plan 3: Enterprise
+    with col3:
+        st.markdown('<div class="pricing-card animated" style="animation-delay: 0.3s;">', unsafe_allow_html=True)
+        st.subheader("Enterprise")
+        st.markdown("## Custom")
+        st.caption("Contact Sales")
+        st.markdown("---")
+        st.markdown("""
+        - ✅ Unlimited Video Tasks
+        - ✅ Dedicated Infrastructure
+        - ✅ 24/7 Phone Support
+        - ✅ Custom SLA
+        - ✅ On-Premise Option
+        """)
+        st.button("Contact Sales", key="enterprise_plan", use_container_width=True)
+        st.markdown('</div>', unsafe_allow_html=True)
+        
+    st.markdown("---")
+    st.info("All plans come with a 7-day free trial. Cancel anytime.")
+
+def init_session_state():
+    """Initialize session state"""
+    if 'auto_refresh' not in st.session_state:
+        st.session_state.auto_refresh = False
+    if 'theme' not in st.session_state:
+        st.session_state.theme = 'dark'
+    if 'notifications' not in st.session_state:
+        st.session_state.notifications = []
+    if 'favorites' not in st.session_state:
+        st.session_state.favorites = []
+    if 'total_processing_time' not in st.session_state:
+        st.session_state.total_processing_time = 0
+    if 'api_calls_count' not in st.session_state:
+        st.session_state.api_calls_count = 0
+    if 'show_favorites' not in st.session_state:
+        st.session_state.show_favorites = False
+    if 'example_url' not in st.session_state:
+        st.session_state.example_url = ""
+    if 'page' not in st.session_state:
+        st.session_state.page = 'home' # New state for multi-page structure
+
+def main(colorful_background: bool = False):
+    """Render one run of the app; `colorful_background` adds the gradient page background"""
+    # Page configuration
+    st.set_page_config(
+        page_title="Sora Watermark Remover Pro - EntreMotivator",
+        page_icon="🎬",
+        layout="wide",
+        initial_sidebar_state="expanded"
+    )
+    
+    # Opt-in per-section timing of this rerun (sidebar "Profile reruns")
+    profiler = start_rerun_profile()
+    profiler.mark("Setup")
+    
+    # Hide the Streamlit menu, footer and deploy header, then apply the shared theme
+    inject_css(*(["hide_chrome", "theme", "colorful"] if colorful_background else ["hide_chrome", "theme"]))
+    
+    init_session_state()
+    
+    # API Configuration
+    try:
+        API_KEY = st.secrets.get("api_key", "")
+    except:
+        API_KEY = ""
+    
+    # Receive completion callbacks in-process when SORA_CALLBACK_PUBLIC_URL is set
+    start_callback_receiver()
+    
+    # Per-task adaptive polling schedule, seeded with historical processing times
+    get_scheduler(get_task_store().recent_cost_times)
+    
+    # --- Sidebar ---
+    profiler.mark("Sidebar")
+    with st.sidebar:
+        st.markdown('<h1 class="main-header" style="font-size: 2rem; text-align: left;">Sora Watermark Remover Pro</h1>', unsafe_allow_html=True)
+        st.markdown('<p class="subtitle" style="text-align: left; margin-bottom: 1rem;">Powered by EntreMotivator</p>', unsafe_allow_html=True)
+
+        # --- New: Navigation Menu ---
+        st.subheader("🧭 Navigation")
+
+        # Use radio buttons for navigation
+        page_selection = st.radio(
+            "Go to",
+            ('Home', 'Task List', 'Analytics', 'Pricing'),
+            index=['Home', 'Task List', 'Analytics', 'Pricing'].index(st.session_state.page.title()),
+            key="page_selector"
+        )
+        st.session_state.page = page_selection.lower()
+
+        st.markdown("---")
+
+        # API Key Input
+        st.subheader("🔑 API Configuration")
+
+        api_key = API_KEY
+        if not api_key:
+            api_key = st.text_input(
+                "Enter API Key",
+                type="password",
+                help="Get your API key from EntreMotivator.com"
+            )
+            if api_key:
+                st.info("💡 Tip: Add API key to .streamlit/secrets.toml for permanent storage")
+
+        st.markdown("---")
+
+        # Settings Section
+        st.subheader("⚡ Settings")
+
+        auto_refresh = st.checkbox(
+            "Auto-refresh tasks",
+            value=st.session_state.auto_refresh,
+            help="Automatically refresh task status every 10 seconds"
+        )
+        st.session_state.auto_refresh = auto_refresh
+
+        refresh_interval = st.slider(
+            "Refresh interval (seconds)",
+            min_value=5,
+            max_value=60,
+            value=10,
+            disabled=not auto_refresh
+        )
+
+        render_lazy_media_toggle()
+        render_profiler_toggle()
+
+        show_notifications = st.checkbox("Show notifications", value=True)
+
+        enable_sound = st.checkbox("Enable completion sounds", value=False)
+
+        show_advanced = st.checkbox("Show advanced options", value=False)
+        max_tasks = 20
+
+        if show_advanced:
+            st.markdown("---")
+            st.subheader("🔧 Advanced Options")
+            max_tasks = st.number_input("Tasks per page", min_value=5, max_value=100, value=20)
+            st.session_state.show_json = st.checkbox("Show raw JSON responses", value=False)
+            enable_analytics = st.checkbox("Enable analytics tracking", value=True)
+            video_quality = st.select_slider(
+                "Output quality preference",
+                options=["Standard", "High", "Ultra"],
+                value="High"
+            )
+
+        st.markdown("---")
+
+        # Statistics Section
+        st.subheader("📊 Quick Stats")
+        owner = owner_key(api_key) if api_key else ""
+        migrate_session_tasks(owner)
+        with profile_section("Stats"):
+            stats = calculate_stats(owner)
+
+        col1, col2 = st.columns(2)
+        with col1:
+            st.metric("Total Tasks", stats['total'])
+            st.metric("Successful", stats['success'], delta=None)
+        with col2:
+            st.metric("Waiting", stats['waiting'])
+            st.metric("Failed", stats['failed'])
+
+        if stats['total'] > 0:
+            st.progress(stats['success_rate'] / 100)
+            st.caption(f"Success Rate: {stats['success_rate']:.1f}%")
+
+        # Performance Metrics
+        st.markdown("---")
+        st.subheader("⚡ Performance")
+        with profile_section("Insights"):
+            insights = get_performance_insights(owner)
+
+        st.metric("Avg Processing", f"{insights['avg_processing_time']:.1f}s")
+        st.metric("Total Videos", insights['total_videos'])
+        st.metric("API Calls", st.session_state.api_calls_count)
+        render_api_budget(api_key)
+        render_request_telemetry()
+
+        # --- New: Notifications Panel ---
+        st.markdown("---")
+        st.subheader("🔔 Notifications")
+
+        if st.session_state.notifications:
+            for notif in st.session_state.notifications:
+                if notif['type'] == 'success':
+                    st.success(f"[{notif['timestamp']}] {notif['message']}")
+                elif notif['type'] == 'fail':
+                    st.error(f"[{notif['timestamp']}] {notif['message']}")
+                else:
+                    st.info(f"[{notif['timestamp']}] {notif['message']}")
+        else:
+            st.caption("No recent notifications.")
+
+    # --- Main App Logic (Multi-Page Router) ---
+    profiler.mark(st.session_state.page.title())
+
+    if st.session_state.page == 'home':
+        render_home_page(api_key)
+    elif st.session_state.page == 'task list':
+        # Auto-refresh reruns only the task list fragment; the sidebar and the script thread stay free
+        run_every = refresh_interval if st.session_state.auto_refresh else None
+        if run_every:
+            st.caption(f"🔄 Auto-refresh enabled. The task list updates every {refresh_interval} seconds.")
+        st.fragment(run_every=run_every)(render_task_list_page)(api_key, max_tasks)
+    elif st.session_state.page == 'analytics':
+        render_analytics_page(api_key)
+    elif st.session_state.page == 'pricing':
+        render_pricing_page()
+    
+    profiler.finish()
+    render_profiler_panel(profiler)
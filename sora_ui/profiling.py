@@ -0,0 +1,204 @@
+"""Opt-in profiler for whole-script reruns.
+
+With "Profile reruns" ticked in the sidebar, each rerun is split into named
+phases (`mark`) with optional nested sections (`profile_section`), timed
+with perf_counter. The breakdown of the last rerun and a rolling history of
+recent reruns are shown in a panel at the bottom of the page, and the whole
+rerun can additionally be captured with cProfile and downloaded as a .prof
+file (readable with pstats or snakeviz).
+
+Only the script thread is profiled: time spent waiting on polling worker
+threads shows up in the section that waited. Fragment-only reruns (the
+auto-refreshing task list) are not profiled.
+"""
+import cProfile
+import io
+import marshal
+import pstats
+import time
+from collections import deque
+from contextlib import contextmanager
+from typing import Dict, List, Optional
+
+import streamlit as st
+
+PROFILE_HISTORY = 50
+TOP_FUNCTIONS = 20
+
+_PROFILER_KEY = "_rerun_profiler"
+_HISTORY_KEY = "_rerun_profile_history"
+
+
+class Section:
+    __slots__ = ("name", "depth", "seconds")
+
+    def __init__(self, name: str, depth: int):
+        self.name = name
+        self.depth = depth
+        self.seconds = 0.0
+
+
+class RerunProfiler:
+    """Section timings (and optionally a cProfile capture) of one rerun"""
+
+    def __init__(self, enabled: bool = False, capture: bool = False):
+        self.enabled = enabled
+        self.finished = False
+        self.total: Optional[float] = None
+        self.sections: List[Section] = []
+        self.dump: Optional[bytes] = None
+        self.top_functions = ""
+        self._started = time.perf_counter()
+        self._phase: Optional[Section] = None
+        self._phase_started = 0.0
+        self._depth = 0
+        self._profile: Optional[cProfile.Profile] = None
+        if enabled and capture:
+            profile = cProfile.Profile()
+            try:
+                profile.enable()
+                self._profile = profile
+            except ValueError:
+                # Another profiler is already active on this thread
+                pass
+
+    @property
+    def active(self) -> bool:
+        return self.enabled and not self.finished
+
+    def _close_phase(self, now: float):
+        if self._phase is not None:
+            self._phase.seconds = now - self._phase_started
+            self._phase = None
+
+    def mark(self, name: str):
+        """End the current top-level phase and start the next one"""
+        if not self.active:
+            return
+        now = time.perf_counter()
+        self._close_phase(now)
+        self._phase = Section(name, 0)
+        self._phase_started = now
+        self.sections.append(self._phase)
+
+    @contextmanager
+    def section(self, name: str):
+        """Time a block nested in the current phase"""
+        if not self.active:
+            yield
+            return
+        section = Section(name, self._depth + (self._phase is not None))
+        self.sections.append(section)
+        self._depth += 1
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            section.seconds = time.perf_counter() - start
+            self._depth -= 1
+
+    def abandon(self):
+        """Stop a capture left running by a rerun that was interrupted before finish()"""
+        if self._profile is not None and not self.finished:
+            self._profile.disable()
+        self.finished = True
+
+    def finish(self):
+        """Stop timing and add this rerun to the session's history"""
+        if not self.active:
+            return
+        now = time.perf_counter()
+        self._close_phase(now)
+        self.total = now - self._started
+        self.finished = True
+        if self._profile is not None:
+            self._profile.disable()
+            self._profile.create_stats()
+            # Same format as Profile.dump_stats, without a temporary file
+            self.dump = marshal.dumps(self._profile.stats)
+            out = io.StringIO()
+            pstats.Stats(self._profile, stream=out).sort_stats("cumulative").print_stats(TOP_FUNCTIONS)
+            self.top_functions = out.getvalue()
+        history = st.session_state.setdefault(_HISTORY_KEY, deque(maxlen=PROFILE_HISTORY))
+        history.append({
+            "at": time.time(),
+            "total": self.total,
+            "phases": {s.name: s.seconds for s in self.sections if s.depth == 0},
+        })
+
+
+def start_rerun_profile() -> RerunProfiler:
+    """Create this rerun's profiler (enabled by the sidebar toggle); call at the top of the script"""
+    previous = st.session_state.get(_PROFILER_KEY)
+    if previous is not None:
+        previous.abandon()
+    profiler = RerunProfiler(
+        st.session_state.get("profile_reruns", False),
+        st.session_state.get("profile_cprofile", False),
+    )
+    st.session_state[_PROFILER_KEY] = profiler
+    return profiler
+
+
+def current_profiler() -> RerunProfiler:
+    """The profiler of the running rerun (a disabled one outside a profiled rerun)"""
+    return st.session_state.get(_PROFILER_KEY) or RerunProfiler()
+
+
+@contextmanager
+def profile_section(name: str):
+    """Time a block as a section of the current rerun, if profiling is on"""
+    with current_profiler().section(name):
+        yield
+
+
+def render_profiler_toggle():
+    """Sidebar switches for the rerun profiler"""
+    st.checkbox("Profile reruns", key="profile_reruns",
+                help="Time each section of every rerun and show the breakdown at the bottom of the page")
+    if st.session_state.get("profile_reruns"):
+        st.checkbox("Capture cProfile", key="profile_cprofile",
+                    help="Also record a full cProfile of each rerun (slower) for download")
+
+
+def _ms(seconds: float) -> str:
+    return f"{seconds * 1000:.1f}"
+
+
+def _percentile(values: List[float], q: float) -> float:
+    ordered = sorted(values)
+    return ordered[min(len(ordered) - 1, int(q / 100 * len(ordered)))]
+
+
+def render_profiler_panel(profiler: RerunProfiler):
+    """Breakdown of the finished rerun and the rolling history"""
+    if not profiler.enabled or not profiler.finished:
+        return
+    with st.expander(f"⏱️ Rerun profile: {_ms(profiler.total)} ms", expanded=True):
+        rows = ["| Section | ms | Share |", "|---|--:|--:|"]
+        accounted = 0.0
+        for section in profiler.sections:
+            if section.depth == 0:
+                accounted += section.seconds
+            indent = "&nbsp;&nbsp;&nbsp;&nbsp;" * section.depth
+            rows.append(f"| {indent}{section.name} | {_ms(section.seconds)} | {section.seconds / profiler.total:.0%} |")
+        other = max(0.0, profiler.total - accounted)
+        rows.append(f"| *(outside sections)* | {_ms(other)} | {other / profiler.total:.0%} |")
+        st.markdown("\n".join(rows))
+
+        history = list(st.session_state.get(_HISTORY_KEY, []))
+        if len(history) > 1:
+            phases: Dict[str, List[float]] = {}
+            for run in history:
+                for name, seconds in run["phases"].items():
+                    phases.setdefault(name, []).append(seconds)
+            phases["Total"] = [run["total"] for run in history]
+            rows = [f"**Last {len(history)} reruns**", "", "| Section | p50 ms | p95 ms | max ms |", "|---|--:|--:|--:|"]
+            for name, values in phases.items():
+                rows.append(f"| {name} | {_ms(_percentile(values, 50))} | {_ms(_percentile(values, 95))} | {_ms(max(values))} |")
+            st.markdown("\n".join(rows))
+
+        if profiler.dump is not None:
+            st.download_button("📥 Download cProfile dump", data=profiler.dump,
+                               file_name=f"rerun-{int(time.time())}.prof", mime="application/octet-stream")
+            st.code(profiler.top_functions, language="text")
@@ -0,0 +1,48 @@
+"""Stylesheets shipped as static files instead of inline strings in every app.
+
+Each stylesheet is read and minified once per process and emitted as a
+style-only `st.html` element. Because its bytes are identical on every rerun,
+Streamlit's forward message cache (see .streamlit/config.toml) lets the
+browser keep the first copy and later reruns send only a hash reference
+instead of the whole stylesheet.
+"""
+import os
+import re
+from functools import lru_cache
+
+import streamlit as st
+
+STATIC_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), "static")
+
+_COMMENTS = re.compile(r"/\*.*?\*/", re.DOTALL)
+_WHITESPACE = re.compile(r"\s+")
+_PUNCTUATION_SPACE = re.compile(r"\s*([{};,>])\s*")
+# Only after colons: a space before one is a descendant combinator (`div :hover`)
+_COLON_SPACE = re.compile(r":\s+")
+
+
+def minify_css(css: str) -> str:
+    """Drop comments and redundant whitespace"""
+    css = _WHITESPACE.sub(" ", _COMMENTS.sub("", css))
+    css = _COLON_SPACE.sub(":", _PUNCTUATION_SPACE.sub(r"\1", css))
+    return css.replace(";}", "}").strip()
+
+
+@lru_cache(maxsize=None)
+def load_css(*names: str) -> str:
+    """Concatenated, minified contents of static/<name>.css, read once per process"""
+    parts = []
+    for name in names:
+        with open(os.path.join(STATIC_DIR, f"{name}.css"), encoding="utf-8") as f:
+            parts.append(minify_css(f.read()))
+    return "".join(parts)
+
+
+@lru_cache(maxsize=None)
+def _style_block(*names: str) -> str:
+    return f"<style>{load_css(*names)}</style>"
+
+
+def inject_css(*names: str):
+    """Add the named stylesheets to the page"""
+    st.html(_style_block(*names))
@@ -0,0 +1,27 @@
+from sora_core.bulk import submit_bulk
+
+
+def test_rate_limited_submission_is_not_retried():
+    calls = []
+
+    def create(api_key, url, callback_url):
+        calls.append(url)
+        return {"code": 429, "msg": "Rate Limit Exceeded", "retry_after": 1}
+
+    results = list(submit_bulk(create, "key", ["https://sora.chatgpt.com/p/s_1"], rate_per_sec=1000))
+    assert calls == ["https://sora.chatgpt.com/p/s_1"]
+    assert results[0][1]["code"] == 429
+
+
+def test_submission_held_back_by_the_governor_is_sent_later():
+    calls = []
+
+    def create(api_key, url, callback_url):
+        calls.append(url)
+        if len(calls) < 3:
+            return {"code": 429, "msg": "Rate Limit Exceeded", "retry_after": 1, "throttled": True}
+        return {"code": 200, "data": {"taskId": "t1"}}
+
+    results = list(submit_bulk(create, "key", ["https://sora.chatgpt.com/p/s_1"], rate_per_sec=1000))
+    assert len(calls) == 3
+    assert results[0][1]["code"] == 200
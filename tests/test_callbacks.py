@@ -0,0 +1,56 @@
+from sora_core.cache import TaskResultCache
+from sora_core.callbacks import CallbackReceiver
+
+
+def test_receiver_keeps_injected_empty_cache():
+    cache = TaskResultCache()
+    receiver = CallbackReceiver("http://hooks.example.com", port=0, cache=cache)
+    assert receiver.cache is cache
+
+
+def test_ingest_stores_in_injected_cache():
+    cache = TaskResultCache()
+    receiver = CallbackReceiver("http://hooks.example.com", port=0, cache=cache)
+    assert receiver.ingest({"code": 200, "data": {"taskId": "t1", "state": "success"}})
+    assert cache.peek("t1")["data"]["state"] == "success"
+
+
+def test_failed_bind_is_not_retried(monkeypatch):
+    from sora_core import callbacks
+
+    attempts = []
+
+    def fail_start(self):
+        attempts.append(self.port)
+        raise OSError("Address already in use")
+
+    monkeypatch.setenv("SORA_CALLBACK_PUBLIC_URL", "http://hooks.example.com")
+    monkeypatch.setattr(callbacks, "_receiver", None)
+    monkeypatch.setattr(callbacks, "_receiver_failed", False)
+    monkeypatch.setattr(CallbackReceiver, "start", fail_start)
+    assert callbacks.start_callback_receiver() is None
+    assert callbacks.start_callback_receiver() is None
+    assert callbacks.get_callback_url() is None
+    assert len(attempts) == 1
+
+
+def test_oversized_body_reports_413():
+    import http.client
+    import json
+
+    from sora_core.callbacks import CALLBACK_PATH, MAX_BODY_BYTES
+
+    receiver = CallbackReceiver("http://hooks.example.com", host="127.0.0.1", port=0, cache=TaskResultCache())
+    receiver.start()
+    try:
+        conn = http.client.HTTPConnection("127.0.0.1", receiver.port, timeout=5)
+        # Only the declared length is checked, so no body needs to be sent
+        conn.putrequest("POST", f"{CALLBACK_PATH}?token={receiver.token}")
+        conn.putheader("Content-Length", str(MAX_BODY_BYTES + 1))
+        conn.endheaders()
+        response = conn.getresponse()
+        assert response.status == 413
+        assert json.loads(response.read())["code"] == 413
+        conn.close()
+    finally:
+        receiver.stop()
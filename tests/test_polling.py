@@ -0,0 +1,89 @@
+import pytest
+
+from sora_core.cache import get_result_cache
+from sora_core.models import Task
+from sora_core.polling import poll_due_tasks
+from sora_core.ratelimit import get_api_governor
+from sora_core.scheduler import PollScheduler
+
+
+def _response(task_id, state, cost_ms=None):
+    data = {"taskId": task_id, "state": state}
+    if cost_ms is not None:
+        data["costTime"] = cost_ms
+    return {"code": 200, "data": data}
+
+
+@pytest.fixture
+def cache():
+    cache = get_result_cache()
+    cache.clear()
+    yield cache
+    cache.clear()
+
+
+def _governor(api_key, rate, burst):
+    governor = get_api_governor(api_key)
+    governor.bucket.set_rate(rate, burst)
+    return governor
+
+
+def test_renders_of_finished_tasks_add_no_cost_samples(cache):
+    _governor("test-finished-samples", 1e9, 1e9)
+    tasks = [Task(f"done{i}", state="success", created_at=0.0) for i in range(5)]
+    for task in tasks:
+        cache.put(task.task_id, _response(task.task_id, "success", 20000))
+    scheduler = PollScheduler()
+    for _ in range(10):
+        poll_due_tasks(lambda api_key, task_id: cache.peek(task_id), "test-finished-samples", tasks, scheduler)
+    assert len(scheduler.model) == 0
+
+
+def test_finished_tasks_do_not_use_the_poll_budget(cache):
+    _governor("test-budget", 0.001, 5)
+    finished = [Task(f"done{i}", state="success", created_at=0.0) for i in range(10)]
+    for task in finished:
+        cache.put(task.task_id, _response(task.task_id, "success", 20000))
+    waiting = Task("waiting", created_at=0.0)
+    queried = []
+
+    def query(api_key, task_id):
+        queried.append(task_id)
+        return _response(task_id, "waiting")
+
+    scheduler = PollScheduler(base_interval=0.0, min_interval=0.0)
+    for _ in range(5):
+        poll_due_tasks(query, "test-budget", finished + [waiting], scheduler)
+    assert queried == ["waiting"] * 5
+
+
+def test_tasks_skipped_for_budget_keep_their_stored_state(cache):
+    _governor("test-no-budget", 1.0, 1).bucket.pause(60)
+    result_json = '{"resultUrls": ["https://example.com/out.mp4"]}'
+    waiting = Task("waiting", created_at=0.0)
+    done = Task("done", state="success", created_at=0.0, cost_time=12.0, result_json=result_json)
+
+    def query(api_key, task_id):
+        raise AssertionError("no request expected without budget")
+
+    results = poll_due_tasks(query, "test-no-budget", [waiting, done], PollScheduler())
+    assert results["waiting"]["code"] == 200
+    assert results["waiting"]["data"]["state"] == "waiting"
+    assert results["done"]["data"]["state"] == "success"
+    # Finished tasks seed the cache from the store, so results render without a request
+    assert cache.result_urls("done") == ["https://example.com/out.mp4"]
+
+
+def test_task_finished_by_callback_leaves_the_schedule(cache):
+    _governor("test-callback-finish", 1e9, 1e9)
+    task = Task("cb", created_at=0.0)
+    scheduler = PollScheduler()
+    poll_due_tasks(lambda api_key, task_id: _response(task_id, "waiting"), "test-callback-finish", [task], scheduler)
+    assert scheduler.next_poll_at(["cb"]) is not None
+
+    # The callback receiver stores the finished state; no poll sees it
+    cache.put("cb", _response("cb", "success", 20000))
+    for _ in range(3):
+        poll_due_tasks(lambda api_key, task_id: None, "test-callback-finish", [task], scheduler)
+    assert scheduler.next_poll_at(["cb"]) is None
+    assert len(scheduler.model) == 1
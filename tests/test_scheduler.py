@@ -0,0 +1,38 @@
+from sora_core.scheduler import STALE_AFTER, CostTimeModel, PollScheduler
+
+
+def _response(state, cost_ms=None):
+    data = {"taskId": "t", "state": state}
+    if cost_ms is not None:
+        data["costTime"] = cost_ms
+    return {"code": 200, "data": data}
+
+
+def test_cost_time_sampled_once_per_completion():
+    scheduler = PollScheduler()
+    for i in range(5):
+        scheduler.record_poll(f"t{i}", 0.0, _response("waiting"), now=1.0)
+    for _ in range(10):
+        for i in range(5):
+            scheduler.record_poll(f"t{i}", 0.0, _response("success", 20000), now=30.0)
+    assert len(scheduler.model) == 5
+
+
+def test_unscheduled_finished_task_adds_no_sample():
+    scheduler = PollScheduler()
+    scheduler.record_poll("t", 0.0, _response("success", 20000), now=30.0)
+    assert len(scheduler.model) == 0
+
+
+def test_keeps_injected_empty_model():
+    model = CostTimeModel()
+    assert PollScheduler(model).model is model
+
+
+
+def test_stale_entries_are_pruned():
+    scheduler = PollScheduler()
+    scheduler.record_poll("archived", 0.0, _response("waiting"), now=1.0)
+    scheduler.record_poll("visible", 0.0, _response("waiting"), now=STALE_AFTER + 1000.0)
+    assert len(scheduler) == 1
+    assert scheduler.next_poll_at(["archived"]) is None
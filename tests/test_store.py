@@ -0,0 +1,60 @@
+import pytest
+
+from sora_core.store import TaskStore, owner_key
+
+OWNER = owner_key("test-key")
+
+
+@pytest.fixture
+def store(tmp_path):
+    return TaskStore(str(tmp_path / "tasks.db"))
+
+
+def _changes(store, datas):
+    conn = store._connect()
+    before = conn.total_changes
+    store.record_states(datas)
+    return conn.total_changes - before
+
+
+def test_unchanged_waiting_rows_are_not_rewritten(store):
+    store.add_task(OWNER, "t1", "https://sora.chatgpt.com/p/s_1")
+    waiting = {"taskId": "t1", "state": "waiting", "failMsg": "", "resultJson": ""}
+    assert _changes(store, [waiting]) == 0
+    assert _changes(store, [dict(waiting, state="generating")]) > 0
+    assert _changes(store, [dict(waiting, state="generating")]) == 0
+
+
+def test_finished_rows_are_written_once_and_never_regress(store):
+    store.add_task(OWNER, "t1", "https://sora.chatgpt.com/p/s_1")
+    success = {"taskId": "t1", "state": "success", "costTime": 12345, "resultJson": '{"resultUrls": []}'}
+    assert _changes(store, [success]) > 0
+    assert _changes(store, [success]) == 0
+    # A stale waiting response (e.g. an old cache entry) must not undo the result
+    assert _changes(store, [{"taskId": "t1", "state": "waiting"}]) == 0
+    task = store.list_tasks(OWNER)[0]
+    assert task.state.value == "success"
+    # The envelope rebuilt from the stored row matches it exactly
+    assert _changes(store, [task.to_response()["data"]]) == 0
+
+
+def test_archive_all_keeps_history(store):
+    store.add_task(OWNER, "t1", "https://sora.chatgpt.com/p/s_1")
+    store.add_task(OWNER, "t2", "https://sora.chatgpt.com/p/s_2")
+    store.add_task(owner_key("other-key"), "t3", "https://sora.chatgpt.com/p/s_3")
+    assert store.archive_all(OWNER) == 2
+    assert store.count(OWNER) == 0
+    assert store.count(OWNER, include_archived=True) == 2
+    assert store.count(owner_key("other-key")) == 1
+
+
+def test_unfinished_states_count_as_waiting(store):
+    for task_id, state in [("t1", "waiting"), ("t2", "queuing"), ("t3", "generating"), ("t4", "success"), ("t5", "fail")]:
+        store.add_task(OWNER, task_id, f"https://sora.chatgpt.com/p/s_{task_id}")
+        store.record_states([{"taskId": task_id, "state": state}])
+    stats = store.stats(OWNER)
+    assert (stats["total"], stats["waiting"], stats["success"], stats["failed"]) == (5, 3, 1, 1)
+    # The Waiting filter matches the same tasks, with and without the counters
+    assert store.count(OWNER, state="waiting") == 3
+    assert store.count(OWNER, state="waiting", task_ids=["t2", "t3", "t4"]) == 2
+    assert {task.task_id for task in store.list_tasks(OWNER, state="waiting")} == {"t1", "t2", "t3"}